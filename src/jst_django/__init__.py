@@ -5,12 +5,20 @@ __author__ = "A'zamov Samandar"
 __email__ = "JscorpTech@gmail.com"
 
 from jst_django.config import ConfigManager
-from jst_django.exceptions import (APIError, AppNotFoundError,
-                                   CodeGenerationError, ConfigurationError,
-                                   FileOperationError, JstDjangoException,
-                                   ModuleNotFoundError, StubNotFoundError,
-                                   TemplateError, ValidationError,
-                                   VersionError)
+from jst_django.exceptions import (
+    APIError,
+    AppNotFoundError,
+    CodeGenerationError,
+    ConfigurationError,
+    FileOperationError,
+    JstDjangoException,
+    ModuleNotFoundError,
+    OfflineError,
+    StubNotFoundError,
+    TemplateError,
+    ValidationError,
+    VersionError,
+)
 from jst_django.validators import Validator
 
 __all__ = [
@@ -24,6 +32,7 @@ __all__ = [
     "FileOperationError",
     "ConfigurationError",
     "APIError",
+    "OfflineError",
     "VersionError",
     "StubNotFoundError",
     "AppNotFoundError",
@@ -0,0 +1,47 @@
+"""Translation backends for the translate command."""
+
+from typing import Any, Dict, Mapping, Optional, Type
+
+from jst_django.backends.base import BaseBackend
+from jst_django.backends.http import HttpBackend
+from jst_django.backends.memory import MemoryBackend
+from jst_django.backends.tahrirchi import TahrirchiBackend
+from jst_django.constants import DEFAULT_TRANSLATE_BACKEND
+from jst_django.exceptions import ConfigurationError
+
+BACKENDS: Dict[str, Type[BaseBackend]] = {
+    TahrirchiBackend.name: TahrirchiBackend,
+    MemoryBackend.name: MemoryBackend,
+    HttpBackend.name: HttpBackend,
+}
+
+
+def get_backend(config: Optional[Mapping[str, Any]] = None, name: Optional[str] = None) -> BaseBackend:
+    """
+    Create translation backend.
+
+    Args:
+        config: ``translate`` section of jst.json
+        name: Backend name, overrides ``translate.backend``
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ConfigurationError: If backend is unknown or misconfigured
+    """
+    config = config or {}
+    name = name or config.get("backend", DEFAULT_TRANSLATE_BACKEND)
+    if name not in BACKENDS:
+        raise ConfigurationError(f"Unknown translation backend: {name}", details=f"Available: {', '.join(BACKENDS)}")
+    return BACKENDS[name](config.get("backends", {}).get(name))
+
+
+__all__ = [
+    "BACKENDS",
+    "BaseBackend",
+    "HttpBackend",
+    "MemoryBackend",
+    "TahrirchiBackend",
+    "get_backend",
+]
@@ -0,0 +1,104 @@
+"""Base class of translation backends."""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Mapping, Optional
+
+from jst_django.exceptions import APIError, ConfigurationError, OfflineError
+from jst_django.utils.logger import logger
+from jst_django.utils.network import require_network
+
+
+class BaseBackend(ABC):
+    """
+    Batched translation backend.
+
+    Backends translate a list of strings at once and declare how they want
+    to be called: at most ``max_batch_size`` strings and ``max_batch_chars``
+    characters per call, with up to ``concurrency`` calls in flight. Failed
+    calls are retried ``retries`` times with exponential ``backoff``.
+    Backends that are not ``local`` fail at once in offline mode.
+    Language codes of the ``translate`` command (e.g. ``uzn_Latn``) are
+    mapped to backend codes through ``langs``.
+    """
+
+    name: str = ""
+    max_batch_size: int = 1
+    max_batch_chars: int = 5000
+    concurrency: int = 1
+    retries: int = 2
+    backoff: float = 1.0
+    langs: Dict[str, str] = {}
+    local: bool = False
+
+    def __init__(self, options: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Initialize backend.
+
+        Args:
+            options: Backend options from ``translate.backends.<name>`` in jst.json
+        """
+        self.options = dict(options or {})
+        self.max_batch_size = int(self.options.get("max_batch_size", self.max_batch_size))
+        self.max_batch_chars = int(self.options.get("max_batch_chars", self.max_batch_chars))
+        self.concurrency = int(self.options.get("concurrency", self.concurrency))
+        self.retries = int(self.options.get("retries", self.retries))
+        self.backoff = float(self.options.get("backoff", self.backoff))
+        self.langs = {**self.langs, **self.options.get("langs", {})}
+        if self.max_batch_size < 1 or self.concurrency < 1 or self.retries < 0:
+            raise ConfigurationError(f"Invalid batch limits for translation backend: {self.name}")
+
+    def lang(self, code: str) -> str:
+        """Map command language code to backend language code"""
+        return self.langs.get(code, code)
+
+    def batches(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into batches within the declared limits"""
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        size = 0
+        for text in texts:
+            if batch and (len(batch) >= self.max_batch_size or size + len(text) > self.max_batch_chars):
+                batches.append(batch)
+                batch, size = [], 0
+            batch.append(text)
+            size += len(text)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def translate(self, texts: List[str], source: str, target: str) -> List[Optional[str]]:
+        """
+        Translate a batch of texts.
+
+        Args:
+            texts: Source texts, at most ``max_batch_size``
+            source: Source language code of the translate command
+            target: Target language code of the translate command
+
+        Returns:
+            Translation per text, ``None`` where the backend has no translation
+
+        Raises:
+            APIError: If the backend request still fails after ``retries`` retries
+            OfflineError: If offline and the backend needs the network
+        """
+        if len(texts) == 0:
+            return []
+        if not self.local:
+            require_network(f"{self.name} translation")
+        for attempt in range(self.retries + 1):
+            try:
+                return self._translate(texts, self.lang(source), self.lang(target))
+            except OfflineError:
+                raise
+            except APIError as e:
+                if attempt == self.retries:
+                    raise
+                delay = self.backoff * 2**attempt
+                logger.warning("%s request failed, retrying in %.1fs: %s", self.name, delay, e)
+                time.sleep(delay)
+
+    @abstractmethod
+    def _translate(self, texts: List[str], source: str, target: str) -> List[Optional[str]]:
+        """Translate texts with backend language codes"""
@@ -0,0 +1,57 @@
+"""Locally hosted HTTP translation service backend."""
+
+from typing import List, Optional
+
+import requests
+
+from jst_django.backends.base import BaseBackend
+from jst_django.exceptions import APIError, ConfigurationError
+from jst_django.utils.logger import logger
+
+
+class HttpBackend(BaseBackend):
+    """
+    Self hosted service speaking the LibreTranslate API.
+
+    ``POST <url>`` with ``{"q": [...], "source": "uz", "target": "en"}`` is
+    expected to answer ``{"translatedText": [...]}``.
+
+    Options:
+        url: Service endpoint, e.g. ``http://localhost:5000/translate``
+        api_key: Optional API key
+        timeout: Request timeout in seconds
+    """
+
+    name = "http"
+    max_batch_size = 32
+    max_batch_chars = 10000
+    concurrency = 4
+    langs = {
+        "uzn_Latn": "uz",
+        "uzn_Cyrl": "uz",
+        "rus_Cyrl": "ru",
+        "eng_Latn": "en",
+    }
+
+    def __init__(self, options=None) -> None:
+        super().__init__(options)
+        self.url = self.options.get("url")
+        if not self.url:
+            raise ConfigurationError("'translate.backends.http.url' is required for http backend")
+        self.timeout = float(self.options.get("timeout", 60))
+        self.session = requests.Session()
+
+    def _translate(self, texts: List[str], source: str, target: str) -> List[Optional[str]]:
+        payload = {"q": texts, "source": source, "target": target, "format": "text"}
+        if self.options.get("api_key"):
+            payload["api_key"] = self.options["api_key"]
+        try:
+            response = self.session.post(self.url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            translated = response.json()["translatedText"]
+        except Exception as e:
+            logger.error("Translation service request failed: %s", e)
+            raise APIError(f"Translation service request failed: {self.url}", details=str(e))
+        if not isinstance(translated, list) or len(translated) != len(texts):
+            raise APIError(f"Unexpected response from translation service: {self.url}")
+        return translated
@@ -0,0 +1,68 @@
+"""Offline glossary / translation memory backend."""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from jst_django.backends.base import BaseBackend
+from jst_django.exceptions import ConfigurationError
+from jst_django.utils.po import POEntry, iter_entries
+
+
+class MemoryBackend(BaseBackend):
+    """
+    Translations served from local files, no network involved.
+
+    Options:
+        glossary: JSON file ``{"<source>": {"<target>": {"text": "translation"}}}``
+        catalogs: ``{"<target>": ["path/to/django.po", ...]}``, translated
+            entries of these catalogs are used as translation memory
+
+    Texts missing from both are returned as ``None`` and left untranslated.
+    """
+
+    name = "memory"
+    max_batch_size = 1000
+    max_batch_chars = 1_000_000
+    concurrency = 1
+    local = True
+
+    def __init__(self, options=None) -> None:
+        super().__init__(options)
+        self._memory: Dict[str, Dict[str, str]] = {}
+        self._glossary: Optional[Dict[str, Dict[str, Dict[str, str]]]] = None
+
+    @property
+    def glossary(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        if self._glossary is None:
+            path = self.options.get("glossary")
+            self._glossary = {}
+            if path is not None:
+                try:
+                    with open(path, "r", encoding="utf-8") as file:
+                        self._glossary = json.load(file)
+                except (OSError, json.JSONDecodeError) as e:
+                    raise ConfigurationError(f"Failed to load glossary: {path}", details=str(e))
+        return self._glossary
+
+    def memory(self, target: str) -> Dict[str, str]:
+        """Translation memory of a target language built from configured catalogs"""
+        if target not in self._memory:
+            memory: Dict[str, str] = {}
+            for path in self.options.get("catalogs", {}).get(target, []):
+                if not Path(path).exists():
+                    raise ConfigurationError(f"Translation memory catalog not found: {path}")
+                # Read only, the catalogs are never rewritten
+                with open(path, "rb") as stream:
+                    for entry in iter_entries(stream):
+                        if not isinstance(entry, POEntry) or not entry.is_message:
+                            continue
+                        if entry.msgid_plural is None and entry.msgstr != "":
+                            memory.setdefault(entry.msgid, entry.msgstr)
+            self._memory[target] = memory
+        return self._memory[target]
+
+    def _translate(self, texts: List[str], source: str, target: str) -> List[Optional[str]]:
+        glossary = self.glossary.get(source, {}).get(target, {})
+        memory = self.memory(target)
+        return [glossary.get(text, memory.get(text)) for text in texts]
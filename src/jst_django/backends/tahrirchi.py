@@ -0,0 +1,174 @@
+"""tahrirchi.uz translation backend."""
+
+import base64
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from jst_django.backends.base import BaseBackend
+from jst_django.exceptions import APIError
+from jst_django.utils.cache import user_cache_dir
+from jst_django.utils.file import File
+from jst_django.utils.logger import logger
+
+# Lifetime assumed when the token carries no expiry
+DEFAULT_TOKEN_TTL = 3600
+# Tokens are refreshed this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 60
+
+
+class GuestToken:
+    """
+    Guest access token persisted in the user cache.
+
+    The token is reused across runs until shortly before it expires. Refresh
+    is single-flight: threads wait on a lock and processes on a file lock, the
+    first one fetches a new token and the others pick it up from the cache.
+    """
+
+    def __init__(self, auth_url: str, timeout: float = 60, margin: float = TOKEN_REFRESH_MARGIN) -> None:
+        self.auth_url = auth_url
+        self.timeout = timeout
+        self.margin = margin
+        self.path = user_cache_dir("tokens") / "tahrirchi.json"
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def _valid(self) -> bool:
+        return self._token is not None and time.time() < self._expires_at - self.margin
+
+    def get(self) -> str:
+        """
+        Current token, refreshed if it is about to expire.
+
+        Raises:
+            APIError: If a new token cannot be obtained
+        """
+        if self._valid():
+            return self._token
+        with self._lock:
+            if self._valid():
+                return self._token
+            with File.locked(self.path) as file:
+                self._token, self._expires_at = self._read(file.read())
+                if not self._valid():
+                    self._token, self._expires_at = self._fetch()
+                    file.seek(0)
+                    file.truncate()
+                    json.dump({"access_token": self._token, "expires_at": self._expires_at}, file)
+            return self._token
+
+    def invalidate(self, token: str) -> None:
+        """Drop token rejected by the service, unless another worker already replaced it"""
+        with self._lock:
+            if self._token != token:
+                return
+            self._token, self._expires_at = None, 0.0
+            with File.locked(self.path) as file:
+                if self._read(file.read())[0] == token:
+                    file.seek(0)
+                    file.truncate()
+
+    @staticmethod
+    def _read(content: str) -> Tuple[Optional[str], float]:
+        try:
+            data = json.loads(content)
+            return data["access_token"], float(data["expires_at"])
+        except (ValueError, KeyError, TypeError):
+            return None, 0.0
+
+    def _fetch(self) -> Tuple[str, float]:
+        try:
+            response = requests.post(self.auth_url, data={}, timeout=self.timeout)
+            data = response.json().get("data") or {}
+        except Exception as e:
+            raise APIError("Token olishda xatolik yuz berdi", details=str(e))
+        token = data.get("access_token")
+        if token is None:
+            raise APIError("Token olishda xatolik yuz berdi")
+        if data.get("expires_in"):
+            return token, time.time() + float(data["expires_in"])
+        return token, self._jwt_expiry(token) or time.time() + DEFAULT_TOKEN_TTL
+
+    @staticmethod
+    def _jwt_expiry(token: str) -> Optional[float]:
+        """``exp`` claim of a JWT, without verifying it"""
+        try:
+            payload = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            return float(claims["exp"])
+        except (IndexError, ValueError, KeyError, TypeError):
+            return None
+
+
+class TahrirchiBackend(BaseBackend):
+    """Public tahrirchi.uz service authorised with a guest token."""
+
+    name = "tahrirchi"
+    max_batch_size = 16
+    max_batch_chars = 5000
+    concurrency = 4
+    auth_url = "https://auth.tahrirchi.uz/v1/guest"
+    url = "https://websocket.tahrirchi.uz/handle-batch"
+    headers = {
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "uz,en-US;q=0.9,en;q=0.8,ru;q=0.7",
+        "Connection": "keep-alive",
+        "Content-Type": "application/json",
+        "Origin": "https://tahrirchi.uz",
+        "Referer": "https://tahrirchi.uz/",
+        "Sec-Fetch-Dest": "empty",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Site": "same-site",
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
+        "sec-ch-ua": '"Chromium";v="130", "Google Chrome";v="130", "Not?A_Brand";v="99"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"Linux"',
+        "content-type": "application/json",
+    }
+    timeout = 60
+
+    _tokens: Dict[str, "GuestToken"] = {}
+    _tokens_lock = threading.Lock()
+
+    @property
+    def token(self) -> "GuestToken":
+        """Guest token shared by every backend instance of the process"""
+        with self._tokens_lock:
+            if self.auth_url not in self._tokens:
+                self._tokens[self.auth_url] = GuestToken(self.auth_url, timeout=self.timeout)
+            return self._tokens[self.auth_url]
+
+    def _request(self, texts: List[str], source: str, target: str) -> List[str]:
+        payload = {"jobs": [{"text": text} for text in texts], "source_lang": source, "target_lang": target}
+        try:
+            for attempt in range(2):
+                token = self.token.get()
+                response = requests.post(
+                    self.url,
+                    json=payload,
+                    headers={**self.headers, "Authorization": "Bearer " + token},
+                    timeout=self.timeout,
+                )
+                if response.status_code != 401:
+                    break
+                # Token was revoked or expired early, refresh once and retry
+                self.token.invalidate(token)
+            response.raise_for_status()
+            return [sentence["translated"] for sentence in response.json()["sentences"]]
+        except APIError:
+            raise
+        except Exception as e:
+            logger.error("tahrirchi request failed: %s", e)
+            raise APIError("Tarjima qilishda xatolik yuz berdi", details=str(e))
+
+    def _translate(self, texts: List[str], source: str, target: str) -> List[Optional[str]]:
+        translated = self._request(texts, source, target)
+        if len(translated) == len(texts):
+            return translated
+        # Service split some job into several sentences, fall back to one job per request
+        return [" ".join(self._request([text], source, target)) for text in texts]
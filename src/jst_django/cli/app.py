@@ -1,3 +1,27 @@
+import logging
+from typing import Optional
+
 import typer
 
+from jst_django.constants import OFFLINE_ENV
+from jst_django.utils.logger import logger
+from jst_django.utils.network import set_offline
+
 app = typer.Typer()
+
+
+@app.callback()
+def main(
+    verbose: int = typer.Option(0, "--verbose", count=True, help="Batafsil loglar"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Faqat xatoliklarni ko'rsatish"),
+    log_file: Optional[str] = typer.Option(None, "--log-file", envvar="JST_LOG_FILE", help="JSON lines log fayli"),
+    offline: bool = typer.Option(False, "--offline", envvar=OFFLINE_ENV, help="Internetsiz, faqat keshdan ishlash"),
+):
+    if quiet:
+        logger.set_level(logging.ERROR)
+    elif verbose:
+        logger.set_level(logging.DEBUG)
+    if log_file:
+        logger.add_file_sink(log_file, level=logging.DEBUG if verbose else logging.INFO)
+    if offline:
+        set_offline()
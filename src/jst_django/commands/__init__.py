@@ -3,5 +3,10 @@ from .create import *  # noqa
 from .generate import *  # noqa
 from .init import *  # noqa
 from .install import *  # noqa
+from .messages import *  # noqa
+from .modules import *  # noqa
+from .prefetch import *  # noqa
 from .requirements import *  # noqa
+from .sync import *  # noqa
 from .translate import *  # noqa
+from .update import *  # noqa
@@ -1,11 +1,15 @@
 """Project creation command."""
 
 import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import questionary
 import typer
+import yaml
 from cookiecutter.main import cookiecutter
 from rich import print
 
@@ -17,32 +21,106 @@ from jst_django.constants import (
     DEFAULT_DJANGO_KEY,
     DEFAULT_LINE_LENGTH,
     DEFAULT_PORT,
+    DEFAULT_TEMPLATE_ENGINE,
     RUNNER_TYPES,
     SCRIPT_FILES,
     SETTINGS_MODULES,
     SUCCESS_PROJECT_CREATED,
+    TEMPLATE_ENGINES,
 )
 from jst_django.exceptions import APIError, ValidationError, VersionError
 from jst_django.utils import cancel, get_progress
 from jst_django.utils.api import Github
 from jst_django.utils.logger import logger
+from jst_django.utils.render import NativeRenderer
+from jst_django.utils.template import TemplateCache
 from jst_django.validators import Validator
 
+# Defaults of optional keys in an answers file
+ANSWER_DEFAULTS = {
+    "settings_module": SETTINGS_MODULES[0],
+    "packages": [],
+    "runner": RUNNER_TYPES[0],
+    "script": SCRIPT_FILES[0],
+    "key": DEFAULT_DJANGO_KEY,
+    "port": DEFAULT_PORT,
+    "phone": DEFAULT_ADMIN_PHONE,
+    "password": DEFAULT_ADMIN_PASSWORD,
+    "max_line_length": str(DEFAULT_LINE_LENGTH),
+}
+ANSWER_CHOICES = {
+    "settings_module": SETTINGS_MODULES,
+    "runner": RUNNER_TYPES,
+    "script": SCRIPT_FILES,
+}
+
+
+def render_project(
+    template: str,
+    context: Dict[str, Any],
+    cruft: Dict[str, Any],
+    engine: str = DEFAULT_TEMPLATE_ENGINE,
+    jobs: Optional[int] = None,
+) -> Tuple[str, float]:
+    """
+    Render project from a local template tree and write its cruft config.
+
+    Module level so it can run in worker processes.
+
+    Args:
+        template: Local template tree
+        context: Template context
+        cruft: ``.cruft.json`` content
+        engine: ``cookiecutter`` or ``native``
+        jobs: Worker processes of the native renderer
+
+    Returns:
+        Project directory and wall time in seconds
+    """
+    started = time.perf_counter()
+    if engine == "native":
+        project = NativeRenderer(template, jobs=jobs).render(context)
+    else:
+        project = cookiecutter(template, no_input=True, extra_context=context)
+    with open(Path(project) / ".cruft.json", "w", encoding="utf-8") as file:
+        json.dump(cruft, file, indent=2, ensure_ascii=False)
+    return project, time.perf_counter() - started
+
 
 class ProjectCreator:
     """Handle project creation operations."""
 
-    def __init__(self, version: Optional[str] = None):
+    def __init__(self, version: Optional[str] = None, engine: str = DEFAULT_TEMPLATE_ENGINE):
         """
         Initialize project creator.
 
         Args:
             version: Template version to use
+            engine: Template renderer, one of ``TEMPLATE_ENGINES``
         """
         self.version = version
+        self.engine = engine
         self.template_url = "https://github.com/JscorpTech/django"
         self.github = Github()
         self.validator = Validator()
+        self.templates = TemplateCache(self.template_url)
+        self._commit: Optional[str] = None
+
+    @property
+    def commit(self) -> str:
+        """Commit SHA of the template version, looked up once"""
+        if self._commit is None:
+            self._commit = self.github.get_commit_id(self.version)
+        return self._commit
+
+    def cruft_config(self, context: Dict[str, any]) -> Dict[str, any]:
+        return {
+            "template": self.template_url,
+            "commit": self.commit,
+            "checkout": None,
+            "context": {"cookiecutter": context},
+            "directory": None,
+        }
 
     def fetch_version(self) -> str:
         """
@@ -61,13 +139,13 @@ class ProjectCreator:
                 self.version = self.github.latest_release()
                 print(f"[green]Using latest version: {self.version}[/green]")
             else:
-                logger.info(f"Validating version: {self.version}")
+                logger.info("Validating version: %s", self.version)
                 self.github.releases(self.version)
 
             return self.version
 
         except (APIError, VersionError) as e:
-            logger.error(f"Version validation failed: {e}")
+            logger.error("Version validation failed: %s", e)
             raise
 
     def collect_user_input(self) -> Dict[str, any]:
@@ -149,15 +227,78 @@ class ProjectCreator:
                     cancel()
 
                 answers[key] = answer
-                logger.debug(f"Collected {key}: {answer if key != 'password' else '***'}")
+                logger.debug("Collected %s: %s", key, answer if key != "password" else "***")
 
             except ValidationError as e:
-                logger.error(f"Validation failed for {key}: {e}")
+                logger.error("Validation failed for %s: %s", key, e)
                 print(f"[red]Error: {e}[/red]")
                 raise
 
         return answers
 
+    def load_answers(self, path: str) -> List[Dict[str, any]]:
+        """
+        Load answer sets from YAML instead of prompting.
+
+        The file is a single answer set, a list of them, or
+        ``{"defaults": {...}, "projects": [...]}``. Keys are the prompt keys
+        of :meth:`collect_user_input`, only ``project_name`` is required.
+
+        Args:
+            path: Answers file
+
+        Returns:
+            Validated answer sets with defaults applied
+
+        Raises:
+            ValidationError: If the file or an answer set is invalid
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = yaml.safe_load(file)
+        except (OSError, yaml.YAMLError) as e:
+            raise ValidationError(f"Failed to read answers file: {path}", details=str(e))
+        defaults = {}
+        if isinstance(data, dict) and "projects" in data:
+            defaults, data = data.get("defaults") or {}, data["projects"]
+        answer_sets = data if isinstance(data, list) else [data]
+        if len(answer_sets) == 0 or not all(isinstance(answers, dict) for answers in answer_sets):
+            raise ValidationError(f"Answers file must contain answer mappings: {path}")
+        return [self.validate_answers({**defaults, **answers}) for answers in answer_sets]
+
+    def validate_answers(self, answers: Dict[str, any]) -> Dict[str, any]:
+        """
+        Validate one answer set with the prompt validators.
+
+        Raises:
+            ValidationError: If an answer is invalid
+        """
+        unknown = set(answers) - set(ANSWER_DEFAULTS) - {"project_name"}
+        if unknown:
+            raise ValidationError(f"Unknown answers: {', '.join(sorted(unknown))}")
+        answers = {**ANSWER_DEFAULTS, **answers}
+        name = answers.get("project_name")
+        try:
+            self.validator.validate_project_name(name)
+            self.validator.validate_port(str(answers["port"]))
+            self.validator.validate_phone_number(str(answers["phone"]))
+            self.validator.validate_password_strength(str(answers["password"]))
+        except ValidationError as e:
+            raise ValidationError(f"{name or 'project'}: {e.message}", details=e.details)
+        for key, choices in ANSWER_CHOICES.items():
+            if answers[key] not in choices:
+                raise ValidationError(
+                    f"{name}: invalid {key} '{answers[key]}'", details=f"Choices: {', '.join(choices)}"
+                )
+        unknown = set(answers["packages"]) - set(AVAILABLE_PACKAGES)
+        if unknown:
+            raise ValidationError(f"{name}: unknown packages: {', '.join(sorted(unknown))}")
+        return {
+            **answers,
+            "packages": list(answers["packages"]),
+            **{key: str(answers[key]) for key in ("port", "phone", "password", "max_line_length")},
+        }
+
     def prepare_context(self, answers: Dict[str, any]) -> Dict[str, any]:
         """
         Prepare cookiecutter context from user answers.
@@ -184,8 +325,8 @@ class ProjectCreator:
             **answers,
         }
 
-        logger.debug(f"Project slug: {project_slug}")
-        logger.debug(f"Selected packages: {packages}")
+        logger.debug("Project slug: %s", project_slug)
+        logger.debug("Selected packages: %s", packages)
 
         return context
 
@@ -202,35 +343,17 @@ class ProjectCreator:
         project_slug = context["project_slug"]
 
         try:
-            logger.info(f"Creating project: {project_slug}")
+            logger.info("Creating project: %s", project_slug)
 
             with get_progress() as progress:
-                task1 = progress.add_task("[magenta]Creating project structure")
-                task2 = progress.add_task("[magenta]Creating cruft config")
-
-                # Create project with cookiecutter
-                cookiecutter(
-                    self.template_url,
-                    checkout=self.version,
-                    no_input=True,
-                    extra_context=context,
-                )
-                progress.update(task1, description="[green]√ Project structure created")
+                task1 = progress.add_task("[magenta]Fetching template")
+                task2 = progress.add_task("[magenta]Creating project structure")
 
-                # Create cruft config
-                cruft_config = {
-                    "template": self.template_url,
-                    "commit": self.github.get_commit_id(self.version),
-                    "checkout": None,
-                    "context": {"cookiecutter": context},
-                    "directory": None,
-                }
+                template = str(self.templates.get(self.version))
+                progress.update(task1, description="[green]√ Template fetched")
 
-                cruft_config_path = Path(project_slug) / ".cruft.json"
-                with open(cruft_config_path, "w", encoding="utf-8") as file:
-                    json.dump(cruft_config, file, indent=2, ensure_ascii=False)
-
-                progress.update(task2, description="[green]√ Cruft config created")
+                render_project(template, context, self.cruft_config(context), self.engine)
+                progress.update(task2, description="[green]√ Project structure created")
 
             logger.info(SUCCESS_PROJECT_CREATED)
             print(f"\n[bold green]{SUCCESS_PROJECT_CREATED}[/bold green]")
@@ -241,15 +364,86 @@ class ProjectCreator:
             print(f"[red]Error creating project: {e}[/red]")
             raise
 
-    def run(self) -> None:
-        """Run the complete project creation flow."""
+    def create_projects(self, answer_sets: List[Dict[str, any]], jobs: Optional[int] = None) -> None:
+        """
+        Create several projects concurrently.
+
+        The template is fetched and its commit looked up once, every project
+        is rendered from the same local tree in a worker process.
+
+        Args:
+            answer_sets: Validated answer sets
+            jobs: Worker processes, defaults to CPU count
+
+        Raises:
+            ValidationError: If project names clash or directories exist
+            typer.Exit: If any project failed
+        """
+        contexts = [self.prepare_context(dict(answers)) for answers in answer_sets]
+        slugs = [context["project_slug"] for context in contexts]
+        duplicates = sorted({slug for slug in slugs if slugs.count(slug) > 1})
+        if duplicates:
+            raise ValidationError(f"Duplicate projects: {', '.join(duplicates)}")
+        existing = [slug for slug in slugs if Path(slug).exists()]
+        if existing:
+            raise ValidationError(f"Directories already exist: {', '.join(existing)}")
+
+        started = time.perf_counter()
+        with get_progress() as progress:
+            task = progress.add_task("[magenta]Fetching template")
+            template = str(self.templates.get(self.version))
+            configs = [self.cruft_config(context) for context in contexts]
+            progress.update(task, description="[green]√ Template fetched")
+
+        failed = []
+        workers = max(1, min(jobs or os.cpu_count() or 1, len(contexts)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                # Projects already run in parallel, each one renders in its own worker
+                executor.submit(render_project, template, context, config, self.engine, 1): context["project_slug"]
+                for context, config in zip(contexts, configs)
+            }
+            for future in as_completed(futures):
+                slug = futures[future]
+                try:
+                    _, elapsed = future.result()
+                    print(f"[green]√ {slug}[/green] {elapsed:.2f}s")
+                except Exception as e:
+                    logger.error("Project creation failed: %s: %s", slug, e)
+                    print(f"[red]x {slug}: {e}[/red]")
+                    failed.append(slug)
+
+        total = time.perf_counter() - started
+        print(f"\n[bold]{len(contexts) - len(failed)}/{len(contexts)} projects created in {total:.2f}s[/bold]")
+        if failed:
+            raise typer.Exit(code=1)
+
+    def run(self, answers: Optional[str] = None, jobs: Optional[int] = None) -> None:
+        """
+        Run the complete project creation flow.
+
+        Args:
+            answers: YAML answers file, prompts are skipped when given
+            jobs: Worker processes for multiple projects
+        """
         try:
+            if self.engine not in TEMPLATE_ENGINES:
+                raise ValidationError(
+                    f"Unknown template engine: {self.engine}", details=f"Choices: {', '.join(TEMPLATE_ENGINES)}"
+                )
+
+            # Validate answers before any network call
+            answer_sets = self.load_answers(answers) if answers else None
+
             # Fetch and validate version
             with get_progress() as progress:
                 task = progress.add_task("[cyan]Fetching version")
                 self.fetch_version()
                 progress.update(task, description="[green]√ Version fetched")
 
+            if answer_sets is not None:
+                return self.create_projects(answer_sets, jobs)
+
             # Collect user input
             answers = self.collect_user_input()
 
@@ -260,12 +454,15 @@ class ProjectCreator:
             self.create_project(context)
 
         except (APIError, VersionError, ValidationError) as e:
-            logger.error(f"Project creation failed: {e}")
+            logger.error("Project creation failed: %s", e)
             print(f"[red]Error: {e}[/red]")
             if e.details:
                 print(f"[yellow]{e.details}[/yellow]")
             raise typer.Exit(code=1)
 
+        except typer.Exit:
+            raise
+
         except Exception as e:
             logger.exception("Unexpected error during project creation")
             print(f"[red]Unexpected error: {e}[/red]")
@@ -273,12 +470,22 @@ class ProjectCreator:
 
 
 @app.command(name="create", help="Yangi loyiha yaratish")
-def create_project(version: Optional[str] = typer.Option(None, "--version", "-v", help="Template version")):
+def create_project(
+    version: Optional[str] = typer.Option(None, "--version", "-v", help="Template version"),
+    answers: Optional[str] = typer.Option(None, "--answers", "-a", help="YAML answers file, one or many projects"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", help="Parallel workers for multiple projects"),
+    engine: str = typer.Option(
+        DEFAULT_TEMPLATE_ENGINE, "--engine", "-e", help=f"Template renderer: {', '.join(TEMPLATE_ENGINES)}"
+    ),
+):
     """
     Create a new Django project.
 
     Args:
         version: Template version to use (default: latest)
+        answers: Answers file for non-interactive creation
+        jobs: Parallel workers
+        engine: Template renderer
     """
-    creator = ProjectCreator(version=version)
-    creator.run()
+    creator = ProjectCreator(version=version, engine=engine)
+    creator.run(answers, jobs)
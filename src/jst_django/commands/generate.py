@@ -1,18 +1,27 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 from os.path import join
 from pathlib import Path
-from typing import Annotated, Any, Dict, Generator, List, Literal, LiteralString, Optional
+from typing import Annotated, Any, Dict, Generator, List, Literal, Mapping, Optional, Tuple
 
-import jinja2
 import questionary
 import typer
+from rich import print
 
 from jst_django.cli.app import app
 from jst_django.commands.install import Module
+from jst_django.constants import DEFAULT_PAGINATION, ERROR_APP_NOT_FOUND, PROJECT_STATE_DIR, SYNC_GRAPH
+from jst_django.constants import MODULES as MODULE_TYPES
+from jst_django.exceptions import AppNotFoundError
 from jst_django.utils import Code, File, Jst, cancel
-from jst_django.utils.ast_utils import add_include_urlpattern, add_module, add_router_registration_with_import
-from jst_django.utils.code import format_code_string
-from jst_django.utils.tokenize import Tokenize
+from jst_django.utils.ast_utils import add_include_urlpatterns, add_modules, add_router_registration_with_import
+from jst_django.utils.code import format_code_string, is_formatted, sort_imports
+from jst_django.utils.exports import InitManager
+from jst_django.utils.introspect import ModelIntrospector
+from jst_django.utils.openapi import OpenAPIParser
+from jst_django.utils.stubs import StubRegistry
+from jst_django.utils.sync import FIELD_VARIABLES, SyncGraph, fields_hash, split_prelude, wrap_region
+from jst_django.utils.tokenize import PRIMARY_KEYS, IndexSpec, Tokenize
 
 MODULES = List[
     Literal[
@@ -30,14 +39,19 @@ MODULES = List[
     ]
 ]
 
+APPS = typer.Option(None, "--app", "-a", help="Target app, can be repeated")
+JOBS = typer.Option(None, "--jobs", "-j", help="Parallel workers for multiple apps")
+EXISTING = typer.Option(False, "--existing", "-e", help="Maydonlarni mavjud modeldan o'qish, --fields o'rniga")
 FIELDS = typer.Option(
-    default="name:str", confirmation_prompt=True, help="name:type names[char,int,text,date,time,datetime,image,bool]"
+    default="name:str",
+    confirmation_prompt=True,
+    help="name:type[:option], turlar: char(255), text, int, decimal(10,2), bool, date, datetime, image, fk(Model), "
+    "m2m(Model), o2o(Model); parametrlar: unique, index, null, blank, default=qiymat; @index(a,b), @unique(a,b), @cursor(-a)",
 )
 
 
 class Generate:
-    modules: List[str]
-    stubs: Dict[str, str]
+    modules: List[str] = MODULE_TYPES
 
     def __init__(self) -> None:
         self.name: str = ""
@@ -47,152 +61,228 @@ class Generate:
         self.app = None
         self.module = None
         self.fields: Tokenize
-
-        self.config = Jst().load_config()
-        dirs = self.config.get("dirs", {})
-        self.path = {
-            "apps": dirs.get("apps", "./core/apps/"),
-            "model": dirs.get("models", "models/"),
-            "serializer": dirs.get("serializers", "serializers/"),
-            "view": dirs.get("views", "views/"),
-            "permission": dirs.get("permissions", "permissions/"),
-            "admin": dirs.get("admin", "admin/"),
-            "test": dirs.get("tests", "tests/"),
-            "translation": dirs.get("translation", "translation/"),
-            "validator": dirs.get("validators", "validators/"),
-            "form": dirs.get("forms", "forms/"),
-            "filter": dirs.get("filters", "filters/"),
-            "signal": dirs.get("signals", "signals/"),
-            "stubs": join(os.path.dirname(__file__), "../stubs"),
-        }
-
-        self.modules = [
-            "model",
-            "serializer",
-            "view",
-            "permission",
-            "admin",
-            "test",
-            "translation",
-            "validator",
-            "form",
-            "filter",
-            "signal",
-        ]
-        self.stubs = {
-            "init": "__init__.stub",
-            "model": "model.stub",
-            "serializer": "serializer.stub",
-            "view": "view.stub",
-            "permission": "permission.stub",
-            "admin": "admin.stub",
-            "test": "test.stub",
-            "translation": "translation.stub",
-            "validator": "validator.stub",
-            "form": "form.stub",
-            "filter": "filter.stub",
-            "signal": "signal.stub",
-        } | self.config.get("stubs", {})
+        # Fields of every name when names do not share ``self.fields``
+        self.schema: Dict[str, Tokenize] = {}
+        # Read fields of the existing ``<Name>Model`` instead
+        self.existing = False
+        self.model_class: Optional[str] = None
+        # Model -> generated files, see ``SyncGraph``
+        self.graph: Dict[str, dict] = {}
+
+        jst = Jst()
+        self.paths = jst.paths()
+        self.pagination = {**DEFAULT_PAGINATION, **jst.config_manager.get("pagination", {})}
+        self.inits = InitManager(self.paths.init_style, star=self._render_init)
+
+    @property
+    def stubs(self) -> Mapping[str, str]:
+        return self.paths.stubs
 
     def _upper(self, text: str) -> str:
         return text[0].upper() + text[1:]
 
     def _get_apps(self) -> Generator[str, None, None]:
         """Return list of Django apps"""
-        dirs = directory_ls(self.path["apps"])
+        dirs = directory_ls(self.paths.apps)
         for item in dirs:
             if item.joinpath("apps.py").exists():
                 yield item.name
 
-    def __get_stub_path(self, name: str) -> Path:
-        """Get stub file path"""
-        if Path(self.stubs[name]).exists():
-            return Path(self.stubs[name])
-        path = Path(self.path["stubs"], self.stubs[name])
-        if path.exists():
-            return path
-        raise FileNotFoundError(f"Stub file does not exist {name}")
+    @property
+    def stub_registry(self) -> StubRegistry:
+        """Stubs of this run, resolved once per process"""
+        return StubRegistry.load(self.stubs)
 
-    def _read_stub(self, name: str, append: bool = False) -> tuple[str | Any, LiteralString | str | Any]:
+    def _read_stub(self, name: str, append: bool = False) -> Tuple[str, str]:
         """Get stub content"""
-        response = ""
-        top_content = ""
-        with open(self.__get_stub_path(name)) as file:
-            for chunk in file.readlines():
-                if chunk.startswith("!!"):
-                    top_content += chunk.replace("!!", "", 2)
-                    continue
-                elif append and chunk.startswith("##"):
-                    continue
-                elif not append and chunk.startswith("##"):
-                    chunk = chunk.replace("##", "", 2)
-                response += chunk
-        if append:
-            response = "\n" + response
-        return top_content, response
+        return self.stub_registry.parse(name, append)
 
     def _get_module_name(self, prefix: str = "") -> str:
         return f"{self.name.capitalize()}{prefix}"
 
     def _get_module_path(self, module: str) -> str:
-        path = self.path[module]
+        path = self.paths.modules[module]
         if self.sub_folder is not None:
             path = f"{path}{self.sub_folder}"
         return path
 
     def _get_import_path(self, path: str, sub: bool = False) -> str:
         import_sub_path = "." + self.sub_folder.replace("/", ".") if self.sub_folder is not None else ""
-        import_path = self.config.get("import_path", "core.apps.")
+        import_path = self.paths.import_path
         if sub is True:
             import_sub_path += f".{self.file_name}"
         return f"{import_path}{self.app}.{path}{import_sub_path}"
 
+    def _context(self, prefix: str = "") -> Dict[str, Any]:
+        """Stub context of the current name"""
+        return {
+            "class_name": self._get_module_name(prefix),
+            "name": self.name,
+            "name_cap": self.name.capitalize(),
+            "file_name": self.file_name,
+            "model_fields": self.fields.model,
+            "fields": self.fields.keys,
+            "field_specs": list(self.fields.specs.values()),
+            "indexes": self.fields.indexes(self.name) + self._cursor_indexes(),
+            "constraints": self.fields.constraints(self.name),
+            "model_import_path": self._get_import_path("models"),
+            "serializer_import_path": self._get_import_path("serializers", True),
+            "view_import_path": self._get_import_path("views"),
+            "cursor_ordering": self._cursor_ordering(),
+            "page_size": self.pagination["page_size"],
+            **self._queryset_context(),
+        }
+
+    def _cursor_ordering(self) -> List[str]:
+        """
+        Ordering of the cursor pagination, empty for page number pagination.
+
+        ``@cursor`` in the fields wins over ``pagination`` of jst.json. Ties
+        are broken by the primary key, a cursor needs a unique ordering.
+        """
+        ordering = self.fields.cursor
+        if ordering is None and self.pagination["style"] == "cursor":
+            ordering = self.pagination["ordering"]
+        if ordering is None:
+            return []
+        if ordering.lstrip("-") in PRIMARY_KEYS:
+            return [ordering]
+        return [ordering, "-id" if ordering.startswith("-") else "id"]
+
+    def _cursor_indexes(self) -> List[str]:
+        """Index matching the cursor ordering, the primary key is indexed already"""
+        ordering = self._cursor_ordering()
+        return [IndexSpec(tuple(ordering)).render(self.name)] if len(ordering) > 1 else []
+
+    def _queryset_context(self) -> Dict[str, Any]:
+        """
+        Query shape of the read actions, derived from the model fields.
+
+        Foreign keys and one-to-one fields are joined, many-to-many fields are
+        prefetched and only the columns the serializers list are loaded: list
+        leaves out large text, JSON and binary columns, retrieve loads them.
+        """
+        relations = self.fields.relations
+        list_fields = self.fields.list_keys
+        only_fields = {}
+        for action, fields in (("list", list_fields), ("retrieve", list(self.fields.keys))):
+            only = ["id"] + [name for name in fields if relations.get(name) != "m2m"]
+            # The cursor is built from the ordering columns of the last row
+            only += [
+                field.lstrip("-") for field in self._cursor_ordering() if field.lstrip("-") not in only + PRIMARY_KEYS
+            ]
+            only_fields[action] = only
+        return {
+            "select_related": [name for name, kind in relations.items() if kind != "m2m"],
+            "prefetch_related": [name for name, kind in relations.items() if kind == "m2m"],
+            "only_fields": only_fields,
+            "list_fields": list_fields,
+        }
+
+    def synced(self, stub: str) -> bool:
+        """Stub output depends on the model fields and is kept up to date by ``jst sync``"""
+        return stub != "model" and len(self.stub_registry.variables(stub) & FIELD_VARIABLES) > 0
+
+    def render_body(self, stub: str, prefix: str = "", append: bool = False) -> str:
+        """Rendered stub body, generated code of synced stubs between region markers"""
+        body = self.stub_registry.templates(stub, append=append)[1].render(**self._context(prefix))
+        if self.synced(stub):
+            body = wrap_region(stub, self.name, body)
+        return body
+
+    def render_file(self, stub: str, prefix: str = "") -> str:
+        """
+        Content of a new file, already in black/isort layout.
+
+        The stubs render black-stable code, only the import header made of
+        ``!!`` and leading ``##`` lines still needs sorting.
+        """
+        top_template = self.stub_registry.templates(stub)[0]
+        header, code = split_prelude(top_template.render(**self._context(prefix)) + self.render_body(stub, prefix))
+        code = code.strip("\n") + "\n"
+        if header.strip() == "":
+            return code
+        return sort_imports(header.strip("\n") + "\n").rstrip("\n") + "\n\n\n" + code
+
     def _write_file(
         self,
         file_path: str,
         stub: str,
         prefix: str = "",
         append: bool = False,
-    ):
-        import_path = {
-            "model_import_path": self._get_import_path("models"),
-            "serializer_import_path": self._get_import_path("serializers", True),
-        }
-        if not os.path.exists(file_path):
-            open(file_path, "w").close()
-        with open(file_path, "r+") as file:
-            file_content = file.read()
-            top_content, content = self._read_stub(stub, append=append)
-            file.seek(0)
-            file.write(
-                jinja2.Template(top_content + "\n").render(
-                    **{"name_cap": self.name.capitalize(), "file_name": self.file_name, **import_path}
-                )
-            )
-            file.write(file_content)
-            file.write(
-                jinja2.Template(content).render(
-                    **{
-                        "class_name": self._get_module_name(prefix),
-                        "name": self.name,
-                        "name_cap": self.name.capitalize(),
-                        "file_name": self.file_name,
-                        "model_fields": self.fields.model,
-                        "fields": self.fields.keys,
-                        **import_path,
-                    }
+    ) -> bool:
+        """
+        Write a new file or append the stub to an existing one.
+
+        Returns:
+            True if the file needs no formatting, see :meth:`formatted`
+        """
+        with File.locked(file_path) as file:
+            if append:
+                file_content = file.read()
+                top_template = self.stub_registry.templates(stub, append=True)[0]
+                content = (
+                    top_template.render(**self._context(prefix)) + file_content + self.render_body(stub, prefix, True)
                 )
-            )
+            else:
+                content = self.render_file(stub, prefix)
+            file.seek(0)
+            file.truncate()
+            file.write(content)
+        if self.synced(stub):
+            self._record(stub, file_path)
+        return not append and self.formatted(stub, content)
+
+    def formatted(self, stub: str, content: str) -> bool:
+        """
+        Rendered content black and isort would leave unchanged.
+
+        Only built-in stubs render formatted code, and only from fields parsed
+        by ``Tokenize``; field expressions read from OpenAPI or model source
+        are not normalized and always go through the formatter.
+        """
+        if not self.stub_registry.bundled(stub) or not is_formatted(content):
+            return False
+        return self.fields.normalized or len(self.stub_registry.variables(stub) & FIELD_VARIABLES) == 0
+
+    def _record(self, stub: str, file_path: str) -> None:
+        """Add generated file to the sync graph, written by ``_flush``"""
+        class_name = self.model_class or self._get_module_name("Model")
+        node = self.graph.setdefault(
+            f"{self.app}.{class_name}",
+            {
+                "app": self.app,
+                "name": self.name,
+                "file_name": self.file_name,
+                "sub_folder": self.sub_folder,
+                "module": f"{self.paths.import_path}{self.app}.models",
+                "class": class_name,
+                "cursor": self.fields.cursor,
+                "artifacts": {},
+            },
+        )
+        node["artifacts"][stub] = {
+            "path": Path(os.path.relpath(file_path)).as_posix(),
+            "hash": fields_hash(self.fields.items),
+        }
+
+    def _flush(self) -> None:
+        """Write ``__init__.py`` exports and the sync graph"""
+        self.inits.flush()
+        SyncGraph.merge(join(PROJECT_STATE_DIR, SYNC_GRAPH), self.graph)
+        self.graph = {}
+
+    def _render_init(self, file_name: str) -> str:
+        """Render single star import line of __init__.py"""
+        return self.stub_registry.templates("init")[1].render(file_name=file_name).strip()
 
     def _import_init(self, init_path: str, file_name: str):
-        """Import necessary files into __init__.py, create if not exists"""
-        with open(init_path, "a") as file:
-            file.write(jinja2.Template(self._read_stub("init")[1]).render(file_name=file_name))
-        Code.format_code(init_path)
+        """Register file as an export of __init__.py, written once by ``self.inits.flush``"""
+        self.inits.add(init_path, file_name)
 
     def _generate_files(self, app: str, modules: MODULES) -> bool:
         """Create necessary folders if not found"""
-        apps_dir = join(self.path["apps"], app)
+        apps_dir = join(self.paths.apps, app)
         for module in modules:
             module_dir = join(apps_dir, self._get_module_path(module))
             self.module = module
@@ -209,10 +299,12 @@ class Generate:
                 )
             if not os.path.exists(file_path):
                 self._import_init(init_path, self.file_name)
-                self._write_file(file_path, module, module.capitalize())
+                formatted = self._write_file(file_path, module, module.capitalize())
             else:
-                self._write_file(file_path, module, module.capitalize(), append=True)
-            Code.format_code(file_path)
+                formatted = self._write_file(file_path, module, module.capitalize(), append=True)
+            # New files rendered formatted skip black and isort, see ``formatted``
+            if not formatted:
+                Code.format_code(file_path)
         return True
 
     def make_module(self, module_path: str, modules: MODULES) -> None:
@@ -226,47 +318,130 @@ class Generate:
         model_name = parts[-1]
         path = "/".join(path_parts)
         Path(path).mkdir(parents=True, exist_ok=True)
-        generate = Generate()
-        generate.sub_folder = path if len(path_parts) > 1 else None
-        generate.file_name = name
-        generate.name = model_name
-        generate._generate_files(app_name, modules)
+        self.sub_folder = path if len(path_parts) > 1 else None
+        self.file_name = name
+        self.name = model_name
+        self._generate_files(app_name, modules)
+        self._flush()
+
+    def _register_url(self, app: str, name: str) -> None:
+        """Register generated view in app router"""
+        with File.locked(join(self.paths.apps, app, "urls.py")) as file:
+            result = add_router_registration_with_import(file.read(), self._upper(name) + "View", name)
+            code = format_code_string(result)
+            if code is not None:
+                file.seek(0)
+                file.truncate()
+                file.write(code)
 
-    def auto_generate(self, file_name: str) -> None:
-        """Run the generator"""
-        self.file_name = file_name
-        filename_parts = self.file_name.split("/")
-        if len(filename_parts) > 1:
-            self.file_name = filename_parts[-1]
+    def _existing_fields(self, introspector: ModelIntrospector, app: str) -> Tokenize:
+        """Fields of ``<Name>Model`` (or ``<Name>``) in the app models, read from source"""
+        module = f"{self.paths.import_path}{app}.models"
+        class_name = self._get_module_name("Model")
+        if introspector.find(module, class_name) is None:
+            class_name = self._get_module_name()
+        self.model_class = class_name
+        return introspector.tokens(module, class_name)
+
+    def generate_in_app(self, app: str, names: List[str], modules: MODULES) -> str:
+        """Generate all names inside one app
+
+        Every file touched here (module files, their ``__init__.py`` and the
+        app ``urls.py``) lives under the app directory, so one app is always
+        written by a single worker and names are processed in input order.
+        """
+        self.app = app
+        introspector = ModelIntrospector(Path.cwd(), join(PROJECT_STATE_DIR, "models.json")) if self.existing else None
+        for name in names:
+            self.name = name
+            self.fields = self.schema.get(name) or self.fields
+            if introspector is not None:
+                self.fields = self._existing_fields(introspector, app)
+            self._generate_files(app, modules)
+            self._register_url(app, name)
+        self._flush()
+        if introspector is not None:
+            introspector.save()
+        return app
+
+    def generate_in_apps(self, apps: List[str], names: List[str], modules: MODULES, jobs: Optional[int] = None) -> None:
+        """Generate names for several apps, independent apps run in a process pool"""
+        known = set(self._get_apps())
+        for app_name in apps:
+            if app_name not in known:
+                raise AppNotFoundError(ERROR_APP_NOT_FOUND.format(app_name))
+        apps = sorted(set(apps))
+        workers = min(jobs or os.cpu_count() or 1, len(apps))
+        if workers <= 1:
+            for app_name in apps:
+                self.generate_in_app(app_name, names, modules)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_generate_app, self, app_name, names, modules) for app_name in apps]
+            # Wait in submission order so errors and output do not depend on scheduling
+            for future in futures:
+                future.result()
+
+    def _set_file_name(self, file_name: str) -> None:
+        """Split ``sub/folder/file`` into the file name and its sub folder"""
+        filename_parts = file_name.split("/")
+        self.file_name = filename_parts[-1]
         self.sub_folder = "/".join(filename_parts[:-1]) if len(filename_parts) > 1 else None
+
+    def _select_apps(self) -> Optional[List[str]]:
+        return questionary.checkbox(
+            "Select Apps", choices=list(self._get_apps()), validate=lambda x: True if len(x) > 0 else False
+        ).ask()
+
+    def auto_generate(self, file_name: str, apps: Optional[List[str]] = None, jobs: Optional[int] = None) -> None:
+        """Run the generator"""
+        self._set_file_name(file_name)
         names = questionary.text("Name: ", multiline=True, validate=lambda x: True if len(x) > 0 else False).ask()
         if names is None:
             return cancel()
-        names = names.split("\n")
+        names = [name for name in names.split("\n") if len(name) != 0]
         if len(names) == 0:
             raise Exception("Name can not be empty")
-        app = questionary.select("Select App", choices=list(self._get_apps())).ask()
-        if app is None:
-            return cancel()
-        self.app = app
+        if not apps:
+            apps = self._select_apps()
+            if apps is None:
+                return cancel()
         if self.selected_modules is None:
             modules = questionary.checkbox("Select required modules", choices=self.modules).ask()
         else:
             modules = self.selected_modules
         if modules is None:
             return cancel()
-        for name in names:
-            if len(name) == 0:
-                continue
-            self.name = name
-            self._generate_files(app, modules)
-            with open(self.path.get("apps") + app + "/urls.py", "r+") as file:
-                result = add_router_registration_with_import(file.read(), self._upper(name) + "View", name)
-                file.seek(0)
-                file.truncate()
-                code = format_code_string(result)
-                if code is not None:
-                    file.write(code)
+        self.generate_in_apps(apps, names, modules, jobs)
+
+    def generate_schema(
+        self,
+        file_name: str,
+        schema: Dict[str, Tokenize],
+        apps: Optional[List[str]] = None,
+        jobs: Optional[int] = None,
+    ) -> None:
+        """
+        Generate every module of many names, each with its own fields, in one run.
+
+        Args:
+            file_name: File the names are written to, may contain sub folders
+            schema: Fields of every name
+            apps: Target apps, asked when empty
+            jobs: Parallel workers for multiple apps
+        """
+        self._set_file_name(file_name)
+        if not apps:
+            apps = self._select_apps()
+            if apps is None:
+                return cancel()
+        self.schema = schema
+        self.generate_in_apps(apps, list(schema), self.selected_modules or self.modules, jobs)
+
+
+def _generate_app(generate: Generate, app: str, names: List[str], modules: MODULES) -> str:
+    """Process pool entry point"""
+    return generate.generate_in_app(app, names, modules)
 
 
 def directory_ls(path: str) -> Generator[Path, None, None]:
@@ -284,45 +459,101 @@ def get_file_name(module: str, name: str, _extension: bool = True) -> str:
 
 
 @app.command(name="make:module", help="Compoment generatsiya qilish")
-def generate_module(module_name: Annotated[str, typer.Argument()], fields: str = FIELDS):
+def generate_module(
+    module_name: Annotated[str, typer.Argument()],
+    fields: str = FIELDS,
+    apps: Optional[List[str]] = APPS,
+    jobs: Optional[int] = JOBS,
+    existing: bool = EXISTING,
+):
     generate = Generate()
     tokenize = Tokenize(fields.strip())
     generate.selected_modules = None
+    generate.existing = existing
     generate.fields = tokenize.make()
-    generate.auto_generate(module_name)
+    generate.auto_generate(module_name, apps, jobs)
 
 
 @app.command(name="make:app", help="Modul o'rnatish")
-def generate_app(module_name: Annotated[str, typer.Argument()], version: str = typer.Option(None, "--version", "-v")):
+def generate_app(
+    module_name: Annotated[str, typer.Argument()],
+    version: str = typer.Option(None, "--version", "-v"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", help="Parallel downloads"),
+):
     if module_name is None:
         raise Exception("Module name is required")
 
-    result = Module().run(module_name, version)
-    if result:
+    installed = Module().run(module_name, version, jobs)
+    if installed:
+        # One edit per file for the module and all of its dependencies
         with open("config/conf/modules.py", "r+") as file:
-            code = format_code_string(add_module(file.read(), "core.apps.%s" % module_name))
+            code = format_code_string(add_modules(file.read(), ["core.apps.%s" % name for name in installed]))
             if code is not None:
                 file.seek(0)
                 file.truncate()
                 file.write(code)
         with open("config/urls.py", "r+") as file:
-            code = format_code_string(add_include_urlpattern(file.read(), "api/", "core.apps.%s.urls" % module_name))
+            patterns = [("api/", "core.apps.%s.urls" % name) for name in installed]
+            code = format_code_string(add_include_urlpatterns(file.read(), patterns))
             if code is not None:
                 file.seek(0)
                 file.truncate()
                 file.write(code)
 
 
+@app.command(name="update:app", help="O'rnatilgan modulni yangilash")
+def update_app(
+    app_name: Annotated[str, typer.Argument()],
+    version: str = typer.Option(None, "--version", "-v"),
+):
+    statuses = Module().upgrade(app_name, version)
+    if len(statuses) == 0:
+        print("[green]%s o'zgarmadi[/green]" % app_name)
+    for name, status in statuses.items():
+        color = "red" if status == "conflict" else "green"
+        print("%s: [%s]%s[/%s]" % (name, color, status, color))
+    conflicts = [name for name, status in statuses.items() if status == "conflict"]
+    if conflicts:
+        print("[yellow]%s ta fayl lokal o'zgartirilgan, ular yangilanmadi[/yellow]" % len(conflicts))
+
+
 @app.command(name="make:crud", help="CRUD generatsiya qilish")
-def generate_crud(module_name: Annotated[str, typer.Argument()], fields: str = FIELDS):
+def generate_crud(
+    module_name: Annotated[str, typer.Argument()],
+    fields: str = FIELDS,
+    apps: Optional[List[str]] = APPS,
+    jobs: Optional[int] = JOBS,
+    existing: bool = EXISTING,
+):
     generate = Generate()
     tokenize = Tokenize(fields.strip())
-    generate.selected_modules = generate.modules
+    # The model itself already exists
+    generate.selected_modules = [module for module in generate.modules if not existing or module != "model"]
+    generate.existing = existing
     generate.fields = tokenize.make()
-    generate.auto_generate(module_name)
+    generate.auto_generate(module_name, apps, jobs)
 
 
 @app.command(name="make:model", help="generate model")
-def make_model(model_path: str = typer.Argument(..., help="Model path")):
+def make_model(model_path: str = typer.Argument(..., help="Model path"), fields: str = FIELDS):
     generate = Generate()
+    generate.fields = Tokenize(fields.strip()).make()
     generate.make_module(model_path, ["model"])
+
+
+@app.command(name="make:from-openapi", help="OpenAPI sxemalaridan CRUD generatsiya qilish")
+def generate_from_openapi(
+    spec: Annotated[str, typer.Argument(help="OpenAPI, Swagger yoki JSON Schema fayli (json, yaml)")],
+    file_name: Optional[str] = typer.Option(None, "--file", "-f", help="Fayl nomi, standart: spec fayli nomi"),
+    schemas: Optional[List[str]] = typer.Option(None, "--schema", "-s", help="Faqat shu sxemalar"),
+    apps: Optional[List[str]] = APPS,
+    jobs: Optional[int] = JOBS,
+):
+    schema = {model.name: model.fields for model in OpenAPIParser(spec).models(schemas)}
+    if len(schema) == 0:
+        print("[yellow]Model sxemalari topilmadi[/yellow]")
+        raise typer.Exit(code=1)
+    generate = Generate()
+    generate.selected_modules = generate.modules
+    generate.generate_schema(file_name or Path(spec).stem.replace("-", "_"), schema, apps, jobs)
+    print("[green]%s ta model generatsiya qilindi: %s[/green]" % (len(schema), ", ".join(schema)))
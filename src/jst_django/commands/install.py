@@ -1,102 +1,226 @@
+import hashlib
+import json
 import os
-import shutil
-import tempfile
 import zipfile
-from uuid import uuid4
+from pathlib import Path
+from typing import Dict, List, Optional
 
 import questionary
-import requests
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+from rich import print
 
+from jst_django.constants import APP_MANIFEST
+from jst_django.exceptions import ConfigurationError, FileOperationError
 from jst_django.utils import Jst, cancel, get_progress
-from jst_django.utils.api import Github
+from jst_django.utils.registry import ModuleRegistry, ModuleRelease
+from jst_django.utils.resolver import ModuleResolver, read_manifest
 
 
-def subfolder_to_parent(path):
-    """ichki papkadagi ko'dlarni parent papkaga ko'chirish"""
-    extracted_file = os.path.join(path, os.listdir(path)[0])
-
-    for file in os.listdir(extracted_file):
-        shutil.move(os.path.join(extracted_file, file), path)
-    os.rmdir(extracted_file)
-
-
-def download(url, dir) -> str:
-    """modulni yuklash"""
-    file = os.path.join(dir, "%s.zip" % uuid4())
-    with requests.get(url, stream=True) as response:
-        response.raise_for_status()
-        with open(file, "wb") as zip_file:
-            for chunk in response.iter_content(chunk_size=8192):
-                zip_file.write(chunk)
-    return file
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
 
 class Module:
-    modules = {
-        "default": "https://github.com/JscorpTech/module-default.git",
-        "bot": "https://github.com/JscorpTech/module-bot.git",
-        "authbot": "https://github.com/JscorpTech/module-authbot.git",
-        "authv2": "https://github.com/JscorpTech/module-authv2.git",
-        "websocket": "https://github.com/JscorpTech/module-websocket.git",
-    }
 
     def __init__(self):
-        self.config = Jst().load_config()
+        jst = Jst()
+        self.config = jst.load_config()
+        self.paths = jst.paths()
+        self.registry = ModuleRegistry()
 
-    def _extract(self, module_name, zip_path):
-        modules_dir = os.path.join(os.getcwd(), self.config["dirs"]["apps"])
-        extract_dir = os.path.join(modules_dir, module_name)
-        if os.path.exists(extract_dir):
-            raise Exception("Modul mavjud")
-        os.makedirs(extract_dir, exist_ok=True)
+    def app_dir(self, app_name: str) -> Path:
+        return Path(os.getcwd(), self.paths.apps, app_name)
 
+    def _files(self, zip_path, app_name) -> Dict[str, bytes]:
+        """Files of a module archive as they are installed under ``app_name``"""
+        files = {}
         with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(extract_dir)
-        return extract_dir
-
-    def _download_and_extract_module(self, module_name, url):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Download the module
-            zip_path = download(url, temp_dir)
-            # Extract the module
-            extract_dir = self._extract(module_name, zip_path)
-            # Move the module to the correct location
-            subfolder_to_parent(extract_dir)
-
-            with open(os.path.join(extract_dir, "apps.py"), "r+") as file:
-                data = file.read()
+            for info in zip_ref.infolist():
+                # GitHub archives contain a single ``<repo>-<tag>/`` directory
+                name = info.filename.split("/", 1)[-1]
+                if info.is_dir() or "/" not in info.filename or len(name) == 0:
+                    continue
+                if os.path.isabs(name) or ".." in Path(name).parts:
+                    raise FileOperationError("Arxivda xavfli fayl yo'li: %s" % info.filename)
+                files[name] = zip_ref.read(info)
+        if "apps.py" in files:
+            module = "%s%s" % (self.config.get("apps", ""), app_name)
+            files["apps.py"] = files["apps.py"].replace(b"{{module_name}}", module.encode())
+        return files
+
+    def load_manifest(self, app_name: str) -> Dict:
+        """
+        Install manifest of an app: module, version and sha256 of every file.
+
+        Raises:
+            ConfigurationError: If the app was not installed with a manifest
+        """
+        try:
+            with open(self.app_dir(app_name) / APP_MANIFEST, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            raise ConfigurationError(
+                "%s da %s topilmadi" % (app_name, APP_MANIFEST),
+                details="App make:app bilan manifest yozilmasdan oldin o'rnatilgan",
+            )
+
+    def installed_modules(self) -> Dict[str, Optional[str]]:
+        """Modules installed in the project with the version of their manifest, None for apps without one"""
+        apps_dir = Path(os.getcwd(), self.paths.apps)
+        modules: Dict[str, Optional[str]] = {}
+        if not apps_dir.is_dir():
+            return modules
+        for app_dir in sorted(apps_dir.iterdir()):
+            if not (app_dir / "apps.py").exists():
+                continue
+            try:
+                manifest = json.loads((app_dir / APP_MANIFEST).read_text(encoding="utf-8"))
+                modules[manifest["module"]] = manifest["version"]
+            except (OSError, ValueError, KeyError, TypeError):
+                modules.setdefault(app_dir.name, None)
+        return modules
+
+    def _save_manifest(self, app_name: str, release: ModuleRelease, hashes: Dict[str, str]) -> None:
+        manifest = {"module": release.name, "version": release.version, "files": dict(sorted(hashes.items()))}
+        with open(self.app_dir(app_name) / APP_MANIFEST, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+
+    def _install(self, module_name, zip_path, release: ModuleRelease):
+        extract_dir = self.app_dir(module_name)
+        if os.path.exists(extract_dir):
+            raise Exception("Modul mavjud")
+        files = self._files(zip_path, module_name)
+        for name, data in files.items():
+            (extract_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            (extract_dir / name).write_bytes(data)
+        self._save_manifest(module_name, release, {name: sha256(data) for name, data in files.items()})
+
+    def upgrade(self, app_name: str, version: Optional[str] = None) -> Dict[str, str]:
+        """
+        Upgrade an installed app in place.
+
+        Files changed upstream and untouched locally are rewritten, files
+        edited locally are kept and reported as conflicts, everything else
+        is left alone.
+
+        Args:
+            app_name: Installed app
+            version: Target version, defaults to the latest
+
+        Returns:
+            Status per file: updated, added, removed or conflict
+        """
+        manifest = self.load_manifest(app_name)
+        release = self.registry.resolve(manifest["module"], version)
+        if release.version == manifest["version"]:
+            return {}
+        archive = self.registry.archive(release)
+        files = self._files(archive, app_name)
+        app_dir = self.app_dir(app_name)
+        hashes, statuses = dict(manifest["files"]), {}
+        for name in sorted(set(hashes) | set(files)):
+            old, new = hashes.get(name), sha256(files[name]) if name in files else None
+            if old == new:
+                continue
+            path = app_dir / name
+            current = sha256(path.read_bytes()) if path.is_file() else None
+            if current == new:
+                pass
+            elif current != old:
+                # Edited locally, the recorded hash keeps it a conflict next time too
+                statuses[name] = "conflict"
+                continue
+            elif new is None:
+                path.unlink()
+                statuses[name] = "removed"
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(files[name])
+                statuses[name] = "added" if old is None else "updated"
+            if new is None:
+                hashes.pop(name)
+            else:
+                hashes[name] = new
+        self._save_manifest(app_name, release, hashes)
+        added = self._add_requirements(read_manifest(archive).requirements)
+        if added:
+            print("[yellow]Kerakli kutubxonalar: %s[/yellow]" % " ".join(added))
+        return statuses
+
+    def _add_requirements(self, requirements: List[str]) -> List[str]:
+        """Append pip requirements missing from requirements.txt, return the added ones"""
+        if not os.path.exists("requirements.txt"):
+            return requirements
+        with open("requirements.txt", "r+") as file:
+            lines = file.read().splitlines()
+            present = set()
+            for line in lines:
+                try:
+                    present.add(canonicalize_name(Requirement(line.split("#")[0].strip()).name))
+                except InvalidRequirement:
+                    continue
+            added = []
+            for requirement in requirements:
+                name = canonicalize_name(Requirement(requirement).name)
+                if name not in present:
+                    present.add(name)
+                    added.append(requirement)
+            if added:
                 file.seek(0)
-                file.write(data.replace("{{module_name}}", "%s%s" % (self.config.get("apps", ""), module_name)))
                 file.truncate()
-
-    def run(self, module_name: str, version=None) -> bool:
-        module = questionary.select("Modulni tanlang", choices=self.modules.keys()).ask()
+                file.write("\n".join(lines + added) + "\n")
+        return added
+
+    def run(self, module_name: str, version=None, jobs=None) -> List[str]:
+        """
+        Install the selected module with every module it depends on.
+
+        Args:
+            module_name: App names for the selected module, comma separated
+            version: Pinned version of the selected module
+            jobs: Concurrent archive downloads
+
+        Returns:
+            Installed app names, dependencies first
+        """
+        module = questionary.select("Modulni tanlang", choices=self.registry.modules()).ask()
         if module is None:
             cancel()
-            return False
+            return []
+        installed = []
         with get_progress() as progress:
             task1 = progress.add_task("[cyan]Fetch module")
             task2 = progress.add_task("[magenta]Install module")
-            api = Github("module-%s" % module)
             if module_name is None:
                 module_name = module
-            modules = module_name.split(",")
-            if version is None:
-                version = api.latest_release()
-            else:
-                api.releases(version)
-            progress.update(task1, description="[green]√ Done Fetch module version: %s" % version)
-            module = "https://github.com/JscorpTech/module-{}/archive/refs/tags/{}.zip".format(module, version)
-
-            for module_name in modules:
-                module_name = module_name.strip()
-                if len(module_name) == 0:
-                    continue
-                progress.update(task2, description="[cyan]Installing module: %s" % module_name)
-                try:
-                    self._download_and_extract_module(module_name, module)
-                    progress.update(task2, description="[green]I√ Done Installed module: %s" % module_name)
-                except Exception as e:
-                    progress.update(task2, description="[red]Installing error: %s" % str(e))
-                    return False
-            return True
+            modules = [name.strip() for name in module_name.split(",") if len(name.strip()) != 0]
+            plan = ModuleResolver(self.registry, jobs).resolve({module: version}, self.installed_modules())
+            progress.update(
+                task1,
+                description="[green]√ Done Fetch modules: %s"
+                % ", ".join("%s==%s" % (item.release.name, item.release.version) for item in plan),
+            )
+
+            requirements = []
+            for item in plan:
+                requirements.extend(item.manifest.requirements)
+                if item.release.name != module:
+                    if self.app_dir(item.release.name).exists():
+                        continue
+                    names = [item.release.name]
+                else:
+                    names = modules
+                for name in names:
+                    progress.update(task2, description="[cyan]Installing module: %s" % name)
+                    try:
+                        self._install(name, item.archive, item.release)
+                        installed.append(name)
+                        progress.update(task2, description="[green]I√ Done Installed module: %s" % name)
+                    except Exception as e:
+                        progress.update(task2, description="[red]Installing error: %s" % str(e))
+                        return installed
+        added = self._add_requirements(requirements)
+        if added:
+            print("[yellow]Kerakli kutubxonalar: %s[/yellow]" % " ".join(added))
+        return installed
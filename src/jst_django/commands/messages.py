@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import typer
+from rich import print
+
+from jst_django.cli.app import app
+from jst_django.constants import PROJECT_STATE_DIR
+from jst_django.exceptions import ConfigurationError
+from jst_django.utils import Jst
+from jst_django.utils.messages import (
+    DEFAULT_IGNORE,
+    ExtractionCache,
+    compile_catalog,
+    extract,
+    find_catalogs,
+    merge_catalog,
+)
+
+JOBS = typer.Option(None, "--jobs", "-j", help="Parallel workers")
+
+
+class MakeMessages:
+    """Extract translatable strings into ``<locale>/<lang>/LC_MESSAGES/django.po``"""
+
+    def __init__(self) -> None:
+        self.paths = Jst().paths()
+        self.root = Path.cwd()
+
+    def catalogs(self, locales: Optional[List[str]] = None) -> Dict[str, Path]:
+        """Catalog path per language: existing locale dirs plus requested ones"""
+        locale = self.root / self.paths.locale
+        languages = set(locales or [])
+        if locale.is_dir():
+            languages.update(name for name in os.listdir(locale) if (locale / name / "LC_MESSAGES").is_dir())
+        return {language: locale / language / "LC_MESSAGES" / "django.po" for language in sorted(languages)}
+
+    def run(self, locales: Optional[List[str]] = None, ignore: Optional[List[str]] = None, jobs: Optional[int] = None):
+        catalogs = self.catalogs(locales)
+        if len(catalogs) == 0:
+            raise ConfigurationError(
+                "Tarjima tillari topilmadi: %s" % self.paths.locale,
+                details="Tilni --locale bilan kiriting, masalan -l uz",
+            )
+        cache = ExtractionCache(self.root / PROJECT_STATE_DIR / "makemessages.json")
+        files, extracted = extract(self.root, cache, DEFAULT_IGNORE + (ignore or []), jobs)
+        count = sum(len(messages) for messages in files.values())
+        print(f"[green]{len(files)}[/green] ta fayl, [green]{extracted}[/green] tasi qayta o'qildi, {count} ta matn")
+        for language, path in catalogs.items():
+            changed = merge_catalog(path, files, language)
+            status = "[green]yangilandi[/green]" if changed else "[bright_black]o'zgarmadi[/bright_black]"
+            print(f"{language}: {path.relative_to(self.root)} {status}")
+
+
+class CompileMessages:
+    """Compile every ``django.po`` of the project and its apps to ``.mo``"""
+
+    def __init__(self) -> None:
+        self.paths = Jst().paths()
+        self.root = Path.cwd()
+        self.cache_path = self.root / PROJECT_STATE_DIR / "compilemessages.json"
+
+    def _load_hashes(self) -> Dict[str, str]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_hashes(self, hashes: Dict[str, str]) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, "w", encoding="utf-8") as file:
+            json.dump(hashes, file, indent=2)
+
+    def run(self, jobs: Optional[int] = None, force: bool = False) -> None:
+        catalogs = find_catalogs(self.root, self.paths.locale, self.paths.apps)
+        if len(catalogs) == 0:
+            raise ConfigurationError("Tarjima fayllari topilmadi: %s" % self.paths.locale)
+        previous = self._load_hashes()
+        hashes = {}
+        stale = []
+        for path in catalogs:
+            name = path.relative_to(self.root).as_posix()
+            with open(path, "rb") as file:
+                hashes[name] = hashlib.sha256(file.read()).hexdigest()
+            if force or previous.get(name) != hashes[name] or not path.with_suffix(".mo").exists():
+                stale.append(path)
+            else:
+                print(f"[bright_black]{name} o'zgarmadi[/bright_black]")
+
+        workers = min(jobs or os.cpu_count() or 1, len(stale))
+        if workers <= 1:
+            compiled = [compile_catalog(path) for path in stale]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                compiled = list(executor.map(compile_catalog, stale))
+        for path in compiled:
+            print(f"[green]{path.relative_to(self.root).as_posix()}[/green] yaratildi")
+        self._save_hashes(hashes)
+
+
+@app.command(name="makemessages", help="Tarjima matnlarini django.po fayllariga yig'ish")
+def makemessages(
+    locale: Optional[List[str]] = typer.Option(None, "--locale", "-l", help="Til, qayta kiritish mumkin"),
+    ignore: Optional[List[str]] = typer.Option(None, "--ignore", "-i", help="O'tkazib yuboriladigan pattern"),
+    jobs: Optional[int] = JOBS,
+):
+    MakeMessages().run(locale, ignore, jobs)
+
+
+@app.command(name="compilemessages", help="django.po fayllarini .mo ga kompilyatsiya qilish")
+def compilemessages(
+    jobs: Optional[int] = JOBS,
+    force: bool = typer.Option(False, "--force", "-f", help="O'zgarmagan fayllarni ham kompilyatsiya qilish"),
+):
+    CompileMessages().run(jobs, force)
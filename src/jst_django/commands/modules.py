@@ -0,0 +1,23 @@
+import typer
+from rich import print
+from rich.table import Table
+
+from jst_django.cli.app import app
+from jst_django.utils.registry import ModuleRegistry
+
+
+@app.command(name="modules", help="O'rnatish mumkin bo'lgan modullar ro'yxati")
+def modules(refresh: bool = typer.Option(False, "--refresh", "-r", help="Indeksni qayta tekshirish")):
+    registry = ModuleRegistry()
+    index = registry.index(refresh)
+    table = Table("Modul", "Oxirgi versiya", "Versiyalar", "Repo")
+    for name in sorted(index["modules"]):
+        entry = index["modules"][name]
+        versions = list(entry["versions"])
+        table.add_row(
+            name,
+            entry.get("latest") or "-",
+            ", ".join(versions[:5]) + (f" (+{len(versions) - 5})" if len(versions) > 5 else ""),
+            entry.get("repo", ""),
+        )
+    print(table)
@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich import print
+
+from jst_django.cli.app import app
+from jst_django.exceptions import JstDjangoException
+from jst_django.utils.api import Github
+from jst_django.utils.network import is_offline
+from jst_django.utils.registry import ModuleRegistry
+from jst_django.utils.resolver import ModuleResolver
+from jst_django.utils.template import TemplateCache
+
+
+class Prefetch:
+    """Warm every cache ``--offline`` is served from"""
+
+    def __init__(self, jobs: Optional[int] = None) -> None:
+        self.jobs = jobs
+        self.failed = 0
+
+    def step(self, name: str, func, *args):
+        try:
+            result = func(*args)
+        except JstDjangoException as e:
+            self.failed += 1
+            print(f"[red]✗ {name}: {e}[/red]")
+            return None
+        print(f"[green]√[/green] {name}")
+        return result
+
+    def templates(self, versions: Optional[List[str]] = None) -> None:
+        """Release list, commits and template trees of ``create`` and ``update``"""
+        github = Github()
+        templates = TemplateCache()
+        self.step("shablon versiyalari", github.releases)
+        latest = self.step("oxirgi versiya", github.latest_release)
+        for version in versions or ([latest] if latest else []):
+            self.step(f"shablon {version} commit", github.get_commit_id, version)
+            self.step(f"shablon {version}", templates.get, version)
+        # Template commit of the current project, ``jst update`` renders it again
+        if Path(".cruft.json").exists():
+            with open(".cruft.json", "r", encoding="utf-8") as file:
+                cruft = json.load(file)
+            if cruft.get("template") and cruft.get("commit"):
+                self.step(
+                    f"loyiha shabloni {cruft['commit'][:7]}", TemplateCache(cruft["template"]).get, cruft["commit"]
+                )
+
+    def modules(self) -> None:
+        """Module index and the latest archive of every module with its dependencies"""
+        registry = ModuleRegistry()
+        if self.step("modullar indeksi", registry.index, True) is None:
+            return
+        resolver = ModuleResolver(registry, self.jobs)
+        for name in registry.modules():
+            plan = self.step(f"modul {name}", resolver.resolve, {name: None})
+            for item in plan or []:
+                print(f"  {item.release.name}=={item.release.version}")
+
+    def run(self, versions: Optional[List[str]] = None) -> None:
+        if is_offline():
+            print("[red]prefetch internetni talab qiladi, --offline ni olib tashlang[/red]")
+            raise typer.Exit(code=1)
+        self.templates(versions)
+        self.modules()
+        if self.failed:
+            print(f"[yellow]{self.failed} ta qadam bajarilmadi[/yellow]")
+            raise typer.Exit(code=1)
+        print("[green]Kesh tayyor, endi --offline bilan ishlash mumkin[/green]")
+
+
+@app.command(name="prefetch", help="Offline ishlash uchun keshni to'ldirish")
+def prefetch(
+    version: Optional[List[str]] = typer.Option(
+        None, "--version", "-v", help="Shablon versiyasi, qayta kiritish mumkin"
+    ),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", help="Parallel downloads"),
+):
+    Prefetch(jobs).run(version)
@@ -0,0 +1,128 @@
+from os.path import join
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import typer
+from rich import print
+
+from jst_django.cli.app import app
+from jst_django.commands.generate import Generate
+from jst_django.constants import PROJECT_STATE_DIR, SYNC_GRAPH
+from jst_django.exceptions import CodeGenerationError
+from jst_django.utils import Code
+from jst_django.utils.introspect import ModelIntrospector
+from jst_django.utils.sync import SyncGraph, fields_hash, replace_region
+from jst_django.utils.tokenize import Tokenize
+
+STATUS_STYLES = {
+    "updated": "[green]yangilandi[/green]",
+    "missing": "[yellow]fayl topilmadi, grafdan olib tashlandi[/yellow]",
+    "no-region": "[red]region belgilari topilmadi, qo'lda yangilang[/red]",
+    "stale": "[yellow]eskirgan[/yellow]",
+}
+
+
+class Sync:
+    """
+    Regenerate files made by ``make:*`` whose model fields changed.
+
+    Every model in ``.jst/sync.json`` is read from source (parsed modules
+    are cached by hash, so unchanged models cost a ``stat``); only artifacts
+    rendered with a different field hash are rendered again, and only the
+    code between their region markers is replaced.
+    """
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = Path(root or Path.cwd())
+        self.graph = SyncGraph(self.root / PROJECT_STATE_DIR / SYNC_GRAPH)
+        self.introspector = ModelIntrospector(self.root, self.root / PROJECT_STATE_DIR / "models.json")
+        self.generate: Optional[Generate] = None
+
+    def stale(self) -> List[Tuple[str, str, Tokenize]]:
+        """
+        Artifacts rendered with other fields than the model has now.
+
+        Returns:
+            Model key, stub name and current fields of every stale artifact
+        """
+        stale = []
+        for key, node in sorted(self.graph.models.items()):
+            try:
+                tokens = self.introspector.tokens(node["module"], node["class"])
+            except CodeGenerationError as e:
+                print(f"[yellow]{key}: {e}[/yellow]")
+                continue
+            digest = fields_hash(tokens.items)
+            for stub, artifact in sorted(node["artifacts"].items()):
+                if artifact["hash"] != digest:
+                    stale.append((key, stub, tokens))
+        self.introspector.save()
+        return stale
+
+    def render(self, node: dict, stub: str, tokens: Tokenize) -> str:
+        """Stub body of a model as ``make:*`` renders it when appending"""
+        if self.generate is None:
+            self.generate = Generate()
+        generate = self.generate
+        # Cursor pagination declared with ``@cursor`` is not part of the model source
+        tokens.cursor = node.get("cursor")
+        generate.app, generate.name, generate.fields = node["app"], node["name"], tokens
+        generate.file_name, generate.sub_folder = node["file_name"], node["sub_folder"]
+        return generate.render_body(stub, stub.capitalize(), append=True)
+
+    def run(self, check: bool = False) -> Dict[Tuple[str, str], str]:
+        """
+        Bring stale artifacts up to date.
+
+        Args:
+            check: Only report stale artifacts
+
+        Returns:
+            (model key, stub) -> status
+        """
+        statuses: Dict[Tuple[str, str], str] = {}
+        touched = set()
+        for key, stub, tokens in self.stale():
+            node = self.graph.models[key]
+            artifact = node["artifacts"][stub]
+            path = self.root / artifact["path"]
+            if check:
+                statuses[(key, stub)] = "stale"
+                continue
+            if not path.exists():
+                del node["artifacts"][stub]
+                statuses[(key, stub)] = "missing"
+                continue
+            content = replace_region(
+                path.read_text(encoding="utf-8"), stub, node["name"], self.render(node, stub, tokens)
+            )
+            if content is None:
+                statuses[(key, stub)] = "no-region"
+                continue
+            path.write_text(content, encoding="utf-8")
+            if not self.generate.formatted(stub, content):
+                touched.add(path)
+            artifact["hash"] = fields_hash(tokens.items)
+            statuses[(key, stub)] = "updated"
+        # Files that need the formatter are formatted once, whatever the number of regions in them
+        for path in sorted(touched):
+            Code.format_code(str(path))
+        if not check and statuses:
+            self.graph.save()
+        return statuses
+
+
+@app.command(name="sync", help="Model maydonlari o'zgargan generatsiya qilingan fayllarni yangilash")
+def sync(
+    check: bool = typer.Option(False, "--check", help="Faqat eskirgan fayllarni ko'rsatish"),
+):
+    syncer = Sync()
+    statuses = syncer.run(check)
+    if len(statuses) == 0:
+        print("[green]Barcha fayllar yangi[/green]")
+        return
+    for (key, stub), status in statuses.items():
+        path = syncer.graph.models[key]["artifacts"].get(stub, {}).get("path", join(key, stub))
+        print(f"{path}: {STATUS_STYLES[status]}")
+    if check or any(status == "no-region" for status in statuses.values()):
+        raise typer.Exit(code=1)
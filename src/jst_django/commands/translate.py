@@ -1,24 +1,33 @@
 import os
 import time
-from typing import Any, List, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import questionary
-import requests
-from polib import pofile
+import typer
 from rich.console import Console
-from tqdm import tqdm
 
+from jst_django.backends import BACKENDS, BaseBackend, MemoryBackend, get_backend
 from jst_django.cli.app import app
+from jst_django.constants import PROJECT_STATE_DIR
+from jst_django.exceptions import APIError
 from jst_django.utils import Jst, cancel
-from jst_django.utils.logger import logging
+from jst_django.utils.logger import logger, logging
+from jst_django.utils.network import is_offline
+from jst_django.utils.po import POCatalog, POEntry
+from jst_django.utils.progress import ProgressRenderer
+from jst_django.utils.telemetry import RunStats
 
 console = Console()
 
+# Translations of the run kept in memory for repeated messages
+MEMORY_SIZE = 10000
+# Catalog entries held in memory while a batch of translations is pending
+WINDOW_ENTRIES = 1000
 
-class Translate:
-    messages = None
-    _token = None
 
+class Translate:
     def __init__(self) -> None:
         self.langs: Union[List] = [
             "uzn_Latn",
@@ -26,65 +35,19 @@ class Translate:
             "rus_Cyrl",
             "eng_Latn",
         ]
-        self.config = Jst().load_config()
-
-    @property
-    def token(self) -> str:
-        if self._token is not None:
-            return self._token
-        auth = "https://auth.tahrirchi.uz/v1/guest"
-        response = requests.post(auth, data={})
-        token = response.json().get("data").get("access_token")
-        self._token = token
-        if token is None:
-            raise Exception("Token olishda xatolik yuz berdi")
-        return token
-
-    def translate(self, message, source, target) -> Union[Tuple]:
-        url = "https://websocket.tahrirchi.uz/handle-batch"
-
-        payload = {"jobs": [{"text": message}], "source_lang": source, "target_lang": target}
-        headers = {
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "uz,en-US;q=0.9,en;q=0.8,ru;q=0.7",
-            "Authorization": "Bearer " + self.token,
-            "Connection": "keep-alive",
-            "Content-Type": "application/json",
-            "Origin": "https://tahrirchi.uz",
-            "Referer": "https://tahrirchi.uz/",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-site",
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
-            "sec-ch-ua": '"Chromium";v="130", "Google Chrome";v="130", "Not?A_Brand";v="99"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Linux"',
-            "content-type": "application/json",
-        }
-        try:
-            response = requests.post(url, json=payload, headers=headers)
-            return True, response.json()["sentences"][0]["translated"]
-        except Exception as e:
-            logging.error(e)
-            return False, message
-
-    def get_messages(self, path: Union[str]) -> Any:
-        messages = pofile(path)
-        self.messages = messages
-        return messages
+        self.paths = Jst().paths()
+        self._memory: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
 
     def get_pofiles(self) -> Union[List]:
         res = []
-        for i in os.listdir(os.path.join(os.getcwd(), self.config["dirs"]["locale"])):
+        for i in os.listdir(os.path.join(os.getcwd(), self.paths.locale)):
             if not i.startswith("."):
                 res.append(i)
         return res
 
-    def run(self) -> None:
+    def run(self, report: Optional[str] = None, backend: Optional[str] = None) -> None:
         pofiles = self.get_pofiles()
-        file = questionary.select(
-            "Fayil joylashgan papkani tanlang: %s" % self.config["dirs"]["locale"], choices=pofiles
-        ).ask()
+        file = questionary.select("Fayil joylashgan papkani tanlang: %s" % self.paths.locale, choices=pofiles).ask()
         if file is None:
             return cancel()
 
@@ -96,44 +59,161 @@ class Translate:
         if target is None:
             return cancel()
 
-        self.get_messages(
-            os.path.join(os.getcwd(), "{}/{}/LC_MESSAGES/django.po".format(self.config["dirs"]["locale"], file))
-        )
+        path = os.path.join(os.getcwd(), "{}/{}/LC_MESSAGES/django.po".format(self.paths.locale, file))
+        stats = RunStats(POCatalog.count(path), command="translate", catalog=path, source=source, target=target)
+        logger.set_run_id(stats.run_id)
 
-        progress = tqdm(total=len(self.messages), dynamic_ncols=True, position=0)
-        logs = []  # Oxirgi 10 ta logni saqlash uchun ro'yxat
+        backend = self.get_backend(backend)
+        with ProgressRenderer(stats) as renderer:
+            self.translate_catalog(path, source, target, backend, stats, renderer)
 
-        for index, message in enumerate(self.messages):
-            if message.msgstr.strip() != "":
-                time.sleep(0.01)
-                progress.update(1)
-                logs.append(
-                    f"\033[90m{message.msgid[:50]}\033[0m → \033[90m{message.msgstr[:50]}\033[0m"
-                )  # Cyan va Green
+        report = stats.write_report(
+            report or os.path.join(PROJECT_STATE_DIR, "reports", f"translate-{stats.run_id}.json")
+        )
+        logging.info("Tarjima qilish yakunlandi!!! Hisobot: %s", report)
+
+    def translate_catalog(
+        self,
+        path: str,
+        source: str,
+        target: str,
+        backend: BaseBackend,
+        stats: RunStats,
+        renderer: ProgressRenderer,
+    ) -> None:
+        """
+        Translate a catalog in place, holding a bounded window of entries.
+
+        Every entry the catalog hands out, obsolete ones and the header
+        included, counts toward ``WINDOW_ENTRIES``; the window is translated
+        and written once it is full, so memory does not grow with the catalog.
+        """
+        # Untranslated entries sent per round: enough to keep every backend slot busy
+        window = backend.max_batch_size * backend.concurrency
+        with POCatalog(path) as catalog, ThreadPoolExecutor(max_workers=backend.concurrency) as executor:
+            pending: List[POEntry] = []
+            held = 0
+            for message in catalog:
+                held += 1
+                if message.is_message and message.untranslated:
+                    pending.append(message)
+                elif message.is_message:
+                    stats.add(done=1, skipped=1)
+                    renderer.log(message.msgid, message.msgstr, changed=False)
+                if len(pending) >= window or held >= WINDOW_ENTRIES:
+                    self.translate_window(pending, source, target, backend, executor, stats, renderer)
+                    pending = []
+                if not pending:
+                    # Tarjima qilingan yozuvlar darhol vaqtinchalik faylga yoziladi
+                    catalog.commit()
+                    held = 0
+            self.translate_window(pending, source, target, backend, executor, stats, renderer)
+
+    def get_backend(self, name: Optional[str] = None) -> BaseBackend:
+        """
+        Translation backend selected by ``--backend`` or ``translate.backend`` in jst.json.
+
+        Offline, network backends are replaced by the memory backend, so
+        the run is served from the glossary and translation memory only.
+        """
+        config = Jst().load_config().get("translate")
+        backend = get_backend(config, name)
+        if is_offline() and not backend.local:
+            logging.warning("Offline rejim: %s o'rniga %s backend ishlatiladi", backend.name, MemoryBackend.name)
+            backend = get_backend(config, MemoryBackend.name)
+        return backend
+
+    def translate_window(
+        self,
+        messages: List[POEntry],
+        source: str,
+        target: str,
+        backend: BaseBackend,
+        executor: ThreadPoolExecutor,
+        stats: RunStats,
+        renderer: ProgressRenderer,
+    ) -> None:
+        """
+        Translate untranslated entries in batches.
+
+        Repeated messages are sent once, messages translated earlier in the run
+        are served from memory, the rest is split into backend batches that
+        run concurrently.
+        """
+        if len(messages) == 0:
+            return
+        results: Dict[str, Optional[str]] = {}
+        misses: List[str] = []
+        for text in dict.fromkeys(message.msgid for message in messages):
+            key = (text, source, target)
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                results[text] = self._memory[key]
             else:
-                progress.update(1)
-                message.msgstr = self.translate(message.msgid, source, target)[1]
-                logs.append(
-                    f"\033[36m{message.msgid[:50]}\033[0m → \033[32m{message.msgstr[:50]}\033[0m"
-                )  # Cyan va Green
-
-            # Loglarni yangilash
-            if len(logs) > 5:
-                logs.pop(0)
-
-            # Terminalni tozalamasdan faqat oxirgi 10 ta logni o‘zgartiramiz
-            tqdm.write("\n".join(logs))
-            tqdm.write("\033[%sA" % len(logs), end="")
-
-            if index % 10 == 0:
-                self.messages.save()
-
-        self.messages.save()
-        progress.close()
+                misses.append(text)
+        stats.add(cache_hits=len(messages) - len(misses), cache_misses=len(misses))
+
+        batches = backend.batches(misses)
+        futures = [executor.submit(self._request, backend, batch, source, target, stats) for batch in batches]
+        failed: Set[str] = set()
+        for batch, future in zip(batches, futures):
+            try:
+                translated = future.result()
+            except APIError as e:
+                logging.error("%s", e)
+                failed.update(batch)
+                continue
+            for text, result in zip(batch, translated):
+                results[text] = result
+                if result is not None:
+                    self._remember((text, source, target), result)
+
+        self._apply(messages, results, failed, stats, renderer)
+
+    @staticmethod
+    def _apply(
+        messages: List[POEntry],
+        results: Dict[str, Optional[str]],
+        failed: Set[str],
+        stats: RunStats,
+        renderer: ProgressRenderer,
+    ) -> None:
+        for message in messages:
+            if message.msgid in failed:
+                # Entry stays untranslated, the next run picks it up again
+                stats.add(done=1, failed=1)
+                renderer.log(message.msgid, "", changed=False)
+            elif results.get(message.msgid) is None:
+                # Backend has no translation, entry is left for the next run
+                stats.add(done=1, skipped=1)
+                renderer.log(message.msgid, "", changed=False)
+            else:
+                message.msgstr = results[message.msgid]
+                stats.add(done=1, translated=1)
+                renderer.log(message.msgid, message.msgstr)
+
+    @staticmethod
+    def _request(
+        backend: BaseBackend, texts: List[str], source: str, target: str, stats: RunStats
+    ) -> List[Optional[str]]:
+        started = time.perf_counter()
+        with stats.request():
+            translated = backend.translate(texts, source, target)
+        duration = time.perf_counter() - started
+        logging.debug(
+            "%s: %d texts translated in %.3fs", backend.name, len(texts), duration, extra={"duration": duration}
+        )
+        return translated
 
-        logging.info("Tarjima qilish yakunlandi!!!")
+    def _remember(self, key: Tuple[str, str, str], result: str) -> None:
+        self._memory[key] = result
+        if len(self._memory) > MEMORY_SIZE:
+            self._memory.popitem(last=False)
 
 
 @app.command(name="translate", help="Avtomatik tarjima")
-def translate():
-    Translate().run()
+def translate(
+    report: Optional[str] = typer.Option(None, "--report", help="JSON hisobot fayli"),
+    backend: Optional[str] = typer.Option(None, "--backend", "-b", help=f"Tarjima backendi: {', '.join(BACKENDS)}"),
+):
+    Translate().run(report, backend)
@@ -0,0 +1,205 @@
+import filecmp
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+import typer
+from rich import print
+
+from jst_django.cli.app import app
+from jst_django.exceptions import APIError, ConfigurationError, FileOperationError, TemplateError, VersionError
+from jst_django.utils.api import Github
+from jst_django.utils.file import File
+from jst_django.utils.logger import logger
+from jst_django.utils.merge import merge3
+from jst_django.utils.render import NativeRenderer
+from jst_django.utils.template import TemplateCache
+
+STATUS_STYLES = {
+    "updated": "[green]yangilandi[/green]",
+    "added": "[green]qo'shildi[/green]",
+    "removed": "[yellow]o'chirildi[/yellow]",
+    "conflict": "[red]konflikt[/red]",
+    "skipped": "[bright_black]loyihada o'chirilgan, o'tkazib yuborildi[/bright_black]",
+    "unchanged": "[bright_black]o'zgarmadi[/bright_black]",
+}
+
+
+def changed_files(old: Dict[str, str], new: Dict[str, str]) -> Set[str]:
+    """Paths added, removed or modified between two listings"""
+    return {
+        name
+        for name in old.keys() | new.keys()
+        if name not in old or name not in new or not filecmp.cmp(old[name], new[name], shallow=False)
+    }
+
+
+class ProjectUpdater:
+    """
+    Move a project created by ``jst create`` to another template release.
+
+    Only files that differ between the recorded template commit and the
+    target release are rendered, both times with the context stored in
+    ``.cruft.json``. Each one is merged three-way into the project, every
+    other file of the tree is left alone.
+    """
+
+    def __init__(self, version: Optional[str] = None, root: Optional[Path] = None, jobs: Optional[int] = None):
+        """
+        Initialize project updater.
+
+        Args:
+            version: Target template release, defaults to the latest one
+            root: Project directory containing ``.cruft.json``
+            jobs: Worker processes for rendering
+        """
+        self.version = version
+        self.root = Path(root or Path.cwd())
+        self.jobs = jobs
+        self.cruft_path = self.root / ".cruft.json"
+        self.github = Github()
+
+    def load_cruft(self) -> Dict[str, Any]:
+        """
+        Read ``.cruft.json`` of the project.
+
+        Raises:
+            ConfigurationError: If the file is missing or has no template commit
+        """
+        try:
+            with open(self.cruft_path, "r", encoding="utf-8") as file:
+                cruft = json.load(file)
+        except FileNotFoundError:
+            raise ConfigurationError(".cruft.json topilmadi", details="Loyiha jst create bilan yaratilmagan")
+        except ValueError as e:
+            raise ConfigurationError(".cruft.json o'qib bo'lmadi", details=str(e))
+        if not isinstance(cruft, dict) or not cruft.get("commit") or not cruft.get("template"):
+            raise ConfigurationError(".cruft.json da template yoki commit yo'q")
+        return cruft
+
+    def resolve(self) -> str:
+        """
+        Target release and its commit.
+
+        Returns:
+            Commit SHA of the release
+
+        Raises:
+            APIError: If GitHub cannot be reached
+            VersionError: If the release does not exist
+        """
+        if self.version is None:
+            self.version = self.github.latest_release()
+        else:
+            self.github.releases(self.version)
+        return self.github.get_commit_id(self.version)
+
+    def update(self, cruft: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Merge template changes between the recorded commit and the target release.
+
+        Args:
+            cruft: Content of ``.cruft.json``
+
+        Returns:
+            Status per changed project file
+        """
+        templates = TemplateCache(cruft["template"])
+        directory = cruft.get("directory") or ""
+        old = NativeRenderer(templates.get(cruft["commit"]) / directory, self.jobs)
+        new = NativeRenderer(templates.get(self.version) / directory, self.jobs)
+        context = {key: value for key, value in cruft["context"]["cookiecutter"].items() if key[0] != "_"}
+
+        old_files, new_files = old.template_files(), new.template_files()
+        changed = changed_files(old_files, new_files)
+        if changed_files(
+            File.listing(Path(old.repo_dir) / "templates"), File.listing(Path(new.repo_dir) / "templates")
+        ):
+            # Shared includes changed, any file may render differently
+            changed = set(old_files) | set(new_files)
+        logger.debug("Template files changed: %d", len(changed))
+
+        labels = ("loyiha", "shablon %s" % cruft["commit"][:7], "shablon %s" % self.version)
+        with tempfile.TemporaryDirectory() as temp:
+            base = old.render_files(context, changed & old_files.keys(), os.path.join(temp, "base"))
+            theirs = new.render_files(context, changed & new_files.keys(), os.path.join(temp, "theirs"))
+            base = {target: os.path.join(temp, "base", target) for target in base.values()}
+            theirs = {target: os.path.join(temp, "theirs", target) for target in theirs.values()}
+            return {
+                target: self.apply(target, base.get(target), theirs.get(target), labels)
+                for target in sorted(base.keys() | theirs.keys())
+            }
+
+    def apply(self, target: str, base: Optional[str], theirs: Optional[str], labels: Tuple[str, str, str]) -> str:
+        """
+        Bring one template change into the project file.
+
+        Args:
+            target: Path relative to the project
+            base: File rendered by the old template, None if it was added
+            theirs: File rendered by the new template, None if it was removed
+            labels: Conflict marker labels
+
+        Returns:
+            Status, a key of ``STATUS_STYLES``
+        """
+        path = self.root / target
+        ours = path.read_bytes() if path.is_file() else None
+        base_data = Path(base).read_bytes() if base else None
+        if theirs is None:
+            if ours is None:
+                return "unchanged"
+            if ours != base_data:
+                return "conflict"
+            path.unlink()
+            return "removed"
+        if ours is None:
+            if base is not None:
+                return "skipped"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            File.copy(theirs, path)
+            return "added"
+        theirs_data = Path(theirs).read_bytes()
+        if ours == theirs_data:
+            return "unchanged"
+        if ours != base_data and b"\0" in ours + theirs_data:
+            # Binary files cannot hold conflict markers, the project copy is kept
+            return "conflict"
+        merged, conflicted = merge3(ours, base_data or b"", theirs_data, labels)
+        path.write_bytes(merged)
+        return "conflict" if conflicted else "updated"
+
+    def run(self) -> None:
+        cruft = self.load_cruft()
+        commit = self.resolve()
+        if commit == cruft["commit"]:
+            print(f"[green]Loyiha allaqachon {self.version} versiyada[/green]")
+            return
+        statuses = self.update(cruft)
+        for target, status in statuses.items():
+            if status != "unchanged":
+                print(f"{target}: {STATUS_STYLES[status]}")
+        cruft["commit"] = commit
+        with open(self.cruft_path, "w", encoding="utf-8") as file:
+            json.dump(cruft, file, indent=2, ensure_ascii=False)
+        conflicts = [target for target, status in statuses.items() if status == "conflict"]
+        print(f"[green]Loyiha {self.version} versiyaga yangilandi[/green], {len(statuses)} ta fayl tekshirildi")
+        if conflicts:
+            print(f"[yellow]{len(conflicts)} ta faylda konflikt bor, qo'lda hal qiling[/yellow]")
+
+
+@app.command(name="update", help="Loyihani shablonning yangi versiyasiga yangilash")
+def update(
+    version: Optional[str] = typer.Option(None, "--version", "-v", help="Shablon versiyasi"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", help="Parallel workers"),
+):
+    try:
+        ProjectUpdater(version, jobs=jobs).run()
+    except (APIError, ConfigurationError, FileOperationError, TemplateError, VersionError) as e:
+        logger.error("Project update failed: %s", e)
+        print(f"[red]Error: {e}[/red]")
+        if e.details:
+            print(f"[yellow]{e.details}[/yellow]")
+        raise typer.Exit(code=1)
@@ -1,20 +1,110 @@
 """Configuration management for jst-django."""
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-from jst_django.constants import (DEFAULT_ADMIN_PATH, DEFAULT_APPS_PATH,
-                                  DEFAULT_FILTERS_PATH, DEFAULT_FORMS_PATH,
-                                  DEFAULT_IMPORT_PATH, DEFAULT_MODELS_PATH,
-                                  DEFAULT_PERMISSIONS_PATH,
-                                  DEFAULT_SERIALIZERS_PATH,
-                                  DEFAULT_SIGNALS_PATH, DEFAULT_TESTS_PATH,
-                                  DEFAULT_TRANSLATION_PATH,
-                                  DEFAULT_VALIDATORS_PATH, DEFAULT_VIEWS_PATH,
-                                  STUB_FILES)
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Mapping, Optional
+
+from jst_django.constants import (
+    DEFAULT_ADMIN_PATH,
+    DEFAULT_APPS_PATH,
+    DEFAULT_FILTERS_PATH,
+    DEFAULT_FORMS_PATH,
+    DEFAULT_IMPORT_PATH,
+    DEFAULT_INIT_STYLE,
+    DEFAULT_LOCALE_PATH,
+    DEFAULT_MODELS_PATH,
+    DEFAULT_PAGINATION,
+    DEFAULT_PERMISSIONS_PATH,
+    DEFAULT_SERIALIZERS_PATH,
+    DEFAULT_SIGNALS_PATH,
+    DEFAULT_TESTS_PATH,
+    DEFAULT_TRANSLATE_BACKEND,
+    DEFAULT_TRANSLATION_PATH,
+    DEFAULT_VALIDATORS_PATH,
+    DEFAULT_VIEWS_PATH,
+    INIT_STYLES,
+    PAGINATION_STYLES,
+    STUB_FILES,
+)
 from jst_django.exceptions import ConfigurationError
 
+# Module type -> (key in "dirs", default path)
+MODULE_DIRS = {
+    "model": ("models", DEFAULT_MODELS_PATH),
+    "serializer": ("serializers", DEFAULT_SERIALIZERS_PATH),
+    "view": ("views", DEFAULT_VIEWS_PATH),
+    "permission": ("permissions", DEFAULT_PERMISSIONS_PATH),
+    "admin": ("admin", DEFAULT_ADMIN_PATH),
+    "test": ("tests", DEFAULT_TESTS_PATH),
+    "translation": ("translation", DEFAULT_TRANSLATION_PATH),
+    "validator": ("validators", DEFAULT_VALIDATORS_PATH),
+    "form": ("forms", DEFAULT_FORMS_PATH),
+    "filter": ("filters", DEFAULT_FILTERS_PATH),
+    "signal": ("signals", DEFAULT_SIGNALS_PATH),
+}
+
+
+@dataclass(frozen=True)
+class PathTable:
+    """Immutable table of paths resolved from configuration."""
+
+    apps: str
+    locale: str
+    import_path: str
+    init_style: str
+    modules: Mapping[str, str]
+    stubs: Mapping[str, str]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "modules", MappingProxyType(dict(self.modules)))
+        object.__setattr__(self, "stubs", MappingProxyType(dict(self.stubs)))
+
+    def __reduce__(self):
+        # mappingproxy is not picklable, process pools receive plain dicts
+        return (
+            self.__class__,
+            (self.apps, self.locale, self.import_path, self.init_style, dict(self.modules), dict(self.stubs)),
+        )
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PathTable":
+        """
+        Build path table from configuration dictionary.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            Path table
+
+        Raises:
+            ConfigurationError: If a path is not a string
+        """
+        dirs = config.get("dirs", {})
+        modules = {module: dirs.get(key, default) for module, (key, default) in MODULE_DIRS.items()}
+        stubs = {**STUB_FILES, **config.get("stubs", {})}
+        values = {
+            "apps": dirs.get("apps", DEFAULT_APPS_PATH),
+            "locale": dirs.get("locale", DEFAULT_LOCALE_PATH),
+            "import_path": config.get("import_path", DEFAULT_IMPORT_PATH),
+            "init_style": config.get("init_style", DEFAULT_INIT_STYLE),
+            **{f"dirs.{key}": value for key, value in modules.items()},
+            **{f"stubs.{key}": value for key, value in stubs.items()},
+        }
+        for key, value in values.items():
+            if not isinstance(value, str):
+                raise ConfigurationError(f"'{key}' must be a string")
+        return cls(
+            apps=values["apps"],
+            locale=values["locale"],
+            import_path=values["import_path"],
+            init_style=values["init_style"],
+            modules=modules,
+            stubs=stubs,
+        )
+
 
 class ConfigManager:
     """Manage jst-django configuration."""
@@ -36,8 +126,12 @@ class ConfigManager:
             "signals": DEFAULT_SIGNALS_PATH,
         },
         "import_path": DEFAULT_IMPORT_PATH,
+        "init_style": DEFAULT_INIT_STYLE,
         "stubs": STUB_FILES,
+        "translate": {"backend": DEFAULT_TRANSLATE_BACKEND, "backends": {}},
+        "pagination": DEFAULT_PAGINATION,
     }
+    _shared: ClassVar[Dict[Path, "ConfigManager"]] = {}
 
     def __init__(self, config_path: Optional[Path] = None):
         """
@@ -49,10 +143,34 @@ class ConfigManager:
         self.config_path = config_path or Path.cwd() / self.CONFIG_FILE_NAME
         self._config: Optional[Dict[str, Any]] = None
         self._cache: Dict[str, Any] = {}
+        self._mtime: Optional[int] = None
+        self._paths: Optional[PathTable] = None
+
+    @classmethod
+    def shared(cls, config_path: Optional[Path] = None) -> "ConfigManager":
+        """
+        Get process-wide configuration manager.
+
+        Args:
+            config_path: Path to configuration file. If None, uses jst.json in current directory.
+
+        Returns:
+            Configuration manager shared by every caller with the same path
+        """
+        path = (config_path or Path.cwd() / cls.CONFIG_FILE_NAME).absolute()
+        if path not in cls._shared:
+            cls._shared[path] = cls(path)
+        return cls._shared[path]
+
+    def _get_mtime(self) -> Optional[int]:
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
     def load(self) -> Dict[str, Any]:
         """
-        Load configuration from file.
+        Load configuration from file, reloading only when its mtime changes.
 
         Returns:
             Configuration dictionary
@@ -60,11 +178,16 @@ class ConfigManager:
         Raises:
             ConfigurationError: If configuration file is invalid
         """
-        if self._config is not None:
+        mtime = self._get_mtime()
+        if self._config is not None and mtime == self._mtime:
             return self._config
 
+        self._mtime = mtime
+        self._cache.clear()
+        self._paths = None
+        self._config = None
         try:
-            if not self.config_path.exists():
+            if mtime is None:
                 self._config = self.DEFAULT_CONFIG.copy()
                 return self._config
 
@@ -107,7 +230,9 @@ class ConfigManager:
                 json.dump(config, file, indent=2, ensure_ascii=False)
 
             self._config = config
+            self._mtime = self._get_mtime()
             self._cache.clear()
+            self._paths = None
 
         except Exception as e:
             raise ConfigurationError(
@@ -128,7 +253,7 @@ class ConfigManager:
         """
         config = self.load()
 
-        # Check cache first
+        # Check cache first, it is cleared whenever the file is reloaded
         if key in self._cache:
             return self._cache[key]
 
@@ -210,6 +335,21 @@ class ConfigManager:
         """
         return self.get(f"stubs.{stub_name}", STUB_FILES.get(stub_name, f"{stub_name}.stub"))
 
+    def paths(self, fallback: Optional[Dict[str, Any]] = None) -> PathTable:
+        """
+        Get path table of the current configuration.
+
+        Args:
+            fallback: Configuration used instead of defaults when config file is missing
+
+        Returns:
+            Path table, rebuilt only after the configuration is reloaded
+        """
+        config = self.load()
+        if self._paths is None:
+            self._paths = PathTable.from_config(fallback if self._mtime is None and fallback is not None else config)
+        return self._paths
+
     @staticmethod
     def _validate_config(config: Dict[str, Any]) -> None:
         """
@@ -234,6 +374,54 @@ class ConfigManager:
         if "import_path" in config and not isinstance(config["import_path"], str):
             raise ConfigurationError("'import_path' must be a string")
 
+        if "init_style" in config and config["init_style"] not in INIT_STYLES:
+            raise ConfigurationError(f"'init_style' must be one of: {', '.join(INIT_STYLES)}")
+
+        if "translate" in config:
+            ConfigManager._validate_translate(config["translate"])
+
+        if "pagination" in config:
+            ConfigManager._validate_pagination(config["pagination"])
+
+    @staticmethod
+    def _validate_translate(translate: Any) -> None:
+        """
+        Validate translation backends.
+
+        Args:
+            translate: Value of ``translate``
+
+        Raises:
+            ConfigurationError: If translate is invalid
+        """
+        if not isinstance(translate, dict):
+            raise ConfigurationError("'translate' must be a dictionary")
+        if "backend" in translate and not isinstance(translate["backend"], str):
+            raise ConfigurationError("'translate.backend' must be a string")
+        backends = translate.get("backends", {})
+        if not isinstance(backends, dict) or not all(isinstance(value, dict) for value in backends.values()):
+            raise ConfigurationError("'translate.backends' must map backend names to dictionaries")
+
+    @staticmethod
+    def _validate_pagination(pagination: Any) -> None:
+        """
+        Validate list pagination of generated viewsets.
+
+        Args:
+            pagination: Value of ``pagination``
+
+        Raises:
+            ConfigurationError: If pagination is invalid
+        """
+        if not isinstance(pagination, dict):
+            raise ConfigurationError("'pagination' must be a dictionary")
+        if "style" in pagination and pagination["style"] not in PAGINATION_STYLES:
+            raise ConfigurationError(f"'pagination.style' must be one of: {', '.join(PAGINATION_STYLES)}")
+        if "ordering" in pagination and not isinstance(pagination["ordering"], str):
+            raise ConfigurationError("'pagination.ordering' must be a string")
+        if "page_size" in pagination and not isinstance(pagination["page_size"], int):
+            raise ConfigurationError("'pagination.page_size' must be an integer")
+
     def clear_cache(self) -> None:
         """Clear configuration cache."""
         self._cache.clear()
@@ -246,5 +434,4 @@ class ConfigManager:
             Reloaded configuration
         """
         self._config = None
-        self._cache.clear()
         return self.load()
@@ -42,9 +42,24 @@ STUB_FILES = {
     "signal": "signal.stub",
 }
 
+# __init__.py export styles: star imports or explicit imports with __all__
+INIT_STYLES = ["star", "all"]
+DEFAULT_INIT_STYLE = "star"
+
+# Translation backend used by `jst translate` unless configured otherwise
+DEFAULT_TRANSLATE_BACKEND = "tahrirchi"
+
+# List pagination of generated viewsets, "cursor" pages by keyset on an indexed ordering
+PAGINATION_STYLES = ["page", "cursor"]
+DEFAULT_PAGINATION = {"style": "page", "ordering": "-id", "page_size": 20}
+
 # Template choices
 TEMPLATE_TYPES = ["django"]
 
+# Project renderers of `jst create`
+TEMPLATE_ENGINES = ["cookiecutter", "native"]
+DEFAULT_TEMPLATE_ENGINE = "cookiecutter"
+
 # Package choices for installation
 AVAILABLE_PACKAGES = [
     "cacheops",
@@ -86,6 +101,25 @@ DEFAULT_VALIDATORS_PATH = "validators/"
 DEFAULT_FORMS_PATH = "forms/"
 DEFAULT_FILTERS_PATH = "filters/"
 DEFAULT_SIGNALS_PATH = "signals/"
+DEFAULT_LOCALE_PATH = "./locale/"
+
+# Module registry
+MODULE_OWNER = "JscorpTech"
+REGISTRY_MODULES = ["default", "bot", "authbot", "authv2", "websocket"]
+MODULE_REGISTRY_ENV = "JST_MODULE_REGISTRY"
+MODULE_REGISTRY_TTL = 3600  # seconds
+MODULE_MANIFEST = "jst-module.json"
+APP_MANIFEST = ".jst-manifest.json"  # sha256 of installed files, inside the app
+
+# User wide cache (tokens, templates, registry), overridable for CI
+CACHE_DIR_ENV = "JST_CACHE_DIR"
+
+# Serve network consumers from the user cache only
+OFFLINE_ENV = "JST_OFFLINE"
+
+# Project local state (caches, reports), relative to project root
+PROJECT_STATE_DIR = ".jst"
+SYNC_GRAPH = "sync.json"  # model -> generated files, inside the state dir
 
 # Import path
 DEFAULT_IMPORT_PATH = "core.apps."
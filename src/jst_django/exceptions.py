@@ -69,6 +69,12 @@ class APIError(JstDjangoException):
     pass
 
 
+class OfflineError(APIError):
+    """Raised when offline mode needs a resource missing from the local caches."""
+
+    pass
+
+
 class VersionError(JstDjangoException):
     """Raised when version-related operations fail."""
 
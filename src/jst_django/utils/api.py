@@ -1,11 +1,18 @@
 """GitHub API utilities for jst-django."""
 
-from typing import List, Optional, Union
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 import requests
 
-from jst_django.exceptions import APIError, VersionError
+from jst_django.exceptions import APIError, OfflineError, VersionError
+from jst_django.utils.cache import user_cache_dir
 from jst_django.utils.logger import logger
+from jst_django.utils.network import is_offline, require_network
 
 
 class Github:
@@ -30,6 +37,11 @@ class Github:
         }
         self.timeout = 30  # seconds
 
+    @property
+    def cache_dir(self) -> Path:
+        """Cached GET responses of the repository"""
+        return user_cache_dir("github", self.owner, self.repo)
+
     def request(self, action: str, method: str = "GET") -> Union[dict, list]:
         """
         Make request to GitHub API.
@@ -43,15 +55,52 @@ class Github:
 
         Raises:
             APIError: If request fails
+            OfflineError: If offline and the response was never cached
+        """
+        # GET responses are kept so offline mode can answer them
+        cache = self.cache_dir / (re.sub(r"[^\w.-]", "_", action) + ".json") if method == "GET" else None
+        if is_offline() and cache is not None:
+            try:
+                with open(cache, "r", encoding="utf-8") as file:
+                    return json.load(file)
+            except (OSError, ValueError):
+                require_network(f"GitHub {self.owner}/{self.repo}/{action}")
+        data = self._send(action, method).json()
+        if cache is not None:
+            with tempfile.NamedTemporaryFile("w", dir=cache.parent, suffix=".tmp", delete=False) as file:
+                json.dump(data, file)
+            os.replace(file.name, cache)
+        return data
+
+    def conditional(self, action: str, etag: Optional[str] = None) -> Tuple[Optional[Union[dict, list]], Optional[str]]:
         """
+        GET revalidated with an ETag, unchanged responses do not count against the rate limit.
+
+        Args:
+            action: API action/endpoint
+            etag: ETag of the cached response
+
+        Returns:
+            Response data and its ETag, data is None if the cached response is still valid
+
+        Raises:
+            APIError: If request fails
+        """
+        response = self._send(action, "GET", {"If-None-Match": etag} if etag else None)
+        if response.status_code == 304:
+            return None, etag
+        return response.json(), response.headers.get("ETag")
+
+    def _send(self, action: str, method: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
         url = f"{self.base_url}/{action}"
+        require_network(url)
 
         try:
-            logger.debug(f"Making {method} request to: {url}")
-            response = requests.request(method, url, timeout=self.timeout)
+            logger.debug("Making %s request to: %s", method, url)
+            response = requests.request(method, url, headers=headers, timeout=self.timeout)
 
-            if response.status_code == 200:
-                return response.json()
+            if response.status_code in (200, 304):
+                return response
 
             # Handle specific error codes
             if response.status_code == 404:
@@ -95,7 +144,7 @@ class Github:
             if version:
                 return self.check_version(version, versions)
 
-            logger.info(f"Found {len(versions)} releases")
+            logger.info("Found %s releases", len(versions))
             return versions
 
         except Exception as e:
@@ -116,9 +165,11 @@ class Github:
             logger.info("Fetching latest release")
             release_data = self.request(self.release_urls["latest"])
             version = release_data["name"]
-            logger.info(f"Latest release: {version}")
+            logger.info("Latest release: %s", version)
             return version
 
+        except OfflineError:
+            raise
         except Exception as e:
             logger.exception("Failed to fetch latest release")
             raise APIError("Failed to fetch latest release", details=str(e))
@@ -137,14 +188,16 @@ class Github:
             APIError: If request fails
         """
         try:
-            logger.debug(f"Fetching commit ID for version: {version}")
+            logger.debug("Fetching commit ID for version: %s", version)
             ref_data = self.request(self.release_urls["ref"].format(version))
             commit_sha = ref_data["object"]["sha"]
-            logger.debug(f"Commit SHA: {commit_sha}")
+            logger.debug("Commit SHA: %s", commit_sha)
             return commit_sha
 
+        except OfflineError:
+            raise
         except Exception as e:
-            logger.exception(f"Failed to get commit ID for version: {version}")
+            logger.exception("Failed to get commit ID for version: %s", version)
             raise APIError(f"Failed to get commit ID for version: {version}", details=str(e))
 
     def check_version(self, version: str, versions: List[str]) -> bool:
@@ -163,13 +216,13 @@ class Github:
         """
         if version not in versions:
             available = ", ".join(versions[:10])  # Show first 10
-            logger.error(f"Version {version} not found")
+            logger.error("Version %s not found", version)
             raise VersionError(
                 f"Version '{version}' not found",
                 details=f"Available versions: {available}{'...' if len(versions) > 10 else ''}",
             )
 
-        logger.info(f"Version {version} found")
+        logger.info("Version %s found", version)
         return True
 
     def branches(self) -> List[str]:
@@ -194,9 +247,11 @@ class Github:
                     filtered_branches.append(branch)
 
             filtered_branches.reverse()
-            logger.info(f"Found {len(filtered_branches)} relevant branches")
+            logger.info("Found %s relevant branches", len(filtered_branches))
             return filtered_branches
 
+        except OfflineError:
+            raise
         except Exception as e:
             logger.exception("Failed to fetch branches")
             raise APIError("Failed to fetch branches", details=str(e))
@@ -60,24 +60,49 @@ def add_include_urlpattern(source_code, prefix, app_module):
     :param app_module: app modul nomi, masalan "accounts.urls"
     :return: yangilangan python kodi (string)
     """
-    tree = ast.parse(source_code)
+    return add_include_urlpatterns(source_code, [(prefix, app_module)])
 
-    # include chaqiruvini yaratish
-    include_call = ast.Call(
-        func=ast.Name(id="include", ctx=ast.Load()), args=[ast.Constant(value=app_module)], keywords=[]
-    )
 
-    # path chaqiruvini yaratish
-    path_call = ast.Call(
-        func=ast.Name(id="path", ctx=ast.Load()), args=[ast.Constant(value=prefix), include_call], keywords=[]
-    )
+def add_include_urlpatterns(source_code, patterns):
+    """
+    urlpatterns ga bir nechta include ni bitta parse bilan qo'shadi,
+    mavjud include lar qayta qo'shilmaydi
+
+    :param source_code: original python kodi (string)
+    :param patterns: (prefix, app_module) juftliklari
+    :return: yangilangan python kodi (string)
+    """
+    tree = ast.parse(source_code)
 
     # urlpatterns ni topib list oxiriga qo'shish
     for node in tree.body:
         if isinstance(node, ast.Assign):
             if getattr(node.targets[0], "id", None) == "urlpatterns":
                 if isinstance(node.value, ast.List):
-                    node.value.elts.append(path_call)
+                    included = {
+                        arg.value
+                        for call in ast.walk(node.value)
+                        if isinstance(call, ast.Call) and getattr(call.func, "id", None) == "include"
+                        for arg in call.args
+                        if isinstance(arg, ast.Constant)
+                    }
+                    for prefix, app_module in patterns:
+                        if app_module in included:
+                            continue
+                        included.add(app_module)
+                        # path("prefix/", include("app_module"))
+                        include_call = ast.Call(
+                            func=ast.Name(id="include", ctx=ast.Load()),
+                            args=[ast.Constant(value=app_module)],
+                            keywords=[],
+                        )
+                        node.value.elts.append(
+                            ast.Call(
+                                func=ast.Name(id="path", ctx=ast.Load()),
+                                args=[ast.Constant(value=prefix), include_call],
+                                keywords=[],
+                            )
+                        )
                     break
 
     return astor.to_source(tree)
@@ -91,12 +116,27 @@ def add_module(source_code, module) -> str:
     :param module: qo'shilish kerak bo'lgan app
     :return: yangi code
     """
+    return add_modules(source_code, [module])
+
+
+def add_modules(source_code, modules) -> str:
+    """
+    applarni MODULES ga bitta parse bilan qo'shadi, mavjudlari qayta qo'shilmaydi
+
+    :param source_code: python code
+    :param modules: qo'shilish kerak bo'lgan applar
+    :return: yangi code
+    """
     tree = ast.parse(source_code)
 
     for node in tree.body:
         if isinstance(node, ast.Assign):
             if getattr(node.targets[0], "id", None) == "MODULES":
                 if isinstance(node.value, ast.List):
-                    node.value.elts.append(ast.Constant(value=module))
+                    present = {elt.value for elt in node.value.elts if isinstance(elt, ast.Constant)}
+                    for module in modules:
+                        if module not in present:
+                            present.add(module)
+                            node.value.elts.append(ast.Constant(value=module))
                     break
     return astor.to_source(tree)
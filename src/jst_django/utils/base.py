@@ -8,7 +8,7 @@ from typing import Optional, Union
 
 from rich import print
 
-from jst_django.config import ConfigManager
+from jst_django.config import ConfigManager, PathTable
 from jst_django.exceptions import ConfigurationError
 from jst_django.utils.logger import logger
 
@@ -19,7 +19,7 @@ class Jst:
     def __init__(self):
         """Initialize Jst utility."""
         self.base_dir = Path.cwd()
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager.shared()
         self.default_config = {
             "dirs": {
                 "apps": "./",
@@ -81,6 +81,18 @@ class Jst:
             logger.exception("Failed to load config file")
             raise ConfigurationError("Failed to load config file", details=str(e))
 
+    def paths(self) -> PathTable:
+        """
+        Get resolved path table of the config file.
+
+        Returns:
+            Path table, cached process-wide until jst.json changes
+
+        Raises:
+            ConfigurationError: If config file is invalid
+        """
+        return self.config_manager.paths(fallback=self.default_config)
+
     def requirements(self) -> None:
         """
         Display requirements file content.
@@ -88,15 +100,16 @@ class Jst:
         Raises:
             FileNotFoundError: If requirements stub file not found
         """
+        from jst_django.utils.stubs import StubRegistry
+
         try:
-            requirements_path = Path(__file__).parent.parent / "stubs" / "requirements.txt.stub"
+            requirements = StubRegistry.bundle().get("requirements.txt.stub")
 
-            if not requirements_path.exists():
-                logger.error(f"Requirements file not found: {requirements_path}")
-                raise FileNotFoundError(f"Requirements file not found: {requirements_path}")
+            if requirements is None:
+                logger.error("Requirements file not found: requirements.txt.stub")
+                raise FileNotFoundError("Requirements file not found: requirements.txt.stub")
 
-            with open(requirements_path, "r", encoding="utf-8") as file:
-                print(file.read())
+            print(requirements)
 
         except Exception as e:
             logger.exception("Failed to display requirements")
@@ -126,7 +139,7 @@ class Code:
         try:
             CodeFormatter.format_code(file_path)
         except Exception as e:
-            logger.error(f"Failed to format code: {file_path}")
+            logger.error("Failed to format code: %s", file_path)
             logger.exception(e)
             raise
 
@@ -0,0 +1,26 @@
+"""User wide cache directory."""
+
+import os
+from pathlib import Path
+
+from platformdirs import user_cache_dir as platform_cache_dir
+
+from jst_django.constants import CACHE_DIR_ENV
+
+
+def user_cache_dir(*parts: str) -> Path:
+    """
+    Directory inside the user cache, created on first use.
+
+    ``JST_CACHE_DIR`` overrides the platform location (e.g. ``~/.cache/jst-django``).
+
+    Args:
+        parts: Sub directories
+
+    Returns:
+        Cache directory path
+    """
+    root = os.environ.get(CACHE_DIR_ENV) or platform_cache_dir("jst-django")
+    path = Path(root, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -4,6 +4,11 @@ import black
 import isort
 from rich import print
 
+from jst_django.constants import DEFAULT_LINE_LENGTH
+
+ISORT_CONFIG = isort.Config(profile="black", line_length=DEFAULT_LINE_LENGTH)
+BLACK_MODE = black.FileMode(line_length=DEFAULT_LINE_LENGTH)
+
 
 class Code:
     def __init__(self) -> None:
@@ -14,10 +19,7 @@ class Code:
         """Black and Isort format code"""
         try:
             with open(file_path, "r") as file:
-                code = black.format_str(
-                    isort.code(file.read(), config=isort.Config(profile="black", line_length=120)),
-                    mode=black.FileMode(line_length=120),
-                )
+                code = black.format_str(isort.code(file.read(), config=ISORT_CONFIG), mode=BLACK_MODE)
             with open(file_path, "w") as file:
                 file.write(code)
         except Exception as e:
@@ -27,9 +29,16 @@ class Code:
 def format_code_string(source: str) -> Optional[str]:
     """Black and Isort format code from string"""
     try:
-        return black.format_str(
-            isort.code(source, config=isort.Config(profile="black", line_length=120)),
-            mode=black.FileMode(line_length=120),
-        )
+        return black.format_str(isort.code(source, config=ISORT_CONFIG), mode=BLACK_MODE)
     except Exception as e:
         print("[bold red]%s[/bold red]" % str(e))
+
+
+def sort_imports(source: str) -> str:
+    """Isort an import block, much cheaper than formatting the whole file"""
+    return isort.code(source, config=ISORT_CONFIG)
+
+
+def is_formatted(source: str) -> bool:
+    """Rendered stub output that needs no formatter: no line over the limit"""
+    return all(len(line) <= DEFAULT_LINE_LENGTH for line in source.splitlines())
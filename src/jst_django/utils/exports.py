@@ -0,0 +1,212 @@
+"""Export manager for generated package ``__init__.py`` files."""
+
+import ast
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from jst_django.constants import DEFAULT_LINE_LENGTH, INIT_STYLES
+from jst_django.exceptions import ConfigurationError
+from jst_django.utils.file import File
+
+
+def _star_import(module: str) -> str:
+    return f"from .{module} import *  # noqa"
+
+
+def _wrap(head: str, items: List[str], tail: str, line_length: int) -> str:
+    """Render ``head item, item tail`` the way black would wrap it"""
+    line = f"{head}{', '.join(items)}{tail}"
+    if len(line) <= line_length:
+        return line
+    body = "".join(f"    {item},\n" for item in items)
+    return f"{head}\n{body}{tail}"
+
+
+def public_names(path: Path) -> List[str]:
+    """
+    Collect names exported by a python module without importing it.
+
+    Args:
+        path: Module file path
+
+    Returns:
+        ``__all__`` of the module if declared, otherwise its public top level names
+    """
+    if not path.exists():
+        return []
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    names: List[str] = []
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                if target.id == "__all__" and isinstance(node.value, (ast.List, ast.Tuple)):
+                    return [elt.value for elt in node.value.elts if isinstance(elt, ast.Constant)]
+                names.append(target.id)
+    return [name for name in dict.fromkeys(names) if not name.startswith("_")]
+
+
+class InitFile:
+    """Parsed ``__init__.py``: free-form preamble and epilogue around an ordered set of relative exports."""
+
+    def __init__(self, path: Path, style: str = "star") -> None:
+        self.path = path
+        self.style = style
+        # Docstring and imports before the exports, code after them
+        self.preamble = ""
+        self.epilogue = ""
+        self.exports: Dict[str, None] = {}
+        self.original = ""
+        # Hand-written ``__all__`` in the preamble, the user maintains the export list
+        self.declared = False
+        self.load()
+
+    def load(self) -> None:
+        """
+        Split an existing file into exports and preamble.
+
+        Only lines the manager renders are taken over: star imports and, in
+        ``all`` style, explicit imports of every public name of a module and
+        an ``__all__`` listing exactly those names. Hand-written imports and
+        ``__all__`` stay untouched; exports are rendered after the leading
+        imports so the rest of the file never precedes an import.
+        """
+        if not self.path.exists():
+            return
+        self.original = self.path.read_text(encoding="utf-8")
+        lines = self.original.splitlines()
+        consumed = set()
+        exported: List[str] = []
+        declared: Optional[ast.Assign] = None
+        # Line after the docstring and the imports leading the file
+        split, leading = 0, True
+        for node in ast.parse(self.original).body:
+            leading = leading and (isinstance(node, (ast.Import, ast.ImportFrom)) or self._docstring(node))
+            if leading:
+                split = node.end_lineno
+            if self._generated_import(node):
+                self.exports[node.module] = None
+                exported += [alias.name for alias in node.names if alias.name != "*"]
+                consumed.update(range(node.lineno - 1, node.end_lineno))
+            elif isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets
+            ):
+                declared = node
+        if declared is not None and exported and self._names(declared) == sorted(exported):
+            consumed.update(range(declared.lineno - 1, declared.end_lineno))
+        else:
+            self.declared = declared is not None
+        kept = [(index, line) for index, line in enumerate(lines) if index not in consumed]
+        self.preamble = "\n".join(line for index, line in kept if index < split).strip()
+        self.epilogue = "\n".join(line for index, line in kept if index >= split).strip()
+
+    @staticmethod
+    def _docstring(node: ast.stmt) -> bool:
+        return isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)
+
+    def _generated_import(self, node: ast.stmt) -> bool:
+        """``from .x import *`` or ``from .x import <every public name>`` without aliases"""
+        if not isinstance(node, ast.ImportFrom) or node.level != 1 or not node.module or "." in node.module:
+            return False
+        names = [alias.name for alias in node.names]
+        if any(alias.asname is not None for alias in node.names):
+            return False
+        if names == ["*"]:
+            return True
+        return self.style == "all" and sorted(names) == sorted(public_names(self._module_path(node.module)))
+
+    @staticmethod
+    def _names(node: ast.Assign) -> Optional[List[str]]:
+        if not isinstance(node.value, (ast.List, ast.Tuple)):
+            return None
+        return sorted(elt.value for elt in node.value.elts if isinstance(elt, ast.Constant))
+
+    def add(self, module: str) -> None:
+        self.exports[module] = None
+
+    def render(self, style: str, line_length: int, star: Callable[[str], str]) -> str:
+        blocks = [self.preamble] if self.preamble else []
+        imports: List[str] = []
+        exported: Dict[str, None] = {}
+        explicit = True
+        for module in sorted(self.exports):
+            names = sorted(public_names(self._module_path(module))) if style == "all" else []
+            # Star import keeps the old "last wins" semantics when names clash
+            if len(names) == 0 or any(name in exported for name in names):
+                imports.append(star(module))
+                explicit = False
+                continue
+            imports.append(self._import_line(module, names, line_length))
+            exported.update(dict.fromkeys(names))
+        if imports:
+            blocks.append("\n".join(imports))
+        # __all__ would hide star imported names from ``from package import *``
+        if exported and explicit and not self.declared:
+            blocks.append(_wrap("__all__ = [", [f'"{name}"' for name in sorted(exported)], "]", line_length))
+        if self.epilogue:
+            blocks.append(self.epilogue)
+        return "\n\n".join(blocks) + "\n" if blocks else ""
+
+    @staticmethod
+    def _import_line(module: str, names: List[str], line_length: int) -> str:
+        line = f"from .{module} import {', '.join(names)}"
+        if len(line) <= line_length:
+            return line
+        return _wrap(f"from .{module} import (", names, ")", 0)
+
+    def _module_path(self, module: str) -> Path:
+        package = self.path.parent / module / "__init__.py"
+        return package if package.exists() else self.path.parent / f"{module}.py"
+
+
+class InitManager:
+    """
+    Collect ``__init__.py`` exports during a run and write each file once.
+
+    Every init file is parsed the first time it is touched, new exports are
+    merged into an ordered set and :meth:`flush` writes sorted output that is
+    already black/isort formatted, so no formatter pass is needed.
+    """
+
+    def __init__(
+        self,
+        style: str = "star",
+        line_length: int = DEFAULT_LINE_LENGTH,
+        star: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        """
+        Initialize init manager.
+
+        Args:
+            style: ``star`` for ``from .x import *`` lines, ``all`` for explicit imports and ``__all__``
+            line_length: Maximum line length of rendered output
+            star: Renderer of a single star import line
+        """
+        if style not in INIT_STYLES:
+            raise ConfigurationError(f"Unknown init style: {style}", details=f"Available: {', '.join(INIT_STYLES)}")
+        self.style = style
+        self.line_length = line_length
+        self.star = star or _star_import
+        self.files: Dict[Path, InitFile] = {}
+
+    def add(self, init_path, module: str) -> None:
+        """Register ``module`` as an export of ``init_path``"""
+        path = Path(init_path)
+        if path not in self.files:
+            self.files[path] = InitFile(path, self.style)
+        self.files[path].add(module)
+
+    def flush(self) -> None:
+        """Write every changed init file"""
+        for path, init in self.files.items():
+            content = init.render(self.style, self.line_length, self.star)
+            if content == init.original and path.exists():
+                continue
+            with File.locked(path) as file:
+                file.seek(0)
+                file.truncate()
+                file.write(content)
+            init.original = content
@@ -1,4 +1,14 @@
+import errno
+import os
+import shutil
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - windows
+    fcntl = None
 
 
 class File:
@@ -9,3 +19,64 @@ class File:
     @staticmethod
     def mkdir(path):
         Path(path).mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def listing(path) -> Dict[str, str]:
+        """Files under a directory, posix relative path to absolute path"""
+        files = {}
+        for root, _, names in os.walk(path):
+            for name in names:
+                file = os.path.join(root, name)
+                files[Path(os.path.relpath(file, path)).as_posix()] = file
+        return files
+
+    @staticmethod
+    def copy(src, dst) -> None:
+        """Copy file contents inside the kernel and its permission bits
+
+        ``copy_file_range`` is tried first (reflinks on btrfs/xfs), then
+        ``sendfile``; plain read/write is only used where neither works.
+        """
+        with open(src, "rb") as source, open(dst, "wb") as target:
+            size = os.fstat(source.fileno()).st_size
+            if not File._kernel_copy(source.fileno(), target.fileno(), size):
+                shutil.copyfileobj(source, target)
+        shutil.copymode(src, dst)
+
+    @staticmethod
+    def _kernel_copy(source: int, target: int, size: int) -> bool:
+        for name in ("copy_file_range", "sendfile"):
+            if not hasattr(os, name):
+                continue
+            offset = 0
+            try:
+                while offset < size:
+                    if name == "copy_file_range":
+                        copied = os.copy_file_range(source, target, size - offset, offset, offset)
+                    else:
+                        copied = os.sendfile(target, source, offset, size - offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+                return True
+            except OSError as e:
+                unsupported = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF)
+                if offset != 0 or e.errno not in unsupported:
+                    raise
+        return False
+
+    @staticmethod
+    @contextmanager
+    def locked(path, mode: str = "r+"):
+        """Open file holding an exclusive lock until the block exits"""
+        if "r" in mode and not Path(path).exists():
+            open(path, "w").close()
+        with open(path, mode) as file:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield file
+            finally:
+                if fcntl is not None:
+                    file.flush()
+                    fcntl.flock(file.fileno(), fcntl.LOCK_UN)
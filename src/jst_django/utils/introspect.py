@@ -0,0 +1,261 @@
+"""Fields of existing Django models read from source, without importing Django."""
+
+import ast
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from jst_django.exceptions import CodeGenerationError
+from jst_django.utils.tokenize import Tokenize
+
+# Calls that declare a model field, besides every ``*Field``
+RELATIONS = {"ForeignKey", "OneToOneField", "ManyToManyField"}
+
+
+def _dotted(node: ast.expr) -> Optional[str]:
+    """``models.Model`` as written in a base list"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        parent = _dotted(node.value)
+        return None if parent is None else f"{parent}.{node.attr}"
+    return None
+
+
+def _is_field(node: Optional[ast.expr]) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    name = (_dotted(node.func) or "").rsplit(".", 1)[-1]
+    return name in RELATIONS or name.endswith("Field") and not name.startswith("Generic")
+
+
+def parse_module(source: str, package: str) -> Dict[str, Any]:
+    """
+    Imports and model classes of one module.
+
+    Args:
+        source: Python source
+        package: Package of the module, relative imports are resolved against it
+
+    Returns:
+        JSON serializable summary: ``imports`` (local name -> [module, name]),
+        ``stars`` (star imported modules) and ``classes`` (bases and fields)
+
+    Raises:
+        SyntaxError: If the source is not valid Python
+    """
+    imports: Dict[str, List[str]] = {}
+    stars: List[str] = []
+    classes: Dict[str, Any] = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ImportFrom):
+            module = _absolute(node, package)
+            for alias in node.names:
+                if alias.name == "*":
+                    stars.append(module)
+                else:
+                    imports[alias.asname or alias.name] = [module, alias.name]
+        elif isinstance(node, ast.ClassDef):
+            classes[node.name] = {
+                "bases": [base for base in map(_dotted, node.bases) if base is not None],
+                "fields": _fields(node),
+            }
+    return {"imports": imports, "stars": stars, "classes": classes}
+
+
+def _absolute(node: ast.ImportFrom, package: str) -> str:
+    module = node.module or ""
+    if not node.level:
+        return module
+    parts = package.split(".")
+    parent = parts[: len(parts) - node.level + 1] if node.level > 1 else parts
+    return ".".join(parent + ([module] if module else []))
+
+
+def _fields(node: ast.ClassDef) -> List[List[str]]:
+    fields = []
+    for item in node.body:
+        if isinstance(item, ast.Assign) and len(item.targets) == 1 and isinstance(item.targets[0], ast.Name):
+            target, value = item.targets[0].id, item.value
+        elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+            target, value = item.target.id, item.value
+        else:
+            continue
+        if _is_field(value):
+            fields.append([target, ast.unparse(value)])
+    return fields
+
+
+class ModelIntrospector:
+    """
+    Read model fields from project sources with ``ast``.
+
+    Bases are followed through ``from x import Y`` and star imports while
+    they resolve to files of the project, so fields inherited from abstract
+    models such as ``AbstractBaseModel`` subclasses are included; bases
+    outside the project (``models.Model``, installed packages) end the walk.
+    Parsed modules are cached in the project state dir by content hash.
+    """
+
+    VERSION = 1
+
+    def __init__(self, root: Union[str, Path], cache: Optional[Union[str, Path]] = None) -> None:
+        """
+        Initialize introspector.
+
+        Args:
+            root: Project root, module paths are relative to it
+            cache: Cache file, no cache when None
+        """
+        self.root = Path(root)
+        self.cache_path = Path(cache) if cache is not None else None
+        self.files: Dict[str, dict] = {}
+        self.modules: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.changed = False
+        if self.cache_path is not None:
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                if data.get("version") == self.VERSION:
+                    self.files = data["files"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+    def module_path(self, module: str) -> Optional[Path]:
+        """Source file of a dotted module inside the project"""
+        base = self.root.joinpath(*module.split("."))
+        for path in (base.with_suffix(".py"), base / "__init__.py"):
+            if path.is_file():
+                return path
+        return None
+
+    def module(self, module: str) -> Optional[Dict[str, Any]]:
+        """
+        Parsed module, from the cache when the file did not change.
+
+        Args:
+            module: Dotted module name
+
+        Returns:
+            Module summary, None if the module is not part of the project
+
+        Raises:
+            CodeGenerationError: If the module is not valid Python
+        """
+        if module in self.modules:
+            return self.modules[module]
+        path = self.module_path(module)
+        if path is None:
+            self.modules[module] = None
+            return None
+        key = path.relative_to(self.root).as_posix()
+        stat = path.stat()
+        entry = self.files.get(key)
+        if entry is None or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            content = path.read_bytes()
+            digest = hashlib.sha256(content).hexdigest()
+            if entry is None or entry["sha256"] != digest:
+                package = module if path.name == "__init__.py" else module.rpartition(".")[0]
+                try:
+                    parsed = parse_module(content.decode("utf-8"), package)
+                except (SyntaxError, UnicodeDecodeError) as e:
+                    raise CodeGenerationError(f"Model fayli o'qilmadi: {key}", details=str(e))
+                entry = {"sha256": digest, "module": parsed}
+            entry = {**entry, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            self.files[key] = entry
+            self.changed = True
+        self.modules[module] = entry["module"]
+        return entry["module"]
+
+    def find(self, module: str, name: str, seen: Optional[Set[Tuple[str, str]]] = None) -> Optional[Tuple[str, dict]]:
+        """
+        Class defined in or imported into a module.
+
+        Args:
+            module: Dotted module name
+            name: Class name
+            seen: Modules already searched, star imports may form cycles
+
+        Returns:
+            Defining module and class summary, None when not found in the project
+        """
+        seen = set() if seen is None else seen
+        if (module, name) in seen:
+            return None
+        seen.add((module, name))
+        parsed = self.module(module)
+        if parsed is None:
+            return None
+        if name in parsed["classes"]:
+            return module, parsed["classes"][name]
+        if name in parsed["imports"]:
+            return self.find(*parsed["imports"][name], seen)
+        for star in parsed["stars"]:
+            found = self.find(star, name, seen)
+            if found is not None:
+                return found
+        return None
+
+    def fields(self, module: str, name: str) -> Dict[str, str]:
+        """
+        Fields of a model including the ones of its project bases.
+
+        Args:
+            module: Dotted module the model is reachable from, e.g. ``core.apps.blog.models``
+            name: Model class name
+
+        Returns:
+            Field name -> field expression in declaration order, bases first
+
+        Raises:
+            CodeGenerationError: If the model is not found
+        """
+        found = self.find(module, name)
+        if found is None:
+            raise CodeGenerationError(f"Model topilmadi: {name}", details=module)
+        return self._collect(*found, set())
+
+    def _collect(self, module: str, summary: dict, seen: Set[Tuple[str, str]]) -> Dict[str, str]:
+        fields: Dict[str, str] = {}
+        # Python MRO puts the first base first, so later bases are overridden by earlier ones
+        for base in reversed(summary["bases"]):
+            head, _, attr = base.rpartition(".")
+            found = self.find(module, base) if not head else self._find_attribute(module, head, attr)
+            if found is None or (found[0], base) in seen:
+                continue
+            seen.add((found[0], base))
+            fields.update(self._collect(*found, seen))
+        fields.update(dict(summary["fields"]))
+        return fields
+
+    def _find_attribute(self, module: str, head: str, attr: str) -> Optional[Tuple[str, dict]]:
+        """``head.attr`` base, ``from core.apps.shared import models`` makes ``models.BaseModel`` one"""
+        parsed = self.module(module)
+        if parsed is None:
+            return None
+        source = parsed["imports"].get(head.split(".")[0])
+        if source is None:
+            return None
+        target = ".".join([source[0], source[1]] + head.split(".")[1:])
+        return self.find(target, attr)
+
+    def tokens(self, module: str, name: str) -> Tokenize:
+        """Fields in the ``Tokenize`` format the stubs use"""
+        tokens = Tokenize("")
+        tokens.properties.update(self.fields(module, name))
+        return tokens
+
+    def save(self) -> None:
+        """Write the cache when a file was parsed again"""
+        if self.cache_path is None or not self.changed:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Process pool workers write concurrently, readers never see a partial file
+        fd, temp = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump({"version": self.VERSION, "files": self.files}, file)
+        os.replace(temp, self.cache_path)
+        self.changed = False
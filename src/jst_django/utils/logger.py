@@ -1,17 +1,86 @@
 """Logging configuration for jst-django."""
 
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
-from typing import Optional
+from datetime import datetime, timezone
+from logging import FileHandler
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import List, Optional, Union
+from uuid import uuid4
 
 import colorlog
 
 
+class _QueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records never leave the process, so message and traceback are
+        # formatted by the listener instead of the emitting thread
+        return record
+
+
+class _StdoutHandler(colorlog.StreamHandler):
+    """Stream handler writing to the current ``sys.stdout``.
+
+    rich redirects stdout while a progress display is live; resolving the
+    stream per record routes log lines above the display instead of through it.
+    """
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, for log files read by tools."""
+
+    def __init__(self, run_id: str) -> None:
+        super().__init__()
+        self.run_id = run_id
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "elapsed": round(record.relativeCreated / 1000, 4),
+            "level": record.levelname,
+            "run_id": getattr(record, "run_id", self.run_id),
+            "logger": record.name,
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "process": record.process,
+            "message": record.getMessage(),
+        }
+        if hasattr(record, "duration"):
+            data["duration"] = record.duration
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
 class Logger:
-    """Centralized logger for jst-django."""
+    """
+    Centralized logger for jst-django.
+
+    Emitting a record only puts it on a queue; a listener thread formats it
+    and writes it to the console and the optional JSON lines file, so hot
+    loops and progress displays are not slowed down by terminal output.
+    """
 
     _instance: Optional["Logger"] = None
     _logger: Optional[logging.Logger] = None
+    _listener: Optional[QueueListener] = None
+    _handlers: List[logging.Handler] = []
 
     def __new__(cls):
         if cls._instance is None:
@@ -30,6 +99,7 @@ class Logger:
             name: Logger name
             level: Logging level
         """
+        self.run_id = uuid4().hex
         self._logger = logging.getLogger(name)
         self._logger.setLevel(level)
 
@@ -38,7 +108,7 @@ class Logger:
             return
 
         # Console handler with colors
-        handler = colorlog.StreamHandler(sys.stdout)
+        handler = _StdoutHandler()
         handler.setFormatter(
             colorlog.ColoredFormatter(
                 "%(log_color)s%(levelname)-8s%(reset)s %(blue)s%(message)s",
@@ -55,7 +125,68 @@ class Logger:
                 style="%",
             )
         )
-        self._logger.addHandler(handler)
+        handler.setLevel(level)
+        self._handlers = [handler]
+        self._queue_handler = _QueueHandler(queue.SimpleQueue())
+        self._logger.addHandler(self._queue_handler)
+        self._start_listener()
+        atexit.register(self.flush)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _start_listener(self) -> None:
+        self._listener = QueueListener(self._queue_handler.queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+
+    def _after_fork(self) -> None:
+        """Worker processes get a queue and listener thread of their own"""
+        self._queue_handler.queue = queue.SimpleQueue()
+        self._start_listener()
+        try:
+            from multiprocessing.util import Finalize
+
+            # Pool workers leave through os._exit, which skips atexit
+            Finalize(self, self.flush, exitpriority=100)
+        except ImportError:  # pragma: no cover
+            pass
+
+    def flush(self) -> None:
+        """Write every queued record, e.g. before the process exits"""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for handler in self._handlers:
+            handler.flush()
+        self._start_listener()
+
+    def add_file_sink(self, path: Union[str, Path], level: int = logging.DEBUG) -> Path:
+        """
+        Also write records as JSON lines.
+
+        Args:
+            path: Log file, appended to
+            level: Minimum level written to the file
+
+        Returns:
+            Log file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = FileHandler(path, encoding="utf-8")
+        handler.setLevel(level)
+        handler.setFormatter(JsonFormatter(self.run_id))
+        self._listener.stop()
+        self._handlers.append(handler)
+        self._start_listener()
+        self._update_level()
+        return path
+
+    def set_run_id(self, run_id: str) -> None:
+        """Tag following records with the run ID of a command, e.g. a translate report"""
+        self.run_id = run_id
+        for handler in self._handlers:
+            if isinstance(handler.formatter, JsonFormatter):
+                handler.formatter.run_id = run_id
 
     def get_logger(self) -> logging.Logger:
         """
@@ -68,27 +199,31 @@ class Logger:
 
     def debug(self, message: str, *args, **kwargs) -> None:
         """Log debug message."""
-        self._logger.debug(message, *args, **kwargs)
+        self._logger.debug(message, *args, **{"stacklevel": 2, **kwargs})
 
     def info(self, message: str, *args, **kwargs) -> None:
         """Log info message."""
-        self._logger.info(message, *args, **kwargs)
+        self._logger.info(message, *args, **{"stacklevel": 2, **kwargs})
 
     def warning(self, message: str, *args, **kwargs) -> None:
         """Log warning message."""
-        self._logger.warning(message, *args, **kwargs)
+        self._logger.warning(message, *args, **{"stacklevel": 2, **kwargs})
 
     def error(self, message: str, *args, **kwargs) -> None:
         """Log error message."""
-        self._logger.error(message, *args, **kwargs)
+        self._logger.error(message, *args, **{"stacklevel": 2, **kwargs})
 
     def critical(self, message: str, *args, **kwargs) -> None:
         """Log critical message."""
-        self._logger.critical(message, *args, **kwargs)
+        self._logger.critical(message, *args, **{"stacklevel": 2, **kwargs})
 
     def exception(self, message: str, *args, exc_info=True, **kwargs) -> None:
         """Log exception with traceback."""
-        self._logger.exception(message, *args, exc_info=exc_info, **kwargs)
+        self._logger.exception(message, *args, exc_info=exc_info, **{"stacklevel": 2, **kwargs})
+
+    def is_enabled(self, level: int) -> bool:
+        """Check level before building an expensive message"""
+        return self._logger.isEnabledFor(level)
 
     def set_level(self, level: int) -> None:
         """
@@ -97,7 +232,16 @@ class Logger:
         Args:
             level: Logging level
         """
-        self._logger.setLevel(level)
+        if not self._handlers:
+            self._logger.setLevel(level)
+        for handler in self._handlers[:1]:
+            handler.setLevel(level)
+        self._update_level()
+
+    def _update_level(self) -> None:
+        # Records below every handler's level are dropped before formatting
+        if self._handlers:
+            self._logger.setLevel(min(handler.level for handler in self._handlers))
 
 
 # Global logger instance
@@ -0,0 +1,59 @@
+"""Three-way merge of project files."""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Tuple
+
+from jst_django.exceptions import FileOperationError
+
+
+def merge3(ours: bytes, base: bytes, theirs: bytes, labels: Tuple[str, str, str]) -> Tuple[bytes, bool]:
+    """
+    Merge two changes of one file, as ``git merge-file`` does.
+
+    Args:
+        ours: Current file of the project
+        base: File as the old template rendered it
+        theirs: File as the new template renders it
+        labels: Conflict marker labels of ours, base and theirs
+
+    Returns:
+        Merged content and whether it contains conflict markers
+
+    Raises:
+        FileOperationError: If git fails to merge
+    """
+    if ours == base or ours == theirs:
+        return theirs, False
+    if theirs == base:
+        return ours, False
+    if shutil.which("git") is None:
+        return _conflict(ours, theirs, labels), True
+    with tempfile.TemporaryDirectory() as temp:
+        paths = []
+        for name, content in zip(("ours", "base", "theirs"), (ours, base, theirs)):
+            paths.append(os.path.join(temp, name))
+            with open(paths[-1], "wb") as file:
+                file.write(content)
+        command = ["git", "merge-file", "-p"]
+        for label in labels:
+            command += ["-L", label]
+        result = subprocess.run(command + paths, capture_output=True)
+    # Exit code is the number of conflicts, negative on errors
+    if result.returncode < 0 or result.returncode > 127:
+        raise FileOperationError("git merge-file xatosi", details=result.stderr.decode(errors="replace"))
+    return result.stdout, result.returncode > 0
+
+
+def _conflict(ours: bytes, theirs: bytes, labels: Tuple[str, str, str]) -> bytes:
+    """Whole file conflict, used when git is not installed"""
+    lines = [b"<<<<<<< " + labels[0].encode() + b"\n", ours]
+    if not ours.endswith(b"\n"):
+        lines.append(b"\n")
+    lines += [b"=======\n", theirs]
+    if not theirs.endswith(b"\n"):
+        lines.append(b"\n")
+    lines.append(b">>>>>>> " + labels[2].encode() + b"\n")
+    return b"".join(lines)
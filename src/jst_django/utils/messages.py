@@ -0,0 +1,439 @@
+"""Native gettext message extraction for Python sources and Django templates."""
+
+import ast
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import polib
+
+# function -> (context argument, message argument, plural argument)
+KEYWORDS: Dict[str, Tuple[Optional[int], int, Optional[int]]] = {
+    "_": (None, 0, None),
+    "gettext": (None, 0, None),
+    "gettext_lazy": (None, 0, None),
+    "gettext_noop": (None, 0, None),
+    "ugettext": (None, 0, None),
+    "ugettext_lazy": (None, 0, None),
+    "ngettext": (None, 0, 1),
+    "ngettext_lazy": (None, 0, 1),
+    "ungettext": (None, 0, 1),
+    "ungettext_lazy": (None, 0, 1),
+    "pgettext": (0, 1, None),
+    "pgettext_lazy": (0, 1, None),
+    "npgettext": (0, 1, 2),
+    "npgettext_lazy": (0, 1, 2),
+}
+TEMPLATE_EXTENSIONS = (".html", ".txt")
+DEFAULT_IGNORE = [".*", "__pycache__", "node_modules", "venv", "env", "locale", "migrations", "*.pyc", "*~"]
+# Files per worker task, small trees are extracted in-process
+CHUNK_SIZE = 16
+PYTHON_FORMAT = re.compile(r"%(\(\w+\))?[-#0 +]*\d*(\.\d+)?[sdiouxXeEfFgGcr]")
+
+# Django plural forms of the languages the translate command supports
+PLURAL_FORMS = {
+    "uz": "nplurals=1; plural=0;",
+    "ru": (
+        "nplurals=4; plural=(n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 && (n%100<12 || n%100>=14) ? 1 : "
+        "n%10==0 || (n%10>=5 && n%10<=9) || (n%100>=11 && n%100<=14)? 2 : 3);"
+    ),
+    "en": "nplurals=2; plural=(n != 1);",
+}
+
+
+class Message(NamedTuple):
+    """Translatable string found in a source file."""
+
+    msgctxt: Optional[str]
+    msgid: str
+    msgid_plural: Optional[str]
+    line: int
+
+    @property
+    def key(self) -> Tuple[Optional[str], str]:
+        return self.msgctxt, self.msgid
+
+
+def _aliases(tree: ast.AST) -> Dict[str, str]:
+    """Local names of gettext functions, e.g. ``gettext_lazy as _``"""
+    aliases = {name: name for name in KEYWORDS}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.endswith("translation"):
+            for alias in node.names:
+                if alias.name in KEYWORDS:
+                    aliases[alias.asname or alias.name] = alias.name
+    return aliases
+
+
+def _string(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def extract_python(source: str) -> List[Message]:
+    """
+    Extract messages from Python source.
+
+    Only calls with literal arguments are extracted, same as xgettext.
+
+    Args:
+        source: Python source code
+
+    Returns:
+        Messages in source order
+    """
+    tree = ast.parse(source)
+    aliases = _aliases(tree)
+    messages = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else func.attr if isinstance(func, ast.Attribute) else None
+        if name not in aliases:
+            continue
+        context, msgid, plural = KEYWORDS[aliases[name]]
+        args = [_string(arg) for arg in node.args]
+        if len(args) <= max(index for index in (context, msgid, plural) if index is not None):
+            continue
+        values = [args[index] if index is not None else None for index in (context, msgid, plural)]
+        if values[1] is None or (context is not None and values[0] is None) or (plural is not None and not values[2]):
+            continue
+        messages.append(Message(values[0], values[1], values[2], node.lineno))
+    return sorted(messages, key=lambda message: message.line)
+
+
+STRING = r"""(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')"""
+TRANS_TAG = re.compile(
+    r"{%\s*(?:trans|translate)\s+(?P<msgid>" + STRING + r")(?:[^%]*?\bcontext\s+(?P<context>" + STRING + r"))?[^%]*%}"
+)
+BLOCK_TAG = re.compile(
+    r"{%\s*(?:blocktrans|blocktranslate)(?P<options>[^%]*)%}(?P<body>.*?)"
+    r"(?:{%\s*plural\s*%}(?P<plural>.*?))?{%\s*(?:endblocktrans|endblocktranslate)\s*%}",
+    re.DOTALL,
+)
+FUNCTION_CALL = re.compile(r"\b_\(\s*(?P<msgid>" + STRING + r")\s*\)")
+VARIABLE = re.compile(r"{{\s*([\w.]+)(?:\|[^}]*)?\s*}}")
+
+
+def _literal(value: str) -> str:
+    return ast.literal_eval(value)
+
+
+def _block(text: str, trimmed: bool) -> str:
+    """Body of a blocktrans tag in the form Django looks it up"""
+    if trimmed:
+        text = " ".join(line.strip() for line in text.strip().splitlines() if line.strip())
+    return VARIABLE.sub(lambda match: "%(" + match.group(1).split(".")[-1] + ")s", text.replace("%", "%%"))
+
+
+def extract_template(source: str) -> List[Message]:
+    """
+    Extract messages from a Django template.
+
+    Supports ``{% trans %}``/``{% translate %}`` with context,
+    ``{% blocktrans %}``/``{% blocktranslate %}`` with ``trimmed``, context
+    and plural, and ``_("...")`` in variables and tag arguments.
+
+    Args:
+        source: Template source
+
+    Returns:
+        Messages in source order
+    """
+    messages = []
+
+    def line(match: re.Match) -> int:
+        return source.count("\n", 0, match.start()) + 1
+
+    for match in TRANS_TAG.finditer(source):
+        context = _literal(match.group("context")) if match.group("context") else None
+        messages.append(Message(context, _literal(match.group("msgid")), None, line(match)))
+    for match in BLOCK_TAG.finditer(source):
+        options = match.group("options")
+        trimmed = re.search(r"\btrimmed\b", options) is not None
+        context = re.search(r"\bcontext\s+(" + STRING + ")", options)
+        plural = match.group("plural")
+        messages.append(
+            Message(
+                _literal(context.group(1)) if context else None,
+                _block(match.group("body"), trimmed),
+                _block(plural, trimmed) if plural is not None else None,
+                line(match),
+            )
+        )
+    for match in FUNCTION_CALL.finditer(source):
+        messages.append(Message(None, _literal(match.group("msgid")), None, line(match)))
+    return sorted(messages, key=lambda message: message.line)
+
+
+def extract_file(path: str, known_hash: Optional[str] = None) -> Tuple[str, str, Optional[List[Message]]]:
+    """
+    Hash and extract a single file, runs in worker processes.
+
+    Args:
+        path: Source file
+        known_hash: Hash of the cached extraction
+
+    Returns:
+        ``(path, sha256, messages)``, messages are ``None`` when the hash
+        matches ``known_hash`` and the cached extraction is still valid
+    """
+    with open(path, "rb") as file:
+        content = file.read()
+    digest = hashlib.sha256(content).hexdigest()
+    if digest == known_hash:
+        return path, digest, None
+    source = content.decode("utf-8", errors="replace")
+    try:
+        messages = extract_python(source) if path.endswith(".py") else extract_template(source)
+    except (SyntaxError, ValueError):
+        messages = []
+    return path, digest, messages
+
+
+def _extract_chunk(chunk: List[Tuple[str, Optional[str]]]) -> List[Tuple[str, str, Optional[List[Message]]]]:
+    return [extract_file(path, known_hash) for path, known_hash in chunk]
+
+
+def iter_sources(root: Union[str, Path], ignore: Iterable[str] = DEFAULT_IGNORE) -> Iterator[str]:
+    """Python and template files under ``root``, relative and sorted, ignored patterns pruned"""
+    ignore = list(ignore)
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(name for name in dirs if not any(fnmatch(name, pattern) for pattern in ignore))
+        for name in sorted(files):
+            if not name.endswith((".py",) + TEMPLATE_EXTENSIONS) or any(fnmatch(name, pattern) for pattern in ignore):
+                continue
+            yield os.path.relpath(os.path.join(directory, name), root).replace(os.sep, "/")
+
+
+class ExtractionCache:
+    """
+    Extraction results per source file, stored in the project state dir.
+
+    Files whose size and mtime did not change are not read at all, files
+    with a new mtime are re-hashed and only re-extracted when the content
+    actually changed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.files: Dict[str, dict] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") == self.VERSION:
+                self.files = data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def fresh(self, path: str, stat: os.stat_result) -> bool:
+        entry = self.files.get(path)
+        return entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+
+    def messages(self, path: str) -> List[Message]:
+        return [Message(*message) for message in self.files[path]["messages"]]
+
+    def update(self, path: str, stat: os.stat_result, digest: str, messages: Optional[List[Message]]) -> None:
+        if messages is None:
+            messages = self.messages(path)
+        self.files[path] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "messages": [list(message) for message in messages],
+        }
+
+    def save(self, paths: Iterable[str]) -> None:
+        """Write cache, dropping files that no longer exist"""
+        keep = set(paths)
+        self.files = {path: entry for path, entry in self.files.items() if path in keep}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"version": self.VERSION, "files": self.files}, file, ensure_ascii=False)
+
+
+def extract(
+    root: Union[str, Path],
+    cache: ExtractionCache,
+    ignore: Iterable[str] = DEFAULT_IGNORE,
+    jobs: Optional[int] = None,
+) -> Tuple[Dict[str, List[Message]], int]:
+    """
+    Extract messages of every source file under ``root``.
+
+    Args:
+        root: Project root, occurrences are relative to it
+        cache: Extraction cache, updated in place
+        ignore: File and directory name patterns to skip
+        jobs: Worker processes, defaults to CPU count
+
+    Returns:
+        Messages per file and number of files that were re-extracted
+    """
+    paths = list(iter_sources(root, ignore))
+    stats = {path: os.stat(os.path.join(root, path)) for path in paths}
+    stale = [path for path in paths if not cache.fresh(path, stats[path])]
+    tasks = [(os.path.join(root, path), cache.files.get(path, {}).get("sha256")) for path in stale]
+    chunks = [tasks[index : index + CHUNK_SIZE] for index in range(0, len(tasks), CHUNK_SIZE)]
+    workers = min(jobs or os.cpu_count() or 1, len(chunks))
+    if workers <= 1:
+        results = [_extract_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_extract_chunk, chunks))
+    extracted = 0
+    for path, (_, digest, messages) in zip(stale, (result for chunk in results for result in chunk)):
+        cache.update(path, stats[path], digest, messages)
+        extracted += messages is not None
+    cache.save(paths)
+    return {path: cache.messages(path) for path in paths}, extracted
+
+
+def merge_catalog(path: Union[str, Path], files: Dict[str, List[Message]], language: str) -> bool:
+    """
+    Merge extracted messages into a catalog, like ``msgmerge``.
+
+    Entries follow extraction order, existing translations and flags are
+    kept, messages that disappeared become obsolete.
+
+    Args:
+        path: ``django.po`` path, created if missing
+        files: Messages per source file
+        language: Catalog language code
+
+    Returns:
+        Whether the catalog file changed
+    """
+    path = Path(path)
+    old = polib.pofile(str(path)) if path.exists() else None
+    existing = {(entry.msgctxt, entry.msgid): entry for entry in old or [] if not entry.obsolete}
+    obsolete = {(entry.msgctxt, entry.msgid): entry for entry in old.obsolete_entries()} if old else {}
+    metadata = dict(old.metadata) if old else _metadata(language)
+    nplurals = _nplurals(metadata.get("Plural-Forms"))
+
+    catalog = polib.POFile(wrapwidth=78)
+    entries: Dict[Tuple[Optional[str], str], polib.POEntry] = {}
+    for source, messages in files.items():
+        for message in messages:
+            entry = entries.get(message.key)
+            if entry is None:
+                entry = entries[message.key] = _entry(message, existing.get(message.key) or obsolete.get(message.key))
+                catalog.append(entry)
+            if message.msgid_plural and entry.msgid_plural is None:
+                entry.msgid_plural = message.msgid_plural
+            entry.occurrences.append((source, str(message.line)))
+    for entry in catalog:
+        _normalize(entry, nplurals)
+    for key, entry in {**obsolete, **existing}.items():
+        if key not in entries and entry.msgid != "":
+            entry.obsolete = True
+            entry.occurrences = []
+            catalog.append(entry)
+
+    catalog.header = old.header if old else "SOME DESCRIPTIVE TITLE."
+    catalog.metadata = metadata
+    if old is not None and catalog.__unicode__() == old.__unicode__():
+        return False
+    catalog.metadata["POT-Creation-Date"] = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M%z")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    catalog.save(str(path))
+    return True
+
+
+def _entry(message: Message, previous: Optional[polib.POEntry]) -> polib.POEntry:
+    entry = polib.POEntry(msgctxt=message.msgctxt, msgid=message.msgid, msgid_plural=message.msgid_plural)
+    if previous is not None:
+        entry.msgstr = previous.msgstr
+        entry.msgstr_plural = dict(previous.msgstr_plural)
+        entry.flags = [flag for flag in previous.flags if flag != "python-format"]
+        entry.comment = previous.comment
+        entry.tcomment = previous.tcomment
+    return entry
+
+
+def find_catalogs(root: Union[str, Path], locale: str, apps: str) -> List[Path]:
+    """
+    ``.po`` files of the project locale dir and of every app's ``locale`` dir.
+
+    Args:
+        root: Project root
+        locale: Project locale dir, ``dirs.locale``
+        apps: Apps dir, ``dirs.apps``
+
+    Returns:
+        Sorted catalog paths
+    """
+    root = Path(root)
+    catalogs = set((root / locale).glob("*/LC_MESSAGES/*.po"))
+    catalogs.update((root / apps).glob("*/locale/*/LC_MESSAGES/*.po"))
+    return sorted(catalogs)
+
+
+def compile_catalog(path: Union[str, Path]) -> Path:
+    """
+    Compile catalog to ``.mo`` next to it, same entries as ``msgfmt``.
+
+    Fuzzy, obsolete and untranslated entries are left out. The ``.mo`` file is
+    replaced atomically, so a running server never reads a partial file.
+
+    Args:
+        path: ``.po`` file
+
+    Returns:
+        ``.mo`` file path
+    """
+    path = Path(path)
+    target = path.with_suffix(".mo")
+    fd, temp_path = tempfile.mkstemp(prefix=f".{target.name}.", dir=path.parent)
+    os.close(fd)
+    try:
+        polib.pofile(str(path)).save_as_mofile(temp_path)
+        if target.exists():
+            shutil.copymode(target, temp_path)
+        else:
+            os.chmod(temp_path, 0o644)
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return target
+
+
+def _normalize(entry: polib.POEntry, nplurals: int) -> None:
+    if entry.msgid_plural and not entry.msgstr_plural:
+        entry.msgstr_plural = {index: "" for index in range(nplurals)}
+    if PYTHON_FORMAT.search(entry.msgid) and "python-format" not in entry.flags:
+        entry.flags.append("python-format")
+
+
+def _nplurals(plural_forms: Optional[str]) -> int:
+    match = re.search(r"nplurals\s*=\s*(\d+)", plural_forms or "")
+    return int(match.group(1)) if match else 2
+
+
+def _metadata(language: str) -> Dict[str, str]:
+    return {
+        "Project-Id-Version": "PACKAGE VERSION",
+        "Report-Msgid-Bugs-To": "",
+        "POT-Creation-Date": "",
+        "PO-Revision-Date": "YEAR-MO-DA HO:MI+ZONE",
+        "Last-Translator": "FULL NAME <EMAIL@ADDRESS>",
+        "Language-Team": "LANGUAGE <LL@li.org>",
+        "Language": language,
+        "MIME-Version": "1.0",
+        "Content-Type": "text/plain; charset=UTF-8",
+        "Content-Transfer-Encoding": "8bit",
+        "Plural-Forms": PLURAL_FORMS.get(language.split("_")[0], PLURAL_FORMS["en"]),
+    }
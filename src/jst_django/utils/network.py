@@ -0,0 +1,33 @@
+"""Offline mode shared by every network consumer."""
+
+import os
+
+from jst_django.constants import OFFLINE_ENV
+from jst_django.exceptions import OfflineError
+
+
+def is_offline() -> bool:
+    """``--offline`` or ``JST_OFFLINE`` is set"""
+    return os.environ.get(OFFLINE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def set_offline(offline: bool = True) -> None:
+    """Switch offline mode for this process and the workers it starts"""
+    os.environ[OFFLINE_ENV] = "1" if offline else "0"
+
+
+def require_network(resource: str) -> None:
+    """
+    Fail at once in offline mode instead of waiting for a timeout.
+
+    Args:
+        resource: Cache entry the caller could not serve, named in the error
+
+    Raises:
+        OfflineError: If offline mode is on
+    """
+    if is_offline():
+        raise OfflineError(
+            f"Offline rejim: keshda yo'q: {resource}",
+            details="Internet bor joyda `jst prefetch` bilan keshni to'ldiring",
+        )
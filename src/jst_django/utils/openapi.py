@@ -0,0 +1,465 @@
+"""Model fields from OpenAPI and JSON Schema documents."""
+
+import json
+import re
+from collections import Counter
+from keyword import iskeyword
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import unquote
+
+import yaml
+
+from jst_django.exceptions import FileOperationError, ValidationError
+from jst_django.utils.logger import logger
+from jst_django.utils.tokenize import Tokenize
+
+# Where each document flavour keeps its named schemas
+SCHEMA_POINTERS = [("components", "schemas"), ("definitions",), ("$defs",)]
+
+STRING_FORMATS = {
+    "date": 'models.DateField(verbose_name=_("{field}"){options})',
+    "date-time": 'models.DateTimeField(verbose_name=_("{field}"){options})',
+    "time": 'models.TimeField(verbose_name=_("{field}"){options})',
+    "email": 'models.EmailField(verbose_name=_("{field}"){options})',
+    "uri": 'models.URLField(verbose_name=_("{field}"){options})',
+    "url": 'models.URLField(verbose_name=_("{field}"){options})',
+    "uuid": 'models.UUIDField(verbose_name=_("{field}"){options})',
+    "binary": 'models.FileField(verbose_name=_("{field}"), upload_to="{field}s"{options})',
+    "byte": 'models.TextField(verbose_name=_("{field}"){options})',
+}
+
+
+class ModelSchema(NamedTuple):
+    """Schema turned into generator input."""
+
+    name: str
+    schema: str
+    fields: Tokenize
+
+
+def model_name(schema: str) -> str:
+    """Generator name of a schema, ``BlogPost`` becomes ``blogpost``"""
+    return re.sub(r"[^0-9a-zA-Z]", "", schema).lower()
+
+
+def _literal(value: Any) -> str:
+    """Python literal with double quoted strings, as black writes them"""
+    return json.dumps(value, ensure_ascii=False) if isinstance(value, str) else repr(value)
+
+
+def attribute_name(field: str) -> str:
+    """
+    Model attribute of a property, valid Python and accepted by Django.
+
+    ``first-name`` and ``firstName`` become ``first_name``, keywords get a
+    ``_field`` suffix since Django rejects names ending with ``_``.
+    """
+    if field.isidentifier() and not iskeyword(field) and not field.endswith("_") and "__" not in field:
+        return field
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", field)
+    name = re.sub(r"[^0-9a-zA-Z]+", "_", name).strip("_").lower()
+    if name == "" or name[0].isdigit():
+        name = f"field_{name}".rstrip("_")
+    return f"{name}_field" if iskeyword(name) else name
+
+
+def model_class(schema: str) -> str:
+    """Class the generator renders for a schema"""
+    return model_name(schema).capitalize() + "Model"
+
+
+class RefResolver:
+    """
+    ``$ref`` resolver with a document cache.
+
+    Every referenced document is read and parsed once, whatever the number
+    of schemas pointing into it, and every ``$ref`` is resolved once.
+    """
+
+    def __init__(self) -> None:
+        self.documents: Dict[Path, Any] = {}
+        self.resolved: Dict[Tuple[Path, str], Tuple[Any, Path, str]] = {}
+
+    def document(self, path: Path) -> Any:
+        """
+        Parsed JSON or YAML document.
+
+        Args:
+            path: Absolute document path
+
+        Returns:
+            Document content
+
+        Raises:
+            FileOperationError: If the document can not be read
+            ValidationError: If the document is not valid JSON or YAML
+        """
+        if path not in self.documents:
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    if path.suffix in (".yaml", ".yml"):
+                        self.documents[path] = yaml.safe_load(file)
+                    else:
+                        self.documents[path] = json.load(file)
+            except OSError as e:
+                raise FileOperationError(f"Spec o'qilmadi: {path}", details=str(e))
+            except (ValueError, yaml.YAMLError) as e:
+                raise ValidationError(f"Spec noto'g'ri: {path}", details=str(e))
+        return self.documents[path]
+
+    def resolve(self, ref: str, base: Path) -> Tuple[Any, Path, str]:
+        """
+        Follow a ``$ref``, including chains of references.
+
+        Args:
+            ref: Reference, ``#/components/schemas/Post`` or ``common.yaml#/Post``
+            base: Document the reference appears in
+
+        Returns:
+            Target schema, its document and the name of the last pointer segment
+
+        Raises:
+            ValidationError: If the reference is remote, broken or circular
+        """
+        seen: Set[Tuple[Path, str]] = set()
+        while True:
+            if ref.startswith(("http://", "https://")):
+                raise ValidationError(f"Tashqi $ref qo'llab-quvvatlanmaydi: {ref}")
+            location, _, pointer = ref.partition("#")
+            path = (base.parent / location).resolve() if location else base
+            key = (path, pointer)
+            if key in self.resolved:
+                return self.resolved[key]
+            if key in seen:
+                raise ValidationError(f"$ref sikl hosil qiladi: {ref}")
+            seen.add(key)
+            target = self._pointer(self.document(path), pointer, ref)
+            name = unquote(pointer.rsplit("/", 1)[-1]) or path.stem
+            if isinstance(target, dict) and "$ref" in target:
+                ref, base = target["$ref"], path
+                continue
+            for item in seen:
+                self.resolved[item] = (target, path, name)
+            return target, path, name
+
+    @staticmethod
+    def _pointer(document: Any, pointer: str, ref: str) -> Any:
+        target = document
+        for part in [part for part in pointer.split("/") if part]:
+            part = unquote(part).replace("~1", "/").replace("~0", "~")
+            try:
+                target = target[int(part)] if isinstance(target, list) else target[part]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ValidationError(f"$ref topilmadi: {ref}")
+        return target
+
+
+class OpenAPIParser:
+    """
+    Turn the named schemas of a spec into model fields.
+
+    Object schemas become models. ``$ref`` to another generated object schema
+    becomes a ``ForeignKey``, an array of them a ``ManyToManyField``; object
+    schemas that are not generated, from another document or left out by
+    ``only``, are stored in a ``JSONField``. References to enum or scalar
+    schemas are inlined. ``readOnly`` properties are left to ``AbstractBaseModel``.
+    """
+
+    def __init__(self, path: str, resolver: Optional[RefResolver] = None) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            path: OpenAPI 3, Swagger 2 or JSON Schema document
+            resolver: Shared resolver, a new one by default
+        """
+        self.path = Path(path).resolve()
+        self.resolver = resolver or RefResolver()
+        # Schema names kept by ``models``, all when None
+        self.only: Optional[Set[str]] = None
+        # Resolved reference target -> schema generated for it, relations may only point to them
+        self.targets: Dict[int, Optional[str]] = {}
+        self.skipped: Set[str] = set()
+
+    def schemas(self) -> Iterator[Tuple[str, Any]]:
+        """Named schemas of the document in document order"""
+        yield from self.named().items()
+
+    def named(self) -> Dict[str, Any]:
+        """Schema name -> schema of the document"""
+        document = self.resolver.document(self.path)
+        for pointer in SCHEMA_POINTERS:
+            schemas = document
+            for part in pointer:
+                schemas = schemas.get(part) if isinstance(schemas, dict) else None
+            if isinstance(schemas, dict):
+                return schemas
+        raise ValidationError(
+            f"Sxemalar topilmadi: {self.path.name}", details="components.schemas, definitions yoki $defs kerak"
+        )
+
+    def models(self, only: Optional[List[str]] = None) -> Iterator[ModelSchema]:
+        """
+        Models of the document, one at a time.
+
+        Args:
+            only: Schema names to keep, all object schemas by default
+
+        Yields:
+            Generator name, schema name and fields of every model
+
+        Raises:
+            ValidationError: If two schemas share a generator name or a reference is broken
+        """
+        self.only = set(only) if only else None
+        self.targets = {}
+        names: Dict[str, str] = {}
+        for schema_name, schema in self.schemas():
+            if not self.generated(schema_name, schema):
+                continue
+            name = model_name(schema_name)
+            if name in names:
+                raise ValidationError(f"Sxema nomlari to'qnashdi: {names[name]}, {schema_name}", details=name)
+            names[name] = schema_name
+            yield ModelSchema(name, schema_name, self.fields(name, schema))
+
+    def generated(self, schema_name: str, schema: Any) -> bool:
+        """Named schema of the document is turned into a model"""
+        return (self.only is None or schema_name in self.only) and self.is_model(schema, self.path)
+
+    def target_schema(self, target: Any, name: str) -> Optional[str]:
+        """
+        Generated schema a reference resolves to.
+
+        Args:
+            target: Resolved object schema
+            name: Last pointer segment of the reference
+
+        Returns:
+            Schema name, None when the target is not generated
+        """
+        key = id(target)
+        if key in self.targets:
+            return self.targets[key]
+        schemas = self.named()
+        self.targets[key] = None
+        if schemas.get(name) is target and self.generated(name, target):
+            self.targets[key] = name
+            return name
+        # An alias of another schema is reached through references to its target
+        for schema_name, schema in schemas.items():
+            if not isinstance(schema, dict) or "$ref" not in schema or not self.generated(schema_name, schema):
+                continue
+            if self.resolver.resolve(schema["$ref"], self.path)[0] is target:
+                self.targets[key] = schema_name
+                break
+        return self.targets[key]
+
+    def is_model(self, schema: Any, base: Path, seen: Optional[Set[int]] = None) -> bool:
+        """Object schema with properties, ``allOf`` members that include each other are visited once"""
+        if not isinstance(schema, dict):
+            return False
+        if "$ref" in schema:
+            schema, base, _ = self.resolver.resolve(schema["$ref"], base)
+        seen = set() if seen is None else seen
+        if not isinstance(schema, dict) or id(schema) in seen:
+            return False
+        seen.add(id(schema))
+        return "properties" in schema or any(self.is_model(item, base, seen) for item in schema.get("allOf", []))
+
+    def properties(
+        self, schema: Any, base: Path, seen: Optional[Set[int]] = None
+    ) -> Tuple[List[Tuple[str, Any, Path]], Set[str]]:
+        """
+        Properties of an object schema, ``allOf`` members merged.
+
+        Args:
+            schema: Object schema
+            base: Document of the schema, property references are relative to it
+            seen: Schemas merged so far, a member including its parent adds nothing
+
+        Returns:
+            Properties with their documents and required property names
+        """
+        if "$ref" in schema:
+            schema, base, _ = self.resolver.resolve(schema["$ref"], base)
+        seen = set() if seen is None else seen
+        if not isinstance(schema, dict) or id(schema) in seen:
+            return [], set()
+        seen.add(id(schema))
+        properties: Dict[str, Tuple[Any, Path]] = {}
+        required = set(schema.get("required", []))
+        for item in schema.get("allOf", []):
+            items, item_required = self.properties(item, base, seen)
+            properties.update({name: (value, path) for name, value, path in items})
+            required |= item_required
+        for name, value in schema.get("properties", {}).items():
+            properties[name] = (value, base)
+        return [(name, value, path) for name, (value, path) in properties.items()], required
+
+    def fields(self, name: str, schema: Any) -> Tokenize:
+        """
+        Model fields of a schema in the ``Tokenize`` format the stubs use.
+
+        Args:
+            name: Generator name of the model
+            schema: Object schema
+
+        Returns:
+            Fields of the model
+
+        Raises:
+            ValidationError: If two properties map to one attribute name
+        """
+        tokens = Tokenize("")
+        properties, required = self.properties(schema, self.path)
+        targets = Counter(self._target(value, path) for _, value, path in properties)
+        fields: Dict[str, str] = {}
+        for field, value, path in properties:
+            if field == "id" or isinstance(value, dict) and value.get("readOnly"):
+                continue
+            attribute = attribute_name(field)
+            if attribute in fields:
+                raise ValidationError(
+                    f"'{name}' sxemasida maydon nomlari to'qnashdi: {fields[attribute]}, {field}", details=attribute
+                )
+            fields[attribute] = field
+            related_name = None
+            target = self._target(value, path)
+            if target is not None and targets[target] > 1:
+                # Reverse accessors of two relations to one model would clash
+                related_name = f"{name}_{attribute}"
+            column = None if attribute == field else field
+            tokens.properties[attribute] = self.field(field, value, path, field in required, related_name, column)
+        return tokens
+
+    def field(
+        self,
+        field: str,
+        schema: Any,
+        base: Path,
+        required: bool = True,
+        related_name: Optional[str] = None,
+        column: Optional[str] = None,
+    ) -> str:
+        """
+        Django field of one property.
+
+        Args:
+            field: Property name
+            schema: Property schema
+            base: Document of the property
+            required: Listed in ``required``
+            related_name: Reverse accessor of a relation
+            column: Database column, set when the property name is not a valid attribute
+
+        Returns:
+            Field expression, ``models.CharField(...)``
+        """
+        schema, base, target = self._unwrap(schema, base)
+        nullable = not required or self._nullable(schema)
+        options = "" if related_name is None else f', related_name="{related_name}"'
+        db_column = "" if column is None else f", db_column={_literal(column)}"
+        if target is not None:
+            options += db_column
+            if nullable:
+                return (
+                    f'models.ForeignKey("{target}", verbose_name=_("{field}"), on_delete=models.SET_NULL'
+                    f"{options}, null=True, blank=True)"
+                )
+            return f'models.ForeignKey("{target}", verbose_name=_("{field}"), on_delete=models.CASCADE{options})'
+        kind = self._type(schema)
+        if kind == "array":
+            _, _, item_target = self._unwrap(schema.get("items", {}), base)
+            if item_target is not None:
+                return f'models.ManyToManyField("{item_target}", verbose_name=_("{field}"){options}, blank=True)'
+        options = db_column + self._options(schema, nullable)
+        if "enum" in schema:
+            return self._choices(field, schema, kind, options)
+        return self._scalar(field, schema, kind, options)
+
+    @staticmethod
+    def _scalar(field: str, schema: Any, kind: Optional[str], options: str) -> str:
+        if kind == "string":
+            if schema.get("format") in STRING_FORMATS:
+                return STRING_FORMATS[schema["format"]].format(field=field, options=options)
+            return f'models.CharField(verbose_name=_("{field}"), max_length={schema.get("maxLength", 255)}{options})'
+        if kind == "integer":
+            django_field = "BigIntegerField" if schema.get("format") == "int64" else "IntegerField"
+            return f'models.{django_field}(verbose_name=_("{field}"){options})'
+        if kind == "number":
+            if schema.get("format") == "decimal":
+                return f'models.DecimalField(verbose_name=_("{field}"), max_digits=20, decimal_places=2{options})'
+            return f'models.FloatField(verbose_name=_("{field}"){options})'
+        if kind == "boolean":
+            return f'models.BooleanField(verbose_name=_("{field}"){options})'
+        default = "list" if kind == "array" else "dict"
+        return f'models.JSONField(verbose_name=_("{field}"), default={default}{options})'
+
+    def _unwrap(self, schema: Any, base: Path) -> Tuple[Any, Path, Optional[str]]:
+        """Resolve a property reference, the model class when it points to a model"""
+        if not isinstance(schema, dict):
+            return {}, base, None
+        ref = schema.get("$ref")
+        # ``allOf: [{$ref}]`` and ``anyOf: [{$ref}, {type: null}]`` wrap a reference to add keywords
+        for keyword in ("allOf", "anyOf", "oneOf"):
+            items = [item for item in schema.get(keyword, []) if not self._is_null(item)]
+            if ref is None and len(items) == 1 and isinstance(items[0], dict) and "$ref" in items[0]:
+                ref = items[0]["$ref"]
+        if ref is None:
+            return schema, base, None
+        target, path, name = self.resolver.resolve(ref, base)
+        if self.is_model(target, path):
+            generated = self.target_schema(target, name)
+            if generated is not None:
+                return schema, base, model_class(generated)
+            if ref not in self.skipped:
+                self.skipped.add(ref)
+                logger.warning("%s sxemasi generatsiya qilinmaydi, JSONField ishlatiladi", ref)
+        siblings = {key: value for key, value in schema.items() if key not in ("$ref", "allOf", "anyOf", "oneOf")}
+        return {**target, **siblings}, path, None
+
+    @staticmethod
+    def _is_null(schema: Any) -> bool:
+        return isinstance(schema, dict) and schema.get("type") == "null"
+
+    def _nullable(self, schema: Any) -> bool:
+        if schema.get("nullable") is True:
+            return True
+        if isinstance(schema.get("type"), list) and "null" in schema["type"]:
+            return True
+        return any(self._is_null(item) for item in schema.get("anyOf", []) + schema.get("oneOf", []))
+
+    @staticmethod
+    def _type(schema: Any) -> Optional[str]:
+        kind = schema.get("type")
+        if isinstance(kind, list):
+            kind = next((item for item in kind if item != "null"), None)
+        if kind is None and "enum" in schema:
+            values = [value for value in schema["enum"] if value is not None]
+            kind = "integer" if values and all(isinstance(value, int) for value in values) else "string"
+        return kind
+
+    @staticmethod
+    def _options(schema: Any, nullable: bool) -> str:
+        options = ""
+        if "default" in schema and isinstance(schema["default"], (str, int, float, bool)):
+            options += f", default={_literal(schema['default'])}"
+        if nullable:
+            options += ", null=True, blank=True"
+        return options
+
+    def _choices(self, field: str, schema: Any, kind: Optional[str], options: str) -> str:
+        values = [value for value in schema["enum"] if value is not None]
+        choices = ", ".join(f"({_literal(value)}, {_literal(str(value))})" for value in values)
+        if kind == "integer":
+            return f'models.IntegerField(verbose_name=_("{field}"), choices=[{choices}]{options})'
+        max_length = max([len(str(value)) for value in values] + [schema.get("maxLength", 0), 1])
+        return f'models.CharField(verbose_name=_("{field}"), max_length={max_length}, choices=[{choices}]{options})'
+
+    def _target(self, schema: Any, base: Path) -> Optional[str]:
+        schema, base, target = self._unwrap(schema, base)
+        if target is None and self._type(schema) == "array":
+            return self._unwrap(schema.get("items", {}), base)[2]
+        return target
@@ -0,0 +1,229 @@
+"""Streaming reader/writer for gettext PO catalogs."""
+
+import os
+import shutil
+import tempfile
+import textwrap
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO, Deque, Dict, Iterator, List, Optional, Union
+
+from polib import escape, unescape
+
+WRAP_WIDTH = 78
+
+
+def format_field(name: str, value: str, wrapwidth: int = WRAP_WIDTH) -> List[str]:
+    """
+    Format PO field the same way ``polib`` saves it.
+
+    Args:
+        name: Field keyword, e.g. ``msgstr``
+        value: Unescaped field value
+        wrapwidth: Wrap width used by polib
+
+    Returns:
+        Field lines without line endings
+    """
+    lines = value.splitlines(True)
+    if len(lines) > 1:
+        lines = [""] + lines
+    else:
+        escaped = escape(value)
+        specialchars = sum(value.count(c) for c in ["\\", "\n", "\r", "\t", "\v", "\b", "\f", '"'])
+        if wrapwidth > 0 and len(value) > wrapwidth - (len(name) + 3) + specialchars:
+            lines = [""] + [
+                unescape(item)
+                for item in textwrap.wrap(escaped, wrapwidth - 2, drop_whitespace=False, break_long_words=False)
+            ]
+        else:
+            lines = [value]
+    return [f'{name} "{escape(lines[0])}"'] + [f'"{escape(line)}"' for line in lines[1:]]
+
+
+class POEntry:
+    """
+    Single catalog block.
+
+    Keeps the raw bytes of the block so untouched entries are written back
+    byte for byte, only entries whose ``msgstr`` was assigned are rebuilt.
+    """
+
+    def __init__(self, raw: List[bytes]) -> None:
+        self.raw = raw
+        self.msgctxt: Optional[str] = None
+        self.msgid: Optional[str] = None
+        self.msgid_plural: Optional[str] = None
+        self.flags: List[str] = []
+        self.obsolete = False
+        self.modified = False
+        self._msgstr = ""
+        self._msgstr_plural: Dict[str, str] = {}
+        # index range of msgstr lines inside ``raw``
+        self._msgstr_lines: Optional[range] = None
+        self._parse()
+
+    def _parse(self) -> None:
+        field = None
+        values: Dict[str, str] = {}
+        start = None
+        for index, line in enumerate(self.raw):
+            text = line.decode("utf-8", errors="replace").strip()
+            if text.startswith("#~"):
+                self.obsolete = True
+                continue
+            if text.startswith("#,"):
+                self.flags.extend(flag.strip() for flag in text[2:].split(",") if flag.strip())
+                continue
+            if text.startswith("#") or len(text) == 0:
+                continue
+            if text.startswith('"') and field is not None:
+                values[field] += unescape(text[1:-1])
+                continue
+            keyword, _, value = text.partition(" ")
+            field = keyword
+            values[field] = unescape(value.strip()[1:-1])
+            if keyword.startswith("msgstr") and start is None:
+                start = index
+        if start is not None:
+            self._msgstr_lines = range(start, self._field_end(start))
+        self.msgctxt = values.get("msgctxt")
+        self.msgid = values.get("msgid")
+        self.msgid_plural = values.get("msgid_plural")
+        self._msgstr = values.get("msgstr", "")
+        self._msgstr_plural = {key[7:-1]: value for key, value in values.items() if key.startswith("msgstr[")}
+
+    def _field_end(self, start: int) -> int:
+        end = start + 1
+        while end < len(self.raw):
+            text = self.raw[end].strip()
+            if not (text.startswith(b'"') or text.startswith(b"msgstr[")):
+                break
+            end += 1
+        return end
+
+    @property
+    def is_header(self) -> bool:
+        return self.msgid == "" and self.msgctxt is None
+
+    @property
+    def is_message(self) -> bool:
+        """Block is a live catalog message (not header, comment or obsolete entry)"""
+        return self.msgid is not None and not self.is_header and not self.obsolete
+
+    @property
+    def untranslated(self) -> bool:
+        """Message that can be translated: singular and with empty ``msgstr``"""
+        return self.is_message and self.msgid_plural is None and self._msgstr == ""
+
+    @property
+    def msgstr(self) -> str:
+        return self._msgstr
+
+    @msgstr.setter
+    def msgstr(self, value: str) -> None:
+        if value == self._msgstr:
+            return
+        self._msgstr = value
+        self.modified = True
+
+    def to_bytes(self) -> bytes:
+        if not self.modified or self._msgstr_lines is None:
+            return b"".join(self.raw)
+        first = self.raw[self._msgstr_lines.start]
+        newline = b"\r\n" if first.endswith(b"\r\n") else b"\n"
+        lines = [line.encode("utf-8") + newline for line in format_field("msgstr", self._msgstr)]
+        return b"".join(self.raw[: self._msgstr_lines.start] + lines + self.raw[self._msgstr_lines.stop :])
+
+
+def iter_entries(stream: BinaryIO) -> Iterator[Union[POEntry, bytes]]:
+    """
+    Lazily split catalog into entries.
+
+    Blank lines before a block are kept in the entry's raw bytes, trailing
+    blank lines at the end of the file are yielded as plain ``bytes``.
+    """
+    block: List[bytes] = []
+    content = False
+    for line in stream:
+        if len(line.strip()) == 0:
+            if content:
+                yield POEntry(block)
+                block, content = [], False
+            block.append(line)
+            continue
+        block.append(line)
+        content = True
+    if content:
+        yield POEntry(block)
+    elif block:
+        yield b"".join(block)
+
+
+class POCatalog:
+    """
+    Memory-bounded PO catalog processor.
+
+    Entries are read lazily and written in order to a temporary file next to
+    the catalog, which atomically replaces it when the block exits. Only
+    entries handed out but not yet committed are kept in memory::
+
+        with POCatalog(path) as catalog:
+            for entry in catalog:
+                if entry.untranslated:
+                    entry.msgstr = translate(entry.msgid)
+                catalog.commit()
+
+    Entries that were not reached (e.g. on Ctrl+C) are copied through
+    unchanged, so translations done so far are never lost.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._reader: Optional[BinaryIO] = None
+        self._writer: Optional[BinaryIO] = None
+        self._entries: Optional[Iterator[Union[POEntry, bytes]]] = None
+        self._pending: Deque[Union[POEntry, bytes]] = deque()
+
+    @staticmethod
+    def count(path: Union[str, Path]) -> int:
+        """Count live messages without keeping the catalog in memory"""
+        with open(path, "rb") as stream:
+            return sum(1 for entry in iter_entries(stream) if isinstance(entry, POEntry) and entry.is_message)
+
+    def __enter__(self) -> "POCatalog":
+        self._reader = open(self.path, "rb")
+        fd, temp_path = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+        self._writer = os.fdopen(fd, "wb")
+        self._temp_path = temp_path
+        self._entries = iter_entries(self._reader)
+        return self
+
+    def __iter__(self) -> Iterator[POEntry]:
+        for entry in self._entries:
+            self._pending.append(entry)
+            if isinstance(entry, POEntry):
+                yield entry
+
+    def commit(self) -> None:
+        """Write every entry handed out so far"""
+        while self._pending:
+            entry = self._pending.popleft()
+            self._writer.write(entry.to_bytes() if isinstance(entry, POEntry) else entry)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.commit()
+            # Entries that were not reached are copied through unchanged
+            for entry in self._entries:
+                self._pending.append(entry)
+                self.commit()
+            self._writer.close()
+            self._reader.close()
+            shutil.copymode(self.path, self._temp_path)
+            os.replace(self._temp_path, self.path)
+        except BaseException:
+            self._writer.close()
+            self._reader.close()
+            os.unlink(self._temp_path)
+            raise
@@ -1,5 +1,16 @@
+from collections import deque
+from typing import Deque, Tuple
+
 from rich import print
+from rich.console import Group
+from rich.live import Live
+from rich.markup import escape
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress_bar import ProgressBar
+from rich.table import Table
+from rich.text import Text
+
+from jst_django.utils.telemetry import RunStats
 
 
 def get_progress():
@@ -8,3 +19,56 @@ def get_progress():
 
 def cancel():
     print("[bold red]Progress canceled![/bold red]")
+
+
+class ProgressRenderer:
+    """
+    Live view of a :class:`RunStats`.
+
+    The screen is redrawn at a fixed frame rate by rich's refresh thread, the
+    worker loop only bumps counters and appends to a bounded log buffer.
+    """
+
+    def __init__(self, stats: RunStats, fps: int = 10, log_size: int = 5) -> None:
+        self.stats = stats
+        self.logs: Deque[Tuple[str, str, bool]] = deque(maxlen=log_size)
+        self.live = Live(get_renderable=self.render, refresh_per_second=fps, transient=False)
+
+    def log(self, source: str, result: str, changed: bool = True) -> None:
+        self.logs.append((source[:50], result[:50], changed))
+
+    def render(self) -> Group:
+        stats = self.stats
+        p50, p95 = stats.percentile(50), stats.percentile(95)
+        latency = f"{p50 * 1000:.0f}/{p95 * 1000:.0f} ms" if p50 is not None else "-"
+        bar = Table.grid(padding=(0, 2))
+        bar.add_row(
+            ProgressBar(total=max(stats.total, 1), completed=stats.done, width=40), f"{stats.done}/{stats.total}"
+        )
+        summary = Text(
+            f"{stats.rate:.1f} entries/s  in flight: {stats.in_flight}  "
+            f"p50/p95: {latency}  cache: {stats.cache_ratio:.0%}",
+            style="bold",
+        )
+        lines = [
+            Text.from_markup(
+                (
+                    f"[cyan]{escape(source)}[/cyan] → [green]{escape(result)}[/green]"
+                    if changed
+                    else f"[bright_black]{escape(source)} → {escape(result)}[/bright_black]"
+                ),
+                overflow="ellipsis",
+            )
+            for source, result, changed in list(self.logs)
+        ]
+        for line in lines:
+            line.no_wrap = True
+        return Group(*lines, bar, summary)
+
+    def __enter__(self) -> "ProgressRenderer":
+        self.live.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stats.finish()
+        self.live.stop()
@@ -0,0 +1,314 @@
+"""Cached index of installable modules."""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import requests
+
+from jst_django.constants import (
+    ERROR_MODULE_NOT_FOUND,
+    MODULE_OWNER,
+    MODULE_REGISTRY_ENV,
+    MODULE_REGISTRY_TTL,
+    REGISTRY_MODULES,
+)
+from jst_django.exceptions import APIError, ModuleNotFoundError, VersionError
+from jst_django.utils.api import Github
+from jst_django.utils.cache import user_cache_dir
+from jst_django.utils.file import File
+from jst_django.utils.logger import logger
+from jst_django.utils.network import is_offline, require_network
+
+
+class ModuleRelease(NamedTuple):
+    """One installable version of a module."""
+
+    name: str
+    version: str
+    url: str
+    size: Optional[int] = None
+    sha256: Optional[str] = None
+
+
+class ModuleRegistry:
+    """
+    Index of modules, their versions and archives, cached in the user cache dir.
+
+    The index is read from the JSON document at ``JST_MODULE_REGISTRY`` when
+    set, otherwise it is built from the GitHub releases of every
+    ``module-<name>`` repository. Once ``ttl`` seconds have passed it is
+    revalidated with ETags, so unchanged sources cost a 304 each. A pinned
+    version already in the index is resolved without any network call.
+
+    Index format::
+
+        {"modules": {"bot": {"repo": "JscorpTech/module-bot", "latest": "1.0.0",
+            "versions": {"1.0.0": {"url": "...zip", "size": 1024, "sha256": "..."}}}}}
+
+    Sizes and checksums missing from the index are recorded on first
+    download and checked every time the cached archive is reused.
+    """
+
+    def __init__(self, url: Optional[str] = None, ttl: int = MODULE_REGISTRY_TTL, timeout: int = 30) -> None:
+        """
+        Initialize module registry.
+
+        Args:
+            url: Registry index URL, defaults to ``JST_MODULE_REGISTRY``
+            ttl: Seconds the cached index is used without revalidation
+            timeout: Request timeout in seconds
+        """
+        self.url = url if url is not None else os.environ.get(MODULE_REGISTRY_ENV)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.root = user_cache_dir("modules")
+        self.path = self.root / "index.json"
+        self._cache: Optional[Dict[str, Any]] = None
+
+    def index(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Registry index, revalidated when stale.
+
+        Args:
+            refresh: Revalidate even if the cached index is fresh
+
+        Returns:
+            Index with a ``modules`` mapping
+
+        Raises:
+            APIError: If the index cannot be fetched and nothing is cached
+            OfflineError: If offline and nothing is cached
+        """
+        cache = self._load()
+        if is_offline():
+            # Stale or not, the cached index is all there is
+            if not cache.get("index"):
+                require_network(f"module index ({self.path})")
+            return cache["index"]
+        if not refresh and self._fresh(cache):
+            return cache["index"]
+        with File.locked(self.root / ".index.lock"):
+            # Another process may have revalidated while we waited
+            cache = self._read()
+            if refresh or not self._fresh(cache):
+                try:
+                    cache = self._revalidate(cache)
+                except APIError as e:
+                    if refresh or not cache.get("index"):
+                        raise
+                    logger.warning("Using cached module index: %s", e)
+                else:
+                    self._write(cache)
+        self._cache = cache
+        return cache["index"]
+
+    def modules(self, refresh: bool = False) -> List[str]:
+        """Names of every module in the index"""
+        return sorted(self.index(refresh)["modules"])
+
+    def versions(self, name: str) -> List[str]:
+        """
+        Versions of a module, newest first as listed in the index.
+
+        Raises:
+            ModuleNotFoundError: If the module is not in the index
+        """
+        modules = self.index()["modules"]
+        if name not in modules:
+            raise ModuleNotFoundError(
+                ERROR_MODULE_NOT_FOUND.format(name), details="Mavjud modullar: %s" % ", ".join(sorted(modules))
+            )
+        return list(modules[name]["versions"])
+
+    def resolve(self, name: str, version: Optional[str] = None) -> ModuleRelease:
+        """
+        Release of a module, the latest one unless ``version`` is pinned.
+
+        Args:
+            name: Module name, e.g. ``bot``
+            version: Pinned version
+
+        Returns:
+            Module release
+
+        Raises:
+            ModuleNotFoundError: If the module is not in the index
+            VersionError: If the version is not in the index
+        """
+        if version is not None:
+            release = self._find(self._load().get("index"), name, version)
+            if release is not None:
+                return release
+        # Unknown pins may be newer than the cached index
+        index = self.index(refresh=version is not None and self._load().get("index") is not None)
+        entry = index["modules"].get(name)
+        if is_offline() and self._find(index, name, version or (entry or {}).get("latest")) is None:
+            require_network(f"module {name}{'==' + version if version else ''} ({self.path})")
+        if entry is None:
+            raise ModuleNotFoundError(
+                ERROR_MODULE_NOT_FOUND.format(name), details="Mavjud modullar: %s" % ", ".join(sorted(index["modules"]))
+            )
+        version = version or entry.get("latest")
+        release = self._find(index, name, version)
+        if release is None:
+            versions = list(entry["versions"])
+            raise VersionError(
+                f"Version '{version}' not found",
+                details=f"Available versions: {', '.join(versions[:10])}{'...' if len(versions) > 10 else ''}",
+            )
+        return release
+
+    def archive(self, release: ModuleRelease) -> Path:
+        """
+        Archive of a release, downloaded once and verified on every reuse.
+
+        Args:
+            release: Module release
+
+        Returns:
+            Path of the cached zip archive
+
+        Raises:
+            APIError: If the download fails or its checksum does not match
+            OfflineError: If offline and the archive was never downloaded
+        """
+        directory = user_cache_dir("modules", "archives")
+        target = directory / "{}-{}.zip".format(release.name, re.sub(r"[^\w.-]", "_", release.version))
+        with File.locked(directory / f".{target.name}.lock"):
+            expected = release.sha256 or self._recorded(release)
+            if target.exists() and expected is not None and self._sha256(target) != expected:
+                logger.warning("Cached archive is corrupted, downloading again: %s", target)
+                target.unlink()
+            if not target.exists():
+                sha256, size = self._download(release.url, target, expected)
+                if expected is None:
+                    self._record(release, sha256, size)
+        return target
+
+    @staticmethod
+    def _find(index: Optional[Dict[str, Any]], name: str, version: Optional[str]) -> Optional[ModuleRelease]:
+        meta = (index or {}).get("modules", {}).get(name, {}).get("versions", {}).get(version)
+        if meta is None:
+            return None
+        return ModuleRelease(name, version, meta["url"], meta.get("size"), meta.get("sha256"))
+
+    def _fresh(self, cache: Dict[str, Any]) -> bool:
+        return bool(cache.get("index")) and time.time() - cache.get("fetched_at", 0) < self.ttl
+
+    def _load(self) -> Dict[str, Any]:
+        if self._cache is None:
+            self._cache = self._read()
+        return self._cache
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, cache: Dict[str, Any]) -> None:
+        with tempfile.NamedTemporaryFile("w", dir=self.root, suffix=".tmp", delete=False, encoding="utf-8") as file:
+            json.dump(cache, file, indent=2)
+        os.replace(file.name, self.path)
+        self._cache = cache
+
+    def _revalidate(self, cache: Dict[str, Any]) -> Dict[str, Any]:
+        etags = dict(cache.get("etags", {}))
+        modules = dict(cache.get("index", {}).get("modules", {}))
+        if self.url:
+            data, etags[self.url] = self._fetch_index(etags.get(self.url))
+            if data is not None:
+                modules = data["modules"]
+        else:
+            with ThreadPoolExecutor(max_workers=len(REGISTRY_MODULES)) as executor:
+                results = list(executor.map(lambda name: self._releases(name, etags.get(name)), REGISTRY_MODULES))
+            for name, (entry, etag) in zip(REGISTRY_MODULES, results):
+                etags[name] = etag
+                if entry is not None:
+                    # Checksums recorded on download survive revalidation
+                    known = modules.get(name, {}).get("versions", {})
+                    for version, meta in entry["versions"].items():
+                        meta.update({key: value for key, value in known.get(version, {}).items() if value})
+                    modules[name] = entry
+        return {"fetched_at": time.time(), "etags": etags, "index": {"modules": modules}}
+
+    def _fetch_index(self, etag: Optional[str]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        try:
+            response = requests.get(self.url, headers={"If-None-Match": etag} if etag else None, timeout=self.timeout)
+            if response.status_code == 304:
+                return None, etag
+            response.raise_for_status()
+            return response.json(), response.headers.get("ETag")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise APIError(f"Failed to fetch module registry: {self.url}", details=str(e))
+
+    def _releases(self, name: str, etag: Optional[str]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Index entry built from the GitHub releases of ``module-<name>``"""
+        repo = f"module-{name}"
+        releases, etag = Github(repo, MODULE_OWNER).conditional("releases", etag)
+        if releases is None:
+            return None, etag
+        entry = {"repo": f"{MODULE_OWNER}/{repo}", "latest": None, "versions": {}}
+        for release in releases:
+            if release.get("draft"):
+                continue
+            version = release["name"]
+            tag = release.get("tag_name") or version
+            entry["versions"][version] = {
+                "url": f"https://github.com/{MODULE_OWNER}/{repo}/archive/refs/tags/{tag}.zip",
+                "size": None,
+                "sha256": None,
+            }
+            if entry["latest"] is None and not release.get("prerelease"):
+                entry["latest"] = version
+        entry["latest"] = entry["latest"] or next(iter(entry["versions"]), None)
+        return entry, etag
+
+    def _recorded(self, release: ModuleRelease) -> Optional[str]:
+        found = self._find(self._read().get("index"), release.name, release.version)
+        return found.sha256 if found else None
+
+    def _record(self, release: ModuleRelease, sha256: str, size: int) -> None:
+        with File.locked(self.root / ".index.lock"):
+            cache = self._read()
+            meta = cache.get("index", {}).get("modules", {}).get(release.name, {}).get("versions", {})
+            if release.version in meta:
+                meta[release.version].update({"sha256": sha256, "size": size})
+                self._write(cache)
+
+    def _download(self, url: str, target: Path, expected: Optional[str]) -> Tuple[str, int]:
+        require_network(f"module archive {target.name}")
+        logger.info("Downloading module: %s", url)
+        digest, size = hashlib.sha256(), 0
+        with tempfile.NamedTemporaryFile(dir=target.parent, suffix=".tmp", delete=False) as file:
+            try:
+                with requests.get(url, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        file.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+            except requests.exceptions.RequestException as e:
+                os.unlink(file.name)
+                raise APIError(f"Failed to download module: {url}", details=str(e))
+        if expected is not None and digest.hexdigest() != expected:
+            os.unlink(file.name)
+            raise APIError(f"Checksum mismatch: {url}", details=f"expected {expected}, got {digest.hexdigest()}")
+        os.replace(file.name, target)
+        return digest.hexdigest(), size
+
+    @staticmethod
+    def _sha256(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
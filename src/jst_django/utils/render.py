@@ -0,0 +1,233 @@
+"""Native renderer for cookiecutter project templates."""
+
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from binaryornot.check import is_binary
+from cookiecutter.find import find_template
+from cookiecutter.generate import generate_context, is_copy_only_path
+from cookiecutter.hooks import run_hook_from_repo_dir
+from cookiecutter.prompt import prompt_for_config
+from cookiecutter.utils import create_env_with_context
+from jinja2 import FileSystemLoader
+
+from jst_django.exceptions import FileOperationError, TemplateError
+from jst_django.utils.file import File
+
+# Text files per worker task
+CHUNK_SIZE = 32
+
+
+class _FileRenderer:
+    """Jinja environment of one render, built once per worker process."""
+
+    def __init__(self, template_root: str, context: Dict[str, Any]) -> None:
+        self.context = context
+        self.env = create_env_with_context(context)
+        self.env.loader = FileSystemLoader([template_root, os.path.join(template_root, "..", "templates")])
+        self.template_root = template_root
+
+    def render(self, files: List[Tuple[str, str]]) -> None:
+        for source, target in files:
+            rendered = self.env.get_template(source).render(**self.context)
+            newline = self.context["cookiecutter"].get("_new_lines") or self._newline(source)
+            with open(target, "w", encoding="utf-8", newline=newline) as file:
+                file.write(rendered)
+            shutil.copymode(os.path.join(self.template_root, source), target)
+
+    def _newline(self, source: str) -> Optional[str]:
+        """Newline of the template file, same detection as cookiecutter"""
+        with open(os.path.join(self.template_root, source), encoding="utf-8") as file:
+            file.readline()
+        return file.newlines[0] if isinstance(file.newlines, tuple) else file.newlines
+
+
+_worker: Optional[_FileRenderer] = None
+
+
+def _init_worker(repo_dir: str, template_root: str, context: Dict[str, Any]) -> None:
+    global _worker
+    sys.path.append(repo_dir)
+    _worker = _FileRenderer(template_root, context)
+
+
+def _render_chunk(files: List[Tuple[str, str]]) -> None:
+    _worker.render(files)
+
+
+class NativeRenderer:
+    """
+    Render a cookiecutter template without cookiecutter's serial generator.
+
+    Context, template discovery, ``_copy_without_render`` and hooks are
+    cookiecutter's own, so projects are identical. The differences are in
+    how files are produced: the tree is planned up front, text files are
+    rendered in worker processes and binary files are copied in the kernel.
+    """
+
+    def __init__(self, repo_dir: Union[str, Path], jobs: Optional[int] = None) -> None:
+        """
+        Initialize renderer.
+
+        Args:
+            repo_dir: Local template tree containing ``cookiecutter.json``
+            jobs: Worker processes for text files, defaults to CPU count
+        """
+        self.repo_dir = str(repo_dir)
+        self.jobs = jobs
+
+    def context(self, extra_context: Dict[str, Any], output_dir: Union[str, Path] = ".") -> Dict[str, Any]:
+        """Context as ``cookiecutter(repo_dir, no_input=True, extra_context=...)`` builds it"""
+        context = generate_context(
+            context_file=os.path.join(self.repo_dir, "cookiecutter.json"), extra_context=extra_context
+        )
+        context["_cookiecutter"] = {key: value for key, value in context["cookiecutter"].items() if key[0] != "_"}
+        context["cookiecutter"].update(prompt_for_config(context, no_input=True))
+        context["cookiecutter"]["_template"] = self.repo_dir
+        context["cookiecutter"]["_output_dir"] = os.path.abspath(output_dir)
+        context["cookiecutter"]["_repo_dir"] = self.repo_dir
+        context["cookiecutter"]["_checkout"] = None
+        return context
+
+    def render(self, extra_context: Dict[str, Any], output_dir: Union[str, Path] = ".") -> str:
+        """
+        Render project.
+
+        Args:
+            extra_context: Template variables, e.g. from ``ProjectCreator.prepare_context``
+            output_dir: Directory the project directory is created in
+
+        Returns:
+            Project directory
+
+        Raises:
+            FileOperationError: If the project directory already exists
+            TemplateError: If a template cannot be rendered
+        """
+        with self._importable():
+            return self._render(extra_context, output_dir)
+
+    @contextmanager
+    def _importable(self):
+        """Local jinja extensions of the template are importable, as in cookiecutter"""
+        path = list(sys.path)
+        sys.path.append(self.repo_dir)
+        try:
+            yield
+        finally:
+            sys.path[:] = path
+
+    def template_files(self) -> Dict[str, str]:
+        """Files of the project template directory, relative path to absolute path"""
+        with self._importable():
+            template_root = find_template(self.repo_dir, create_env_with_context(self.context({})))
+        return File.listing(template_root)
+
+    def _render(self, extra_context: Dict[str, Any], output_dir: Union[str, Path]) -> str:
+        context = self.context(extra_context, output_dir)
+        env = create_env_with_context(context)
+        template_root = str(find_template(self.repo_dir, env))
+        project_dir = os.path.abspath(
+            os.path.join(output_dir, env.from_string(os.path.basename(template_root)).render(**context))
+        )
+        if os.path.exists(project_dir):
+            raise FileOperationError(f"Project directory already exists: {project_dir}")
+        os.makedirs(project_dir)
+        try:
+            run_hook_from_repo_dir(self.repo_dir, "pre_gen_project", project_dir, context, True)
+            texts = self._copy_tree(template_root, project_dir, context, env)
+            self._render_texts(template_root, texts, context)
+            run_hook_from_repo_dir(self.repo_dir, "post_gen_project", project_dir, context, True)
+        except Exception as e:
+            shutil.rmtree(project_dir, ignore_errors=True)
+            if isinstance(e, (FileOperationError, TemplateError)):
+                raise
+            raise TemplateError(f"Failed to render template: {self.repo_dir}", details=str(e)) from e
+        return project_dir
+
+    def render_files(
+        self, extra_context: Dict[str, Any], paths: Iterable[str], output_dir: Union[str, Path]
+    ) -> Dict[str, str]:
+        """
+        Render selected template files only, hooks are not run.
+
+        Args:
+            extra_context: Template variables
+            paths: File paths relative to the project template directory,
+                e.g. ``{{cookiecutter.project_slug}}/README.md`` is ``README.md``
+            output_dir: Directory the rendered files are written to
+
+        Returns:
+            Rendered path relative to ``output_dir`` per template path,
+            files whose name renders empty are left out
+        """
+        with self._importable():
+            context = self.context(extra_context, output_dir)
+            env = create_env_with_context(context)
+            template_root = str(find_template(self.repo_dir, env))
+            rendered, texts = {}, []
+            for name in sorted(paths):
+                target = env.from_string(name).render(**context)
+                if not os.path.basename(target):
+                    continue
+                os.makedirs(os.path.join(output_dir, os.path.dirname(target)), exist_ok=True)
+                source = os.path.join(template_root, name)
+                if self._copy_only(name, context) or is_binary(source):
+                    File.copy(source, os.path.join(output_dir, target))
+                else:
+                    texts.append((name, os.path.join(output_dir, target)))
+                rendered[name] = target
+            self._render_texts(template_root, texts, context)
+            return rendered
+
+    @staticmethod
+    def _copy_only(path: str, context: Dict[str, Any]) -> bool:
+        """Copy-only file or a file inside a copy-only directory"""
+        parts = path.split("/")
+        return any(is_copy_only_path("/".join(parts[:index]), context) for index in range(1, len(parts) + 1))
+
+    def _copy_tree(self, template_root: str, project_dir: str, context: Dict[str, Any], env) -> List[Tuple[str, str]]:
+        """Create directories and copy binary/copy-only files, return text files left to render"""
+        texts = []
+        for root, dirs, files in os.walk(template_root):
+            relative = os.path.relpath(root, template_root)
+            render_dirs = []
+            for name in sorted(dirs):
+                path = os.path.normpath(os.path.join(relative, name))
+                target = os.path.join(project_dir, env.from_string(path).render(**context))
+                if is_copy_only_path(path, context):
+                    shutil.copytree(os.path.join(root, name), target, copy_function=File.copy)
+                else:
+                    os.makedirs(target, exist_ok=True)
+                    render_dirs.append(name)
+            dirs[:] = render_dirs
+            for name in sorted(files):
+                path = os.path.normpath(os.path.join(relative, name))
+                target = os.path.join(project_dir, env.from_string(path).render(**context))
+                if os.path.isdir(target):
+                    # File name rendered empty
+                    continue
+                if is_copy_only_path(path, context) or is_binary(os.path.join(root, name)):
+                    File.copy(os.path.join(root, name), target)
+                else:
+                    texts.append((path.replace(os.sep, "/"), target))
+        return texts
+
+    def _render_texts(self, template_root: str, texts: List[Tuple[str, str]], context: Dict[str, Any]) -> None:
+        chunks = [texts[index : index + CHUNK_SIZE] for index in range(0, len(texts), CHUNK_SIZE)]
+        workers = min(self.jobs or os.cpu_count() or 1, len(chunks))
+        if workers <= 1:
+            renderer = _FileRenderer(template_root, context)
+            for chunk in chunks:
+                renderer.render(chunk)
+            return
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.repo_dir, template_root, context)
+        ) as executor:
+            for _ in executor.map(_render_chunk, chunks):
+                pass
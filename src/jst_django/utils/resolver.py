@@ -0,0 +1,198 @@
+"""Module dependency manifests and resolution."""
+
+import json
+import os
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from graphlib import CycleError, TopologicalSorter
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+from jst_django.constants import MODULE_MANIFEST
+from jst_django.exceptions import ValidationError, VersionError
+from jst_django.utils.registry import ModuleRegistry, ModuleRelease
+
+
+class ModuleManifest(NamedTuple):
+    """Dependencies a module declares in ``jst-module.json``."""
+
+    dependencies: Dict[str, str]
+    requirements: List[str]
+
+
+class Resolution(NamedTuple):
+    """Module release selected for installation."""
+
+    release: ModuleRelease
+    archive: Path
+    manifest: ModuleManifest
+
+
+def _specifier(spec: str) -> SpecifierSet:
+    """Version constraint, empty or ``*`` allows any version"""
+    return SpecifierSet("" if spec.strip() == "*" else spec)
+
+
+def read_manifest(archive: Path) -> ModuleManifest:
+    """
+    Manifest of a module archive, empty if the module has none.
+
+    ``jst-module.json`` sits next to ``apps.py``::
+
+        {"dependencies": {"bot": ">=1.0,<2.0"}, "requirements": ["aiogram>=3.0"]}
+
+    Args:
+        archive: Module zip archive
+
+    Returns:
+        Module manifest
+
+    Raises:
+        ValidationError: If the manifest is invalid
+    """
+    with zipfile.ZipFile(archive) as zip_file:
+        # GitHub archives contain a single ``<repo>-<tag>/`` directory
+        names = [name for name in zip_file.namelist() if name.rsplit("/", 1)[-1] == MODULE_MANIFEST]
+        if len(names) == 0:
+            return ModuleManifest({}, [])
+        try:
+            data = json.loads(zip_file.read(min(names, key=len)))
+        except ValueError as e:
+            raise ValidationError(f"Invalid {MODULE_MANIFEST}: {archive.name}", details=str(e))
+    dependencies = data.get("dependencies", {})
+    requirements = data.get("requirements", [])
+    if not isinstance(dependencies, dict) or not isinstance(requirements, list):
+        raise ValidationError(
+            f"Invalid {MODULE_MANIFEST}: {archive.name}", details="dependencies: {}, requirements: []"
+        )
+    try:
+        for spec in dependencies.values():
+            _specifier(spec)
+        for requirement in requirements:
+            Requirement(requirement)
+    except (InvalidSpecifier, InvalidRequirement, TypeError) as e:
+        raise ValidationError(f"Invalid {MODULE_MANIFEST}: {archive.name}", details=str(e))
+    return ModuleManifest(dependencies, requirements)
+
+
+class ModuleResolver:
+    """
+    Resolve modules with their dependencies before anything is installed.
+
+    The graph is walked level by level: archives of one level are fetched
+    concurrently, their manifests name the next level. Every module gets
+    the newest version satisfying all constraints seen so far; a constraint
+    excluding an already selected version is reported, not backtracked.
+    Installed modules are kept at their version, it has to satisfy the
+    constraints as well.
+    """
+
+    def __init__(self, registry: ModuleRegistry, jobs: Optional[int] = None) -> None:
+        """
+        Initialize resolver.
+
+        Args:
+            registry: Module registry
+            jobs: Concurrent archive downloads
+        """
+        self.registry = registry
+        self.jobs = jobs
+
+    def resolve(
+        self, roots: Dict[str, Optional[str]], installed: Optional[Dict[str, Optional[str]]] = None
+    ) -> List[Resolution]:
+        """
+        Select, fetch and order modules.
+
+        Args:
+            roots: Requested modules, with a pinned version or None
+            installed: Modules of the project with their installed version, None when unknown
+
+        Returns:
+            Resolutions with dependencies before their dependents, installed modules left out
+
+        Raises:
+            VersionError: If no version satisfies every constraint
+            ValidationError: If a manifest is invalid or modules depend on each other
+        """
+        installed = installed or {}
+        constraints: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        selected: Dict[str, Resolution] = {}
+        frontier = dict(roots)
+        with ThreadPoolExecutor(max_workers=self.jobs or min(8, (os.cpu_count() or 1) + 4)) as executor:
+            while frontier:
+                level = sorted(name for name in frontier if name in roots or name not in installed)
+                releases = [self._select(name, roots.get(name), constraints[name]) for name in level]
+                frontier = {}
+                for release, archive in zip(releases, executor.map(self.registry.archive, releases)):
+                    manifest = read_manifest(archive)
+                    selected[release.name] = Resolution(release, archive, manifest)
+                    for name, spec in manifest.dependencies.items():
+                        constraints[name].append((spec, release.name))
+                        if name not in selected and name not in level:
+                            frontier[name] = None
+                # Constraints found by this level also apply to modules already selected
+                for name, resolution in selected.items():
+                    self._check(name, resolution.release.version, constraints[name])
+        for name, version in sorted(installed.items()):
+            if name not in selected and version is not None:
+                self._check_installed(name, version, constraints.get(name, []))
+        graph = {name: set(resolution.manifest.dependencies) for name, resolution in selected.items()}
+        try:
+            return [selected[name] for name in TopologicalSorter(graph).static_order() if name in selected]
+        except CycleError as e:
+            raise ValidationError("Modullar bir-biriga bog'liq (sikl)", details=" -> ".join(e.args[1]))
+
+    def _select(self, name: str, pinned: Optional[str], constraints: List[Tuple[str, str]]) -> ModuleRelease:
+        if pinned is not None or len(constraints) == 0:
+            release = self.registry.resolve(name, pinned)
+            self._check(name, release.version, constraints)
+            return release
+        spec = self._specifier(constraints)
+        versions = {}
+        for version in self.registry.versions(name):
+            try:
+                versions[Version(version)] = version
+            except InvalidVersion:
+                continue
+        matches = list(spec.filter(versions))
+        if len(matches) == 0:
+            raise self._conflict(name, constraints)
+        return self.registry.resolve(name, versions[max(matches)])
+
+    def _check(self, name: str, version: str, constraints: List[Tuple[str, str]]) -> None:
+        if len(constraints) == 0:
+            return
+        try:
+            ok = self._specifier(constraints).contains(version, prereleases=True)
+        except InvalidVersion:
+            ok = False
+        if not ok:
+            raise self._conflict(name, constraints, version)
+
+    def _check_installed(self, name: str, version: str, constraints: List[Tuple[str, str]]) -> None:
+        try:
+            self._check(name, version, constraints)
+        except VersionError as e:
+            raise VersionError(
+                f"O'rnatilgan '{name}' {version} moduli talabga mos emas, jst update:app bilan yangilang",
+                details=e.details,
+            )
+
+    @staticmethod
+    def _specifier(constraints: List[Tuple[str, str]]) -> SpecifierSet:
+        specifier = SpecifierSet()
+        for spec, _ in constraints:
+            specifier &= _specifier(spec)
+        return specifier
+
+    @staticmethod
+    def _conflict(name: str, constraints: List[Tuple[str, str]], version: Optional[str] = None) -> VersionError:
+        required = "; ".join(f"{owner}: {name}{spec or ' *'}" for spec, owner in constraints)
+        selected = f", tanlangan {version}" if version else ""
+        return VersionError(f"'{name}' moduli uchun mos versiya yo'q{selected}", details=required)
@@ -0,0 +1,167 @@
+"""Stub loading for code generation."""
+
+from importlib import resources
+from pathlib import Path
+from typing import ClassVar, Dict, Mapping, Optional, Set, Tuple
+
+import jinja2
+from jinja2 import meta
+
+from jst_django.constants import ERROR_STUB_NOT_FOUND
+from jst_django.exceptions import StubNotFoundError
+
+# Block tags take their whole line, so ``{% for %}`` leaves no blank lines or indentation behind
+ENVIRONMENT = jinja2.Environment(trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+# User stubs are written for plain Jinja whitespace, their output always goes through the formatter
+USER_ENVIRONMENT = jinja2.Environment(keep_trailing_newline=True)
+
+
+def parse_stub(source: str, append: bool = False) -> Tuple[str, str]:
+    """
+    Split stub source into header and body.
+
+    ``!!`` lines go to the top of the file, ``##`` lines are only rendered
+    when the file is created.
+
+    Args:
+        source: Stub source
+        append: Whether the stub is appended to an existing file
+
+    Returns:
+        Tuple of header and body
+    """
+    response = ""
+    top_content = ""
+    for chunk in source.splitlines(keepends=True):
+        if chunk.startswith("!!"):
+            top_content += chunk.replace("!!", "", 2)
+            continue
+        elif append and chunk.startswith("##"):
+            continue
+        elif not append and chunk.startswith("##"):
+            chunk = chunk.replace("##", "", 2)
+        response += chunk
+    if append:
+        response = "\n" + response
+    return top_content, response
+
+
+class StubRegistry:
+    """
+    Resolved stubs of a run.
+
+    Built-in stubs are read once per process from package resources, so they
+    also work from zipped installs. User override paths are checked once when
+    the registry is created, after that rendering a file costs no filesystem
+    calls: parsed sources and compiled templates are cached in memory.
+
+    Only built-in stubs render black/isort formatted code, :meth:`bundled`
+    tells the two apart so output of user stubs is always formatted.
+    """
+
+    _bundle: ClassVar[Optional[Dict[str, str]]] = None
+    _registries: ClassVar[Dict[Tuple[Tuple[str, str], ...], "StubRegistry"]] = {}
+
+    def __init__(self, stubs: Mapping[str, str]) -> None:
+        """
+        Initialize stub registry.
+
+        Args:
+            stubs: Stub name -> user stub path or built-in stub file name
+        """
+        bundle = self.bundle()
+        self.sources: Dict[str, str] = {}
+        self.missing: Dict[str, str] = {}
+        # Names of stubs read from the package, the rest are user overrides
+        self.builtin: Set[str] = set()
+        for name, stub in stubs.items():
+            path = Path(stub)
+            if path.is_file():
+                self.sources[name] = path.read_text(encoding="utf-8")
+            elif stub in bundle:
+                self.sources[name] = bundle[stub]
+                self.builtin.add(name)
+            else:
+                self.missing[name] = stub
+        self._parsed: Dict[Tuple[str, bool], Tuple[str, str]] = {}
+        self._templates: Dict[Tuple[str, bool], Tuple[jinja2.Template, jinja2.Template]] = {}
+        self._variables: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def bundle(cls) -> Dict[str, str]:
+        """
+        Get built-in stubs.
+
+        Returns:
+            Relative stub path -> stub source
+        """
+        if cls._bundle is None:
+            bundle: Dict[str, str] = {}
+            pending = [("", resources.files("jst_django") / "stubs")]
+            while pending:
+                prefix, directory = pending.pop()
+                for item in directory.iterdir():
+                    if item.is_dir():
+                        pending.append((f"{prefix}{item.name}/", item))
+                    elif item.name.endswith(".stub"):
+                        bundle[f"{prefix}{item.name}"] = item.read_text(encoding="utf-8")
+            cls._bundle = bundle
+        return cls._bundle
+
+    @classmethod
+    def load(cls, stubs: Mapping[str, str]) -> "StubRegistry":
+        """
+        Get process-wide registry for a stub mapping.
+
+        Args:
+            stubs: Stub name -> user stub path or built-in stub file name
+
+        Returns:
+            Stub registry, created once per distinct mapping
+        """
+        key = tuple(sorted(stubs.items()))
+        if key not in cls._registries:
+            cls._registries[key] = cls(stubs)
+        return cls._registries[key]
+
+    def source(self, name: str) -> str:
+        """
+        Get stub source.
+
+        Raises:
+            StubNotFoundError: If stub file does not exist
+        """
+        if name not in self.sources:
+            raise StubNotFoundError(ERROR_STUB_NOT_FOUND.format(self.missing.get(name, name)))
+        return self.sources[name]
+
+    def bundled(self, name: str) -> bool:
+        """Stub is a built-in one, not a user override"""
+        return name in self.builtin
+
+    def environment(self, name: str) -> jinja2.Environment:
+        """Jinja environment the stub is written for"""
+        return ENVIRONMENT if self.bundled(name) else USER_ENVIRONMENT
+
+    def parse(self, name: str, append: bool = False) -> Tuple[str, str]:
+        """Get header and body of a stub"""
+        key = (name, append)
+        if key not in self._parsed:
+            self._parsed[key] = parse_stub(self.source(name), append)
+        return self._parsed[key]
+
+    def templates(self, name: str, append: bool = False) -> Tuple[jinja2.Template, jinja2.Template]:
+        """Get compiled header and body templates of a stub"""
+        key = (name, append)
+        if key not in self._templates:
+            top_content, content = self.parse(name, append)
+            environment = self.environment(name)
+            self._templates[key] = (environment.from_string(top_content), environment.from_string(content))
+        return self._templates[key]
+
+    def variables(self, name: str) -> Set[str]:
+        """Get context variables a stub uses"""
+        if name not in self._variables:
+            top_content, content = self.parse(name)
+            self._variables[name] = meta.find_undeclared_variables(self.environment(name).parse(top_content + content))
+        return self._variables[name]
@@ -0,0 +1,163 @@
+"""Generated regions and the model -> artifact graph kept up to date by ``jst sync``."""
+
+import ast
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+from jst_django.utils.file import File
+
+# Context variables that make a generated file depend on the model fields
+FIELD_VARIABLES = {
+    "fields",
+    "model_fields",
+    "field_specs",
+    "indexes",
+    "constraints",
+    "select_related",
+    "prefetch_related",
+    "only_fields",
+    "list_fields",
+}
+REGION_BEGIN = "# jst:begin {stub} {name}"
+REGION_END = "# jst:end {stub} {name}"
+
+
+def fields_hash(fields: Mapping[str, str]) -> str:
+    """
+    Hash of a field list, independent of quoting and formatting.
+
+    Args:
+        fields: Field name -> field expression
+
+    Returns:
+        sha256 hex digest
+    """
+    normalized = []
+    for name, expression in fields.items():
+        try:
+            expression = ast.unparse(ast.parse(expression, mode="eval"))
+        except SyntaxError:
+            pass
+        normalized.append([name, expression])
+    return hashlib.sha256(json.dumps(normalized).encode("utf-8")).hexdigest()
+
+
+def split_prelude(body: str) -> Tuple[str, str]:
+    """Split rendered stub body into leading imports and the generated code"""
+    lines = body.splitlines(keepends=True)
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped and not stripped.startswith(("import ", "from ")):
+            return "".join(lines[:index]), "".join(lines[index:])
+    return body, ""
+
+
+def wrap_region(stub: str, name: str, body: str) -> str:
+    """
+    Put the generated code of a rendered stub between region markers.
+
+    Imports stay outside of the region, isort moves them to the top of the
+    file together with any comment right above them.
+
+    Args:
+        stub: Stub name
+        name: Generated name
+        body: Rendered stub body
+
+    Returns:
+        Body with region markers
+    """
+    prelude, code = split_prelude(body)
+    begin, end = REGION_BEGIN.format(stub=stub, name=name), REGION_END.format(stub=stub, name=name)
+    code = code.strip("\n")
+    # Black keeps two blank lines between a top level block and the comment after it
+    return f"{prelude}{begin}\n{code}\n\n\n{end}\n"
+
+
+def replace_region(source: str, stub: str, name: str, body: str) -> Optional[str]:
+    """
+    Replace the code between region markers.
+
+    Args:
+        source: File content
+        stub: Stub name
+        name: Generated name
+        body: Rendered stub body
+
+    Returns:
+        New file content, None if the markers are not found
+    """
+    begin, end = REGION_BEGIN.format(stub=stub, name=name), REGION_END.format(stub=stub, name=name)
+    lines = source.splitlines(keepends=True)
+    stripped = [line.strip() for line in lines]
+    try:
+        start = stripped.index(begin)
+        stop = stripped.index(end, start)
+    except ValueError:
+        return None
+    code = split_prelude(body)[1].strip("\n")
+    return "".join(lines[: start + 1]) + code + "\n\n\n" + "".join(lines[stop:])
+
+
+class SyncGraph:
+    """
+    Models and the generated files that depend on their fields.
+
+    Stored in the project state dir::
+
+        {"version": 1, "models": {"blog.PostModel": {
+            "app": "blog", "name": "post", "file_name": "post", "sub_folder": null,
+            "module": "core.apps.blog.models", "class": "PostModel", "cursor": null,
+            "artifacts": {"serializer": {"path": "core/apps/blog/serializers/post/post.py", "hash": "..."}}}}}
+
+    Every artifact keeps the field hash it was rendered with, so one model
+    can have artifacts generated at different times.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.models: Dict[str, dict] = self._parse(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+
+    @classmethod
+    def _parse(cls, content: str) -> Dict[str, dict]:
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return {}
+        return data.get("models", {}) if isinstance(data, dict) and data.get("version") == cls.VERSION else {}
+
+    @staticmethod
+    def merge(path: Union[str, Path], models: Mapping[str, dict]) -> None:
+        """
+        Add models and artifacts to the stored graph.
+
+        Process pool workers generate different apps at the same time, the
+        file is locked for the whole read-modify-write.
+
+        Args:
+            path: Graph file
+            models: Model key -> node, artifacts are merged into existing nodes
+        """
+        if len(models) == 0:
+            return
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with File.locked(path) as file:
+            stored = SyncGraph._parse(file.read())
+            for key, node in models.items():
+                artifacts = {**stored.get(key, {}).get("artifacts", {}), **node["artifacts"]}
+                stored[key] = {**node, "artifacts": artifacts}
+            file.seek(0)
+            file.truncate()
+            json.dump({"version": SyncGraph.VERSION, "models": stored}, file, indent=2, sort_keys=True)
+
+    def save(self) -> None:
+        """Replace the stored graph"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with File.locked(self.path) as file:
+            file.seek(0)
+            file.truncate()
+            json.dump({"version": self.VERSION, "models": self.models}, file, indent=2, sort_keys=True)
@@ -0,0 +1,122 @@
+"""Run statistics for long running commands."""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Optional, Union
+from uuid import uuid4
+
+LATENCY_WINDOW = 10000
+
+
+class RunStats:
+    """
+    Thread-safe counters of a run.
+
+    Updating a counter is a lock and an integer add, so it is cheap enough
+    for hot loops; percentiles are computed only when something reads them.
+    """
+
+    def __init__(self, total: int = 0, **meta: Any) -> None:
+        """
+        Initialize run statistics.
+
+        Args:
+            total: Expected number of entries
+            meta: Extra values stored in the report, e.g. source and target language
+        """
+        self.run_id = uuid4().hex
+        self.meta = meta
+        self.total = total
+        self.done = 0
+        self.translated = 0
+        self.skipped = 0
+        self.failed = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self._finished: Optional[float] = None
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def add(self, **counters: int) -> None:
+        """Increment counters, e.g. ``stats.add(done=1, skipped=1)``"""
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """Track a single backend request: in flight count and latency"""
+        self.add(in_flight=1, requests=1)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            latency = time.perf_counter() - started
+            with self._lock:
+                self.in_flight -= 1
+                self._latencies.append(latency)
+
+    def finish(self) -> None:
+        self._finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return (self._finished or time.perf_counter()) - self._started
+
+    @property
+    def rate(self) -> float:
+        """Entries per second"""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def cache_ratio(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Request latency percentile in seconds over the recent window"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(q / 100 * len(latencies)))]
+
+    def report(self) -> Dict[str, Any]:
+        """Run report for dashboards"""
+        p50, p95 = self.percentile(50), self.percentile(95)
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at.isoformat(),
+            "duration": round(self.elapsed, 3),
+            **self.meta,
+            "total": self.total,
+            "done": self.done,
+            "translated": self.translated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "requests": self.requests,
+            "entries_per_second": round(self.rate, 2),
+            "latency_p50": round(p50, 4) if p50 is not None else None,
+            "latency_p95": round(p95, 4) if p95 is not None else None,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": round(self.cache_ratio, 4),
+        }
+
+    def write_report(self, path: Union[str, Path]) -> Path:
+        """Write run report as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.report(), file, indent=2, ensure_ascii=False)
+        return path
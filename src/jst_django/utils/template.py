@@ -0,0 +1,97 @@
+"""Local cache of project template archives."""
+
+import os
+import re
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Union
+
+import requests
+
+from jst_django.exceptions import APIError
+from jst_django.utils.cache import user_cache_dir
+from jst_django.utils.file import File
+from jst_django.utils.logger import logger
+from jst_django.utils.network import require_network
+
+
+class TemplateCache:
+    """
+    Extracted template trees per git ref, shared by every command and process.
+
+    A ref (tag, branch or commit SHA) is downloaded once as a GitHub archive
+    and extracted under the user cache dir; concurrent callers wait on a file
+    lock and reuse the tree the first one extracted.
+    """
+
+    def __init__(self, url: str = "https://github.com/JscorpTech/django", timeout: int = 60) -> None:
+        """
+        Initialize template cache.
+
+        Args:
+            url: Template repository URL
+            timeout: Download timeout in seconds
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        owner, repo = self.url.split("/")[-2:]
+        self.root = user_cache_dir("templates", owner, repo)
+
+    def path(self, ref: str) -> Path:
+        """Cache directory of a ref, it may not be fetched yet"""
+        return self.root / re.sub(r"[^\w.-]", "_", ref)
+
+    def get(self, ref: str) -> Path:
+        """
+        Template tree of a ref, downloaded on first use.
+
+        Args:
+            ref: Tag, branch or commit SHA
+
+        Returns:
+            Directory containing ``cookiecutter.json``
+
+        Raises:
+            APIError: If the archive cannot be downloaded
+            OfflineError: If offline and the ref was never fetched
+        """
+        target = self.path(ref)
+        if target.is_dir():
+            return target
+        with File.locked(self.root / f".{target.name}.lock"):
+            if not target.is_dir():
+                self._fetch(ref, target)
+        return target
+
+    def _fetch(self, ref: str, target: Path) -> None:
+        url = f"{self.url}/archive/{ref}.tar.gz"
+        require_network(f"template {ref} ({target})")
+        logger.info("Downloading template: %s", url)
+        with tempfile.TemporaryDirectory(dir=self.root) as temp:
+            archive = Path(temp) / "template.tar.gz"
+            try:
+                with requests.get(url, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    with open(archive, "wb") as file:
+                        for chunk in response.iter_content(chunk_size=1 << 16):
+                            file.write(chunk)
+            except requests.exceptions.RequestException as e:
+                raise APIError(f"Failed to download template: {url}", details=str(e))
+            self._extract(archive, Path(temp) / "tree")
+            # Archives contain a single ``<repo>-<ref>/`` directory
+            (top,) = (Path(temp) / "tree").iterdir()
+            os.replace(top, target)
+
+    @staticmethod
+    def _extract(archive: Union[str, Path], destination: Path) -> None:
+        with tarfile.open(archive, "r:gz") as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(destination, filter="data")
+                return
+            for member in tar.getmembers():
+                path = (destination / member.name).resolve()
+                link = member.issym() and (os.path.isabs(member.linkname) or ".." in Path(member.linkname).parts)
+                if not str(path).startswith(str(destination.resolve())) or link or member.islnk():
+                    raise APIError(f"Unsafe path in template archive: {member.name}")
+            tar.extractall(destination)
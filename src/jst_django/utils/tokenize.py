@@ -1,42 +1,254 @@
+"""Field declarations of ``--fields``.
+
+Grammar, entries separated by commas::
+
+    name:type[(args)][:option...]      title:char(100):unique, price:decimal(12,2):default=0
+    name:fk(Target)[:option...]        author:fk(UserModel):null, tags:m2m(TagModel), profile:o2o(users.Profile)
+    @index(field,...)                  @index(title,created_at)
+    @unique(field,...)                 @unique(author,slug)
+    @cursor([-]field)                  @cursor(-published_at), cursor pagination ordered on the field
+
+Options: ``unique``, ``index``, ``null`` (also blank), ``blank``, ``default=<value>``.
+"""
+
+import hashlib
+import json
+import keyword
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from jst_django.exceptions import ValidationError
+
+# DSL type -> Django field, default keyword arguments
+FIELD_TYPES: Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]] = {
+    "char": ("CharField", (("max_length", "255"),)),
+    "str": ("CharField", (("max_length", "255"),)),
+    "text": ("TextField", ()),
+    "int": ("IntegerField", ()),
+    "bigint": ("BigIntegerField", ()),
+    "float": ("FloatField", ()),
+    "decimal": ("DecimalField", (("max_digits", "10"), ("decimal_places", "2"))),
+    "bool": ("BooleanField", ()),
+    "date": ("DateField", ()),
+    "time": ("TimeField", ()),
+    "datetime": ("DateTimeField", ()),
+    "email": ("EmailField", ()),
+    "url": ("URLField", ()),
+    "slug": ("SlugField", ()),
+    "uuid": ("UUIDField", ()),
+    "json": ("JSONField", (("default", "dict"),)),
+    "image": ("ImageField", (("upload_to", '"{field}s"'),)),
+    "file": ("FileField", (("upload_to", '"{field}s"'),)),
+}
+RELATION_TYPES = {"fk": "ForeignKey", "o2o": "OneToOneField", "m2m": "ManyToManyField"}
+# Positional ``type(args)`` -> keyword arguments they set
+TYPE_ARGUMENTS = {"char": ["max_length"], "str": ["max_length"], "decimal": ["max_digits", "decimal_places"]}
+OPTIONS = ["unique", "index", "null", "blank", "default"]
+META_TYPES = ["index", "unique", "cursor"]
+# Django limits index names to 30 characters
+INDEX_NAME_LENGTH = 30
+# Names of the primary key, indexed without a declaration
+PRIMARY_KEYS = ["id", "pk"]
+
+IDENTIFIER = re.compile(r"[A-Za-z_]\w*$")
+TARGET = re.compile(r"([A-Za-z_]\w*\.)?[A-Za-z_]\w*$")
+NUMBER = re.compile(r"-?\d+(\.\d+)?$")
+# Relation in any field expression, also of fields read from source or OpenAPI
+RELATION_FIELD = re.compile(r"(?:\w+\.)*(ForeignKey|OneToOneField|ManyToManyField)\(")
+# Columns too large for list responses, served by retrieve only
+LARGE_FIELD = re.compile(r"(?:\w+\.)*(TextField|JSONField|BinaryField)\(")
+
+
+class FieldSpec(NamedTuple):
+    """One parsed field declaration."""
+
+    name: str
+    type: str
+    field: str
+    arguments: Tuple[Tuple[str, str], ...] = ()
+    target: Optional[str] = None
+
+    @property
+    def relation(self) -> bool:
+        return self.type in RELATION_TYPES
+
+    @property
+    def expression(self) -> str:
+        """Field expression, ``models.CharField(verbose_name=_("title"), max_length=255)``"""
+        arguments = [f'verbose_name=_("{self.name}")'] + [f"{key}={value}" for key, value in self.arguments]
+        if self.target is not None:
+            arguments.insert(0, json.dumps(self.target))
+        return f"models.{self.field}({', '.join(arguments)})"
+
+
+class IndexSpec(NamedTuple):
+    """Composite index or unique constraint declared with ``@index``/``@unique``."""
+
+    fields: Tuple[str, ...]
+    unique: bool = False
+
+    def name(self, table: str) -> str:
+        """Index name, shortened with a hash to Django's limit"""
+        suffix = "uniq" if self.unique else "idx"
+        name = "_".join((table,) + tuple(field.lstrip("-") for field in self.fields))
+        if len(name) + len(suffix) + 1 > INDEX_NAME_LENGTH:
+            digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+            name = f"{name[:INDEX_NAME_LENGTH - len(suffix) - len(digest) - 2]}_{digest}"
+        return f"{name}_{suffix}"
+
+    def render(self, table: str) -> str:
+        """``models.Index(...)`` or ``models.UniqueConstraint(...)`` expression"""
+        fields = ", ".join(json.dumps(field) for field in self.fields)
+        kind = "UniqueConstraint" if self.unique else "Index"
+        return f'models.{kind}(fields=[{fields}], name="{self.name(table)}")'
+
+
 class Tokenize:
 
     def __init__(self, code: str):
         self.code = code
         self.properties = {}
+        self.specs: Dict[str, FieldSpec] = {}
+        self.meta: List[IndexSpec] = []
+        # Ordering field of cursor pagination, ``-`` for descending
+        self.cursor: Optional[str] = None
+
+    def _error(self, reason: str, column: int) -> ValidationError:
+        """Error pointing at the column of ``self.code``, details start on a new line to keep the caret aligned"""
+        return ValidationError(f"Maydonlar noto'g'ri: {reason}", details=f"\n{self.code}\n{' ' * column}^")
+
+    def _entries(self) -> List[Tuple[str, int]]:
+        """Entries split on commas outside of parentheses, with their columns"""
+        entries, depth, start = [], 0, 0
+        for index, char in enumerate(self.code + ","):
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth < 0:
+                    raise self._error("ortiqcha ')'", index)
+            elif char == "," and depth == 0:
+                entry = self.code[start:index]
+                if entry.strip():
+                    entries.append((entry.strip(), start + len(entry) - len(entry.lstrip())))
+                start = index + 1
+        if depth > 0:
+            raise self._error("')' yopilmagan", len(self.code))
+        return entries
+
+    @staticmethod
+    def _call(text: str) -> Tuple[str, Optional[List[str]]]:
+        """``char(100)`` -> ("char", ["100"]), ``char`` -> ("char", None)"""
+        if "(" not in text:
+            return text, None
+        head, _, rest = text.partition("(")
+        return head, [arg.strip() for arg in rest.rstrip(")").split(",")] if rest.rstrip(")").strip() else []
+
+    def _parse_meta(self, entry: str, column: int) -> List[str]:
+        """Parse ``@index``/``@unique``/``@cursor``, returns the fields they reference"""
+        kind, args = self._call(entry[1:])
+        if kind not in META_TYPES or not entry.endswith(")"):
+            raise self._error(f"noma'lum '@{kind}', mavjud: {', '.join('@' + item for item in META_TYPES)}", column)
+        if not args:
+            raise self._error(f"@{kind} uchun maydonlar kerak, masalan @{kind}(title,slug)", column)
+        if kind != "cursor":
+            self.meta.append(IndexSpec(tuple(args), unique=kind == "unique"))
+            return args
+        if len(args) != 1 or self.cursor is not None:
+            raise self._error("@cursor bitta maydon oladi, masalan @cursor(-created_at)", column)
+        self.cursor = args[0]
+        field = self.cursor.lstrip("-")
+        return [] if field in PRIMARY_KEYS else [field]
+
+    def _parse_field(self, entry: str, column: int) -> FieldSpec:
+        parts = entry.split(":")
+        offsets = [column]
+        for part in parts[:-1]:
+            offsets.append(offsets[-1] + len(part) + 1)
+        name = parts[0].strip()
+        if not IDENTIFIER.match(name) or keyword.iskeyword(name):
+            raise self._error(f"'{name}' maydon nomi bo'la olmaydi", column)
+        if len(parts) < 2 or not parts[1]:
+            raise self._error(f"'{name}' uchun tur kerak, masalan {name}:char", offsets[0] + len(parts[0]))
+        kind, args = self._call(parts[1].strip())
+        if kind in RELATION_TYPES:
+            if not args or len(args) != 1 or not TARGET.match(args[0]):
+                raise self._error(f"{kind} uchun model kerak, masalan {name}:{kind}(UserModel)", offsets[1])
+            spec = FieldSpec(name, kind, RELATION_TYPES[kind], target=args[0])
+        elif kind in FIELD_TYPES:
+            spec = self._scalar(name, kind, args, offsets[1])
+        else:
+            types = ", ".join(list(FIELD_TYPES) + list(RELATION_TYPES))
+            raise self._error(f"noma'lum tur '{kind}', mavjud: {types}", offsets[1])
+        for option, offset in zip(parts[2:], offsets[2:]):
+            spec = self._option(spec, option.strip(), offset)
+        return spec
+
+    def _scalar(self, name: str, kind: str, args: Optional[List[str]], column: int) -> FieldSpec:
+        field, defaults = FIELD_TYPES[kind]
+        arguments = {key: value.format(field=name) for key, value in defaults}
+        if args is not None:
+            keys = TYPE_ARGUMENTS.get(kind, [])
+            if len(args) != len(keys) or not all(arg.isdigit() for arg in args):
+                usage = f"{kind}({','.join(keys)})" if keys else kind
+                raise self._error(f"'{kind}' argumentlari noto'g'ri, ishlatilishi: {usage}", column)
+            arguments.update(zip(keys, args))
+        return FieldSpec(name, kind, field, tuple(arguments.items()))
+
+    def _option(self, spec: FieldSpec, option: str, column: int) -> FieldSpec:
+        key, _, value = option.partition("=")
+        arguments = dict(spec.arguments)
+        if key == "unique":
+            arguments["unique"] = "True"
+        elif key == "index":
+            arguments["db_index"] = "True"
+        elif key == "null":
+            if spec.type != "m2m":
+                arguments["null"] = "True"
+            arguments["blank"] = "True"
+        elif key == "blank":
+            arguments["blank"] = "True"
+        elif key == "default" and value:
+            arguments["default"] = self._literal(value)
+        else:
+            raise self._error(f"noma'lum parametr '{option}', mavjud: {', '.join(OPTIONS)}", column)
+        return spec._replace(arguments=tuple(arguments.items()))
 
-    def _get_field(self, field_type, field):
-        match field_type:
-            case "char":
-                return f'models.CharField(verbose_name=_("{field}"), max_length=255)'
-            case "text":
-                return f'models.TextField(verbose_name=_("{field}"))'
-            case "int":
-                return f'models.IntegerField(verbose_name=_("{field}"))'
-            case "image":
-                return f'models.ImageField(verbose_name=_("{field}"), upload_to="{field}s")'
-            case "bool":
-                return f'models.BooleanField(verbose_name=_("{field}"))'
-            case "date":
-                return f'models.DateField(verbose_name=_("{field}"))'
-            case "time":
-                return f'models.TimeField(verbose_name=_("{field}"))'
-            case "datetime":
-                return f'models.DateTimeField(verbose_name=_("{field}"))'
-            case _:
-                return f'models.CharField(verbose_name=_("{field}"), max_length=255)'
-
-    def _parse_field(self, field: str) -> list:
-        field_parts = field.split(":")
-        size_field_parts = len(field_parts)
-        if size_field_parts != 2:
-            raise Exception("fields not validated")
-        return field_parts[0], self._get_field(field_parts[-1], field_parts[0])
+    @staticmethod
+    def _literal(value: str) -> str:
+        if value.lower() in ("true", "false", "none"):
+            return value.capitalize()
+        if NUMBER.match(value):
+            return value
+        return json.dumps(value.strip("\"'"))
+
+    @staticmethod
+    def _on_delete(spec: FieldSpec) -> FieldSpec:
+        """Nullable relations are kept when the target is deleted"""
+        if spec.type not in ("fk", "o2o"):
+            return spec
+        arguments = dict(spec.arguments)
+        on_delete = "models.SET_NULL" if arguments.get("null") == "True" else "models.CASCADE"
+        return spec._replace(arguments=(("on_delete", on_delete),) + tuple(arguments.items()))
 
     def make(self):
-        fields = self.code.split(",")
-        for field in fields:
-            name, value = self._parse_field(field)
-            self.properties[name] = value
+        # Fields referenced by ``@`` entries, with the column of the reference
+        references: List[Tuple[str, int]] = []
+        for entry, column in self._entries():
+            if entry.startswith("@"):
+                start = entry.index("(")
+                references += [(field, column + entry.index(field, start)) for field in self._parse_meta(entry, column)]
+                continue
+            spec = self._on_delete(self._parse_field(entry, column))
+            if spec.name in self.specs:
+                raise self._error(f"'{spec.name}' maydoni takrorlangan", column)
+            self.specs[spec.name] = spec
+            self.properties[spec.name] = spec.expression
+        for field, column in references:
+            if field not in self.specs:
+                raise self._error(f"'{field}' maydoni topilmadi", column)
+            if self.specs[field].type == "m2m":
+                raise self._error(f"'{field}' m2m maydon, uni index qilib bo'lmaydi", column)
         return self
 
     @property
@@ -53,3 +265,32 @@ class Tokenize:
         for field, property in self.properties.items():
             res.append(f"{field} = {property}")
         return res
+
+    @property
+    def normalized(self) -> bool:
+        """Every field was parsed from a declaration, expressions are in the layout black writes"""
+        return self.specs.keys() == self.properties.keys()
+
+    @property
+    def relations(self) -> Dict[str, str]:
+        """Relation fields, name -> fk, o2o or m2m"""
+        kinds = {field: kind for kind, field in RELATION_TYPES.items()}
+        relations = {}
+        for name, expression in self.properties.items():
+            match = RELATION_FIELD.match(expression)
+            if match is not None:
+                relations[name] = kinds[match.group(1)]
+        return relations
+
+    @property
+    def list_keys(self) -> List[str]:
+        """Fields of list responses, large text, JSON and binary columns are left to retrieve"""
+        return [name for name, expression in self.properties.items() if LARGE_FIELD.match(expression) is None]
+
+    def indexes(self, table: str) -> List[str]:
+        """``Meta.indexes`` entries"""
+        return [index.render(table) for index in self.meta if not index.unique]
+
+    def constraints(self, table: str) -> List[str]:
+        """``Meta.constraints`` entries"""
+        return [index.render(table) for index in self.meta if index.unique]
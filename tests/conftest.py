@@ -0,0 +1,10 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path_factory, monkeypatch):
+    """Keep user caches and offline mode of the developer out of tests."""
+    monkeypatch.setenv("JST_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+    monkeypatch.delenv("JST_OFFLINE", raising=False)
@@ -0,0 +1,158 @@
+"""Tests for translation backends."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jst_django.backends import BACKENDS, HttpBackend, MemoryBackend, TahrirchiBackend, get_backend
+from jst_django.backends.tahrirchi import GuestToken
+from jst_django.exceptions import APIError, ConfigurationError
+
+CATALOG = """msgid ""
+msgstr ""
+"Language: en\\n"
+
+msgid "Sarlavha"
+msgstr "Title"
+
+msgid "Matn"
+msgstr ""
+"""
+
+
+class TestBackends:
+    """Test backend selection and batching."""
+
+    def test_get_backend(self):
+        """Test backend selected from config and overridden by name."""
+        config = {"backend": "memory", "backends": {"http": {"url": "http://localhost:5000/translate"}}}
+        assert isinstance(get_backend(config), MemoryBackend)
+        assert isinstance(get_backend(config, "http"), HttpBackend)
+        assert get_backend(None).name == "tahrirchi"
+        with pytest.raises(ConfigurationError):
+            get_backend(config, "unknown")
+        assert set(BACKENDS) == {"tahrirchi", "memory", "http"}
+
+    def test_batches(self):
+        """Test batches respect size and character limits."""
+        backend = MemoryBackend({"max_batch_size": 3, "max_batch_chars": 10})
+        texts = ["a", "b", "c", "d", "123456789", "12345"]
+        assert backend.batches(texts) == [["a", "b", "c"], ["d", "123456789"], ["12345"]]
+
+    def test_invalid_limits(self):
+        """Test invalid batch limits are rejected."""
+        with pytest.raises(ConfigurationError):
+            MemoryBackend({"concurrency": 0})
+
+    def test_lang_map(self):
+        """Test language codes mapped per backend and overridable."""
+        backend = HttpBackend({"url": "http://localhost", "langs": {"uzn_Cyrl": "uz-Cyrl"}})
+        assert backend.lang("eng_Latn") == "en"
+        assert backend.lang("uzn_Cyrl") == "uz-Cyrl"
+        assert backend.lang("kaa_Latn") == "kaa_Latn"
+
+    def test_memory_backend(self, tmp_path):
+        """Test glossary wins over catalogs, unknown texts are not translated."""
+        glossary = tmp_path / "glossary.json"
+        glossary.write_text(json.dumps({"uzn_Latn": {"eng_Latn": {"Matn": "Text"}}}))
+        catalog = tmp_path / "django.po"
+        catalog.write_text(CATALOG, encoding="utf-8")
+        backend = MemoryBackend({"glossary": str(glossary), "catalogs": {"eng_Latn": [str(catalog)]}})
+        assert backend.translate(["Sarlavha", "Matn", "Yangi"], "uzn_Latn", "eng_Latn") == ["Title", "Text", None]
+        assert backend.translate(["Sarlavha"], "uzn_Latn", "rus_Cyrl") == [None]
+        assert catalog.read_text(encoding="utf-8") == CATALOG
+
+    def test_memory_catalogs_read_only(self, tmp_path):
+        """Test translation memory catalogs are only read, read-only files and directories work."""
+        catalogs = tmp_path / "locale"
+        catalogs.mkdir()
+        catalog = catalogs / "django.po"
+        catalog.write_text(CATALOG, encoding="utf-8")
+        mtime = catalog.stat().st_mtime_ns
+        catalog.chmod(0o444)
+        catalogs.chmod(0o555)
+        try:
+            backend = MemoryBackend({"catalogs": {"eng_Latn": [str(catalog)]}})
+            assert backend.translate(["Sarlavha"], "uzn_Latn", "eng_Latn") == ["Title"]
+            assert catalog.stat().st_mtime_ns == mtime
+            assert [path.name for path in catalogs.iterdir()] == ["django.po"]
+        finally:
+            catalogs.chmod(0o755)
+
+
+def response(status=200, **data):
+    mock = MagicMock(status_code=status)
+    mock.json.return_value = data
+    return mock
+
+
+class TestGuestToken:
+    """Test tahrirchi guest token cache."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Isolate user cache."""
+        monkeypatch.setenv("JST_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(TahrirchiBackend, "_tokens", {})
+
+    def test_persisted_between_runs(self):
+        """Test token is fetched once and reused from the user cache."""
+        auth = response(data={"access_token": "abc", "expires_in": 3600})
+        with patch("jst_django.backends.tahrirchi.requests.post", return_value=auth) as post:
+            assert GuestToken("auth").get() == "abc"
+            assert GuestToken("auth").get() == "abc"
+        assert post.call_count == 1
+
+    def test_refreshed_before_expiry(self):
+        """Test token close to expiry is refreshed proactively."""
+        tokens = iter(["old", "new"])
+        with patch(
+            "jst_django.backends.tahrirchi.requests.post",
+            side_effect=lambda *args, **kwargs: response(data={"access_token": next(tokens), "expires_in": 30}),
+        ):
+            token = GuestToken("auth", margin=60)
+            assert token.get() == "old"
+            assert token.get() == "new"
+
+    def test_single_flight(self):
+        """Test concurrent workers share a single refresh."""
+        calls = []
+
+        def auth(*args, **kwargs):
+            calls.append(1)
+            time.sleep(0.05)
+            return response(data={"access_token": "abc", "expires_in": 3600})
+
+        token = GuestToken("auth")
+        with patch("jst_django.backends.tahrirchi.requests.post", side_effect=auth):
+            threads = [threading.Thread(target=token.get) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert len(calls) == 1
+
+    def test_retry_on_unauthorized(self):
+        """Test rejected token is refreshed and the batch retried."""
+        tokens = iter(["revoked", "fresh"])
+
+        def post(url, **kwargs):
+            if url == TahrirchiBackend.auth_url:
+                return response(data={"access_token": next(tokens), "expires_in": 3600})
+            if kwargs["headers"]["Authorization"] == "Bearer revoked":
+                return response(status=401)
+            return response(sentences=[{"translated": "Salom"}])
+
+        with patch("jst_django.backends.tahrirchi.requests.post", side_effect=post):
+            assert TahrirchiBackend().translate(["Hello"], "eng_Latn", "uzn_Latn") == ["Salom"]
+
+    def test_failure_raises_after_retries(self):
+        """Test failing requests are retried and then reported."""
+        backend = TahrirchiBackend({"retries": 2, "backoff": 0})
+        with patch.object(TahrirchiBackend, "_request", side_effect=APIError("down")) as request:
+            with pytest.raises(APIError):
+                backend.translate(["Hello"], "eng_Latn", "uzn_Latn")
+        assert request.call_count == 3
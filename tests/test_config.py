@@ -1,12 +1,14 @@
 """Tests for config module."""
 
 import json
+import os
+import pickle
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from jst_django.config import ConfigManager
+from jst_django.config import ConfigManager, PathTable
 from jst_django.exceptions import ConfigurationError
 
 
@@ -75,3 +77,49 @@ class TestConfigManager:
         config_manager = ConfigManager()
         with pytest.raises(ConfigurationError):
             config_manager._validate_config({"dirs": "invalid"})
+
+    def test_validate_config_invalid_pagination(self):
+        """Test unknown pagination style."""
+        config_manager = ConfigManager()
+        with pytest.raises(ConfigurationError):
+            config_manager._validate_config({"pagination": {"style": "offset"}})
+
+    def test_reload_on_mtime_change(self, temp_config_file):
+        """Test config is reparsed only when file mtime changes."""
+        config_manager = ConfigManager(temp_config_file)
+        first = config_manager.load()
+        assert config_manager.load() is first
+
+        temp_config_file.write_text(json.dumps({"import_path": "other."}))
+        stat = temp_config_file.stat()
+        os.utime(temp_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert config_manager.get("import_path") == "other."
+
+    def test_shared_instance(self, temp_config_file):
+        """Test shared manager is reused per path."""
+        assert ConfigManager.shared(temp_config_file) is ConfigManager.shared(temp_config_file)
+
+    def test_paths(self, temp_config_file):
+        """Test resolved path table."""
+        paths = ConfigManager(temp_config_file).paths()
+        assert paths.apps == "./apps/"
+        assert paths.import_path == "myapp."
+        assert paths.modules["admin"] == "admin/"
+        assert paths.stubs["model"] == "model.stub"
+        with pytest.raises(TypeError):
+            paths.modules["admin"] = "other/"
+
+    def test_paths_fallback(self):
+        """Test fallback config is used when file is missing."""
+        paths = ConfigManager(Path("nonexistent.json")).paths(fallback={"dirs": {"apps": "./"}})
+        assert paths.apps == "./"
+
+    def test_paths_pickle(self, temp_config_file):
+        """Test path table survives pickling for process pools."""
+        paths = ConfigManager(temp_config_file).paths()
+        assert pickle.loads(pickle.dumps(paths)) == paths
+
+    def test_paths_invalid(self):
+        """Test non string paths are rejected."""
+        with pytest.raises(ConfigurationError):
+            PathTable.from_config({"dirs": {"models": 1}})
@@ -0,0 +1,41 @@
+"""Tests for project creation."""
+
+import pytest
+
+from jst_django.commands.create import ProjectCreator
+from jst_django.exceptions import ValidationError
+
+
+class TestAnswers:
+    """Test answers file loading."""
+
+    def test_projects_with_defaults(self, tmp_path):
+        """Test answer sets inherit defaults and optional keys."""
+        path = tmp_path / "answers.yaml"
+        path.write_text(
+            "defaults:\n  runner: asgi\n  packages: [silk]\n"
+            "projects:\n  - project_name: alpha\n  - project_name: beta\n    port: 9000\n"
+        )
+        alpha, beta = ProjectCreator().load_answers(str(path))
+        assert alpha["runner"] == beta["runner"] == "asgi"
+        assert alpha["packages"] == ["silk"]
+        assert alpha["port"] == "8081"
+        assert beta["port"] == "9000"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "project_name: my-project\n",
+            "project_name: alpha\nport: 70000\n",
+            "project_name: alpha\nrunner: uwsgi\n",
+            "project_name: alpha\npackages: [unknown]\n",
+            "project_name: alpha\ncolour: red\n",
+            "[]\n",
+        ],
+    )
+    def test_invalid(self, tmp_path, content):
+        """Test answers are validated like prompts."""
+        path = tmp_path / "answers.yaml"
+        path.write_text(content)
+        with pytest.raises(ValidationError):
+            ProjectCreator().load_answers(str(path))
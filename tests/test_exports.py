@@ -0,0 +1,114 @@
+"""Tests for init export manager."""
+
+import pytest
+
+from jst_django.exceptions import ConfigurationError
+from jst_django.utils.exports import InitManager, public_names
+
+
+class TestInitManager:
+    """Test InitManager class."""
+
+    @pytest.fixture
+    def package(self, tmp_path):
+        """Create package with two modules."""
+        (tmp_path / "post.py").write_text("class PostModel: ...\n\n\ndef _private(): ...\n")
+        (tmp_path / "tag.py").write_text("class TagModel: ...\n")
+        return tmp_path
+
+    def test_star_exports_sorted_and_deduplicated(self, package):
+        """Test star style merges exports into sorted unique lines."""
+        init = package / "__init__.py"
+        init.write_text("from .tag import *  # noqa\n")
+        manager = InitManager()
+        manager.add(init, "post")
+        manager.add(init, "tag")
+        manager.add(init, "post")
+        manager.flush()
+        assert init.read_text() == "from .post import *  # noqa\nfrom .tag import *  # noqa\n"
+
+    def test_all_style(self, package):
+        """Test explicit imports with __all__."""
+        init = package / "__init__.py"
+        manager = InitManager(style="all")
+        manager.add(init, "tag")
+        manager.add(init, "post")
+        manager.flush()
+        assert init.read_text() == (
+            "from .post import PostModel\nfrom .tag import TagModel\n\n" '__all__ = ["PostModel", "TagModel"]\n'
+        )
+
+    def test_preamble_preserved(self, package):
+        """Test unrelated statements are kept."""
+        init = package / "__init__.py"
+        init.write_text('"""Models."""\n\nfrom .post import *  # noqa\n')
+        manager = InitManager()
+        manager.add(init, "tag")
+        manager.flush()
+        assert init.read_text() == '"""Models."""\n\nfrom .post import *  # noqa\nfrom .tag import *  # noqa\n'
+
+    def test_hand_written_exports_kept(self, package):
+        """Test explicit imports and __all__ written by the user survive in both styles."""
+        (package / "custom.py").write_text("def helper(): ...\n\n\ndef other(): ...\n")
+        init = package / "__init__.py"
+        mixed = '"""Models."""\n\nfrom .custom import helper\nfrom .post import *  # noqa\n\n__all__ = ["helper", "PostModel"]\n'
+        init.write_text(mixed)
+        manager = InitManager()
+        manager.add(init, "tag")
+        manager.flush()
+        assert init.read_text() == (
+            '"""Models."""\n\nfrom .custom import helper\n\nfrom .post import *  # noqa\nfrom .tag import *  # noqa\n\n'
+            '__all__ = ["helper", "PostModel"]\n'
+        )
+        (package / "custom.py").write_text("def helper(): ...\n")
+        init.write_text(mixed)
+        manager = InitManager(style="all")
+        manager.add(init, "tag")
+        manager.flush()
+        content = init.read_text()
+        assert "from .custom import helper\n" in content and '__all__ = ["helper", "PostModel"]' in content
+        assert content.count("__all__") == 1
+        assert content.index("from .tag import TagModel") < content.index("__all__")
+
+    def test_code_after_exports(self, package):
+        """Test statements after the leading imports stay below the exports."""
+        init = package / "__init__.py"
+        init.write_text('"""Models."""\n\nimport os\n\nfrom .post import *  # noqa\n\nROOT = os.getcwd()\n')
+        manager = InitManager()
+        manager.add(init, "tag")
+        manager.flush()
+        assert init.read_text() == (
+            '"""Models."""\n\nimport os\n\nfrom .post import *  # noqa\nfrom .tag import *  # noqa\n\n'
+            "ROOT = os.getcwd()\n"
+        )
+
+    def test_all_style_regenerated(self, package):
+        """Test output of the all style is taken over on the next run."""
+        init = package / "__init__.py"
+        manager = InitManager(style="all")
+        manager.add(init, "post")
+        manager.flush()
+        manager = InitManager(style="all")
+        manager.add(init, "tag")
+        manager.flush()
+        assert init.read_text() == (
+            "from .post import PostModel\nfrom .tag import TagModel\n\n" '__all__ = ["PostModel", "TagModel"]\n'
+        )
+
+    def test_long_lines_wrapped(self, package):
+        """Test explicit imports are wrapped like black."""
+        init = package / "__init__.py"
+        manager = InitManager(style="all", line_length=20)
+        manager.add(init, "post")
+        manager.flush()
+        assert init.read_text() == 'from .post import (\n    PostModel,\n)\n\n__all__ = [\n    "PostModel",\n]\n'
+
+    def test_invalid_style(self):
+        """Test unknown style is rejected."""
+        with pytest.raises(ConfigurationError):
+            InitManager(style="invalid")
+
+    def test_public_names(self, package):
+        """Test public names skip private definitions."""
+        assert public_names(package / "post.py") == ["PostModel"]
+        assert public_names(package / "missing.py") == []
@@ -0,0 +1,63 @@
+"""Tests for CRUD generation."""
+
+import json
+import os
+
+import pytest
+
+from jst_django.commands.generate import Generate
+from jst_django.utils.tokenize import Tokenize
+
+URLS = """from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+router = DefaultRouter()
+
+urlpatterns = [path("", include(router.urls))]
+"""
+
+
+def tree(path):
+    """Relative paths of the project with their contents."""
+    result = {}
+    for root, _, files in os.walk(path):
+        for name in files:
+            file = os.path.join(root, name)
+            result[os.path.relpath(file, path)] = open(file, encoding="utf-8").read()
+    return result
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Make a project with two apps and return a function generating into it."""
+
+    def make(name, jobs):
+        root = tmp_path / name
+        for app in ("blog", "shop"):
+            (root / "core" / "apps" / app).mkdir(parents=True)
+            (root / "core" / "apps" / app / "apps.py").write_text("")
+            (root / "core" / "apps" / app / "urls.py").write_text(URLS)
+        (root / "jst.json").write_text(json.dumps({"dirs": {"apps": "./core/apps/"}, "import_path": "core.apps."}))
+        monkeypatch.chdir(root)
+        generate = Generate()
+        generate.fields = Tokenize("title:char,author:fk(UserModel):null").make()
+        generate.file_name = "post"
+        generate.generate_in_apps(["shop", "blog"], ["post", "tag"], generate.modules, jobs)
+        return tree(root)
+
+    return make
+
+
+class TestGenerateInApps:
+    """Test generation into several apps."""
+
+    def test_parallel_same_as_serial(self, project):
+        """Test apps generated by a process pool match a serial run file for file."""
+        serial = project("serial", jobs=1)
+        parallel = project("parallel", jobs=2)
+        assert sorted(parallel) == sorted(serial)
+        for path, content in serial.items():
+            assert parallel[path] == content, path
+        for app in ("blog", "shop"):
+            urls = serial[os.path.join("core", "apps", app, "urls.py")]
+            assert 'router.register("post", PostView' in urls and 'router.register("tag", TagView' in urls
@@ -0,0 +1,106 @@
+"""Tests for module install and upgrade."""
+
+import hashlib
+import json
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jst_django.commands.install import Module
+from jst_django.exceptions import ConfigurationError
+from jst_django.utils.registry import ModuleRelease
+
+V1 = {
+    "apps.py": "name = '{{module_name}}'\n",
+    "models.py": "# v1\n",
+    "views.py": "# v1\n",
+    "old.py": "# v1\n",
+    "admin.py": "# v1\n",
+}
+V2 = {
+    "apps.py": "name = '{{module_name}}'\n",
+    "models.py": "# v2\n",
+    "views.py": "# v2\n",
+    "new.py": "# v2\n",
+    "admin.py": "# v1\n",
+    "jst-module.json": json.dumps({"requirements": ["aiogram>=3"]}),
+}
+
+
+def archive(path, files):
+    """GitHub style module archive."""
+    with zipfile.ZipFile(path, "w") as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(f"module-bot-1/{name}", content)
+    return path
+
+
+@pytest.fixture
+def module(tmp_path, monkeypatch):
+    """Module installer in an empty project."""
+    monkeypatch.chdir(tmp_path)
+    jst = MagicMock()
+    jst.load_config.return_value = {}
+    jst.paths.return_value = SimpleNamespace(apps="core/apps/")
+    with patch("jst_django.commands.install.Jst", return_value=jst):
+        module = Module()
+    archives = {"1.0.0": archive(tmp_path / "v1.zip", V1), "2.0.0": archive(tmp_path / "v2.zip", V2)}
+    module.registry = MagicMock()
+    module.registry.resolve.side_effect = lambda name, version=None: ModuleRelease(name, version or "2.0.0", "")
+    module.registry.archive.side_effect = lambda release: archives[release.version]
+    module._install("shop", archives["1.0.0"], ModuleRelease("bot", "1.0.0", ""))
+    return module
+
+
+class TestModule:
+    """Test Module install manifest and upgrade."""
+
+    def test_install_manifest(self, module, tmp_path):
+        """Test installed files are listed with their hashes."""
+        app = tmp_path / "core" / "apps" / "shop"
+        assert (app / "apps.py").read_text() == "name = 'shop'\n"
+        manifest = module.load_manifest("shop")
+        assert manifest["module"] == "bot" and manifest["version"] == "1.0.0"
+        assert sorted(manifest["files"]) == sorted(V1)
+
+    def test_upgrade(self, module, tmp_path):
+        """Test only upstream changes of unedited files are written."""
+        app = tmp_path / "core" / "apps" / "shop"
+        (app / "views.py").write_text("# local\n")
+        (tmp_path / "requirements.txt").write_text("django\n")
+        statuses = module.upgrade("shop")
+        assert statuses == {
+            "jst-module.json": "added",
+            "models.py": "updated",
+            "new.py": "added",
+            "old.py": "removed",
+            "views.py": "conflict",
+        }
+        assert (app / "models.py").read_text() == "# v2\n"
+        assert (app / "views.py").read_text() == "# local\n"
+        assert not (app / "old.py").exists()
+        assert (tmp_path / "requirements.txt").read_text() == "django\naiogram>=3\n"
+        manifest = module.load_manifest("shop")
+        assert manifest["version"] == "2.0.0"
+        assert "old.py" not in manifest["files"]
+        # Conflicts stay conflicts on the next upgrade
+        assert manifest["files"]["views.py"] == hashlib.sha256(b"# v1\n").hexdigest()
+
+    def test_upgrade_same_version(self, module):
+        """Test nothing happens when already on the version."""
+        assert module.upgrade("shop", "1.0.0") == {}
+
+    def test_installed_modules(self, module, tmp_path):
+        """Test installed modules are read from their manifests."""
+        legacy = tmp_path / "core" / "apps" / "legacy"
+        legacy.mkdir()
+        (legacy / "apps.py").write_text("")
+        (tmp_path / "core" / "apps" / "__pycache__").mkdir()
+        assert module.installed_modules() == {"bot": "1.0.0", "legacy": None}
+
+    def test_missing_manifest(self, module):
+        """Test apps installed without manifest."""
+        with pytest.raises(ConfigurationError):
+            module.load_manifest("missing")
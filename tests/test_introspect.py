@@ -0,0 +1,108 @@
+"""Tests for model introspection from source."""
+
+import json
+
+import pytest
+
+from jst_django.exceptions import CodeGenerationError
+from jst_django.utils.introspect import ModelIntrospector, parse_module
+
+SHARED = """
+from django.db import models
+from django_core.models import AbstractBaseModel
+
+
+class TimestampedModel(AbstractBaseModel):
+    published = models.BooleanField(default=False)
+
+    class Meta:
+        abstract = True
+"""
+
+POST = """
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from core.apps.shared import models as shared
+from .base import SluggedModel
+
+
+class PostModel(SluggedModel, shared.TimestampedModel):
+    title = models.CharField(
+        verbose_name=_("title"),
+        max_length=255,
+    )
+    category: models.ForeignKey = models.ForeignKey("CategoryModel", on_delete=models.CASCADE)
+    objects = models.Manager()
+
+    def __str__(self):
+        return self.title
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with a models package and a shared abstract model."""
+    models = tmp_path / "core" / "apps" / "blog" / "models"
+    models.mkdir(parents=True)
+    (models / "__init__.py").write_text("from .post import *  # noqa\n")
+    (models / "base.py").write_text(
+        "from django.db import models\n\n\nclass SluggedModel(models.Model):\n    slug = models.SlugField(unique=True)\n"
+    )
+    (models / "post.py").write_text(POST)
+    shared = tmp_path / "core" / "apps" / "shared"
+    shared.mkdir(parents=True)
+    (shared / "__init__.py").write_text("")
+    (shared / "models.py").write_text(SHARED)
+    return tmp_path
+
+
+class TestModelIntrospector:
+    """Test ModelIntrospector class."""
+
+    def test_fields(self, project):
+        """Test fields of the model and its project bases, managers skipped."""
+        fields = ModelIntrospector(project).fields("core.apps.blog.models", "PostModel")
+        assert list(fields) == ["published", "slug", "title", "category"]
+        assert fields["title"] == "models.CharField(verbose_name=_('title'), max_length=255)"
+        assert fields["category"] == "models.ForeignKey('CategoryModel', on_delete=models.CASCADE)"
+
+    def test_tokens(self, project):
+        """Test the stub context of generated modules."""
+        tokens = ModelIntrospector(project).tokens("core.apps.blog.models", "PostModel")
+        assert list(tokens.keys) == ["published", "slug", "title", "category"]
+        assert tokens.model[0] == "published = models.BooleanField(default=False)"
+
+    def test_missing_model(self, project):
+        """Test unknown model class."""
+        with pytest.raises(CodeGenerationError):
+            ModelIntrospector(project).fields("core.apps.blog.models", "TagModel")
+
+    def test_cache(self, project, monkeypatch):
+        """Test unchanged files are not parsed again, changed ones are."""
+        cache = project / ".jst" / "models.json"
+        introspector = ModelIntrospector(project, cache)
+        introspector.fields("core.apps.blog.models", "PostModel")
+        introspector.save()
+        assert sorted(json.loads(cache.read_text())["files"]) == [
+            "core/apps/blog/models/__init__.py",
+            "core/apps/blog/models/base.py",
+            "core/apps/blog/models/post.py",
+            "core/apps/shared/models.py",
+        ]
+        parsed = []
+        monkeypatch.setattr(
+            "jst_django.utils.introspect.parse_module",
+            lambda source, package: parsed.append(package) or parse_module(source, package),
+        )
+        post = project / "core" / "apps" / "blog" / "models" / "post.py"
+        post.write_text(POST.replace("    objects = models.Manager()\n", "    views = models.IntegerField()\n"))
+        fields = ModelIntrospector(project, cache).fields("core.apps.blog.models", "PostModel")
+        assert parsed == ["core.apps.blog.models"]
+        assert list(fields)[-1] == "views"
+
+    def test_relative_imports(self):
+        """Test relative imports are resolved against the package."""
+        parsed = parse_module("from .base import A\nfrom ..shared.models import *\n", "core.apps.blog.models")
+        assert parsed["imports"] == {"A": ["core.apps.blog.models.base", "A"]}
+        assert parsed["stars"] == ["core.apps.blog.shared.models"]
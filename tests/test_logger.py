@@ -0,0 +1,69 @@
+"""Tests for queued logger."""
+
+import json
+import logging
+import threading
+
+import pytest
+
+from jst_django.utils.logger import logger
+
+
+class TestLogger:
+    """Test Logger class."""
+
+    @pytest.fixture(autouse=True)
+    def restore(self):
+        """Restore handlers and level changed by a test."""
+        handlers, level = list(logger._handlers), logger._handlers[0].level
+        yield
+        logger.flush()
+        for handler in logger._handlers[len(handlers) :]:
+            handler.close()
+        logger._listener.stop()
+        logger._handlers = handlers
+        logger._start_listener()
+        logger.set_level(level)
+
+    def test_emit_does_not_write(self):
+        """Test records are written by the listener thread."""
+        threads = []
+
+        class Capture(logging.Handler):
+            def emit(self, record):
+                threads.append(threading.current_thread())
+
+        logger._listener.stop()
+        logger._handlers.append(Capture())
+        logger._start_listener()
+        logger.info("hello")
+        logger.flush()
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+
+    def test_file_sink(self, tmp_path):
+        """Test JSON lines sink with run id and timing."""
+        path = logger.add_file_sink(tmp_path / "jst.log")
+        logger.set_run_id("run-1")
+        logger.info("Generated %s files", 3, extra={"duration": 0.5})
+        logger.flush()
+        record = json.loads(path.read_text(encoding="utf-8").splitlines()[-1])
+        assert record["message"] == "Generated 3 files"
+        assert record["run_id"] == "run-1"
+        assert record["duration"] == 0.5
+        assert record["module"] == "test_logger"
+
+    def test_disabled_level_skips_formatting(self):
+        """Test messages below the level are never formatted."""
+        calls = []
+
+        class Expensive:
+            def __str__(self):
+                calls.append(1)
+                return "expensive"
+
+        logger.set_level(logging.INFO)
+        logger.debug("value: %s", Expensive())
+        logger.flush()
+        assert calls == []
+        assert not logger.is_enabled(logging.DEBUG)
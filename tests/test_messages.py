@@ -0,0 +1,138 @@
+"""Tests for message extraction."""
+
+import gettext
+
+import polib
+
+from jst_django.utils.messages import (
+    ExtractionCache,
+    Message,
+    compile_catalog,
+    extract,
+    extract_python,
+    extract_template,
+    find_catalogs,
+    merge_catalog,
+)
+
+MODEL = """from django.utils.translation import gettext_lazy as _, pgettext_lazy as p
+from django.utils import translation
+
+
+class Post:
+    title = _("Title")
+    kind = p("post kind", "Kind")
+    dynamic = _(name)
+
+    def count(self, n):
+        return translation.ngettext("%(n)d post", "%(n)d posts", n)
+"""
+
+TEMPLATE = """{% load i18n %}
+<h1>{% trans "Title" %}</h1>
+<p>{% translate 'Open' context "door" as open %}</p>
+{% blocktrans trimmed with name=user.name %}
+  Hello {{ name }},
+  welcome!
+{% endblocktrans %}
+{% blocktranslate count counter=items|length %}One item{% plural %}{{ counter }} items{% endblocktranslate %}
+{{ value|default:_("Empty") }}
+"""
+
+
+class TestExtract:
+    """Test message extraction."""
+
+    def test_python(self):
+        """Test aliases, context and plural, non literal calls skipped."""
+        assert extract_python(MODEL) == [
+            Message(None, "Title", None, 6),
+            Message("post kind", "Kind", None, 7),
+            Message(None, "%(n)d post", "%(n)d posts", 11),
+        ]
+
+    def test_template(self):
+        """Test trans, blocktrans and _() in templates."""
+        assert extract_template(TEMPLATE) == [
+            Message(None, "Title", None, 2),
+            Message("door", "Open", None, 3),
+            Message(None, "Hello %(name)s, welcome!", None, 4),
+            Message(None, "One item", "%(counter)s items", 8),
+            Message(None, "Empty", None, 9),
+        ]
+
+    def test_cache_skips_unchanged_files(self, tmp_path):
+        """Test unchanged files are not extracted again."""
+        (tmp_path / "models.py").write_text(MODEL)
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "post.html").write_text(TEMPLATE)
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / ".venv" / "ignored.py").write_text(MODEL)
+        cache_path = tmp_path / ".jst" / "makemessages.json"
+
+        files, extracted = extract(tmp_path, ExtractionCache(cache_path), jobs=1)
+        assert list(files) == ["models.py", "templates/post.html"]
+        assert extracted == 2
+
+        (tmp_path / "models.py").write_text(MODEL.replace("Title", "Name"))
+        files, extracted = extract(tmp_path, ExtractionCache(cache_path), jobs=1)
+        assert extracted == 1
+        assert files["models.py"][0].msgid == "Name"
+        assert files["templates/post.html"][0].msgid == "Title"
+
+
+class TestMergeCatalog:
+    """Test merging into catalogs."""
+
+    def test_merge(self, tmp_path):
+        """Test translations are kept and removed messages become obsolete."""
+        path = tmp_path / "uz" / "LC_MESSAGES" / "django.po"
+        files = {"models.py": extract_python(MODEL)}
+        assert merge_catalog(path, files, "uz")
+
+        catalog = polib.pofile(str(path))
+        assert catalog.metadata["Plural-Forms"] == "nplurals=1; plural=0;"
+        catalog.find("Title").msgstr = "Sarlavha"
+        catalog.save()
+        assert not merge_catalog(path, files, "uz")
+
+        files = {"models.py": extract_python(MODEL.replace('"Kind"', '"Type"'))}
+        assert merge_catalog(path, files, "uz")
+        catalog = polib.pofile(str(path))
+        assert catalog.find("Title").msgstr == "Sarlavha"
+        assert catalog.find("Title").occurrences == [("models.py", "6")]
+        assert catalog.find("Type", msgctxt="post kind") is not None
+        assert [entry.msgid for entry in catalog.obsolete_entries()] == ["Kind"]
+        assert "python-format" in catalog.find("%(n)d post").flags
+
+
+class TestCompileCatalog:
+    """Test .mo compilation."""
+
+    def test_compile(self, tmp_path):
+        """Test compiled catalog is readable by gettext and skips fuzzy entries."""
+        path = tmp_path / "locale" / "uz" / "LC_MESSAGES" / "django.po"
+        merge_catalog(path, {"models.py": extract_python(MODEL)}, "uz")
+        catalog = polib.pofile(str(path))
+        catalog.find("Title").msgstr = "Sarlavha"
+        catalog.find("Kind", msgctxt="post kind").msgstr = "Tur"
+        catalog.find("Kind", msgctxt="post kind").flags.append("fuzzy")
+        catalog.save()
+
+        with open(compile_catalog(path), "rb") as file:
+            translations = gettext.GNUTranslations(file)
+        assert translations.gettext("Title") == "Sarlavha"
+        assert translations.pgettext("post kind", "Kind") == "Kind"
+        assert translations.info()["language"] == "uz"
+
+    def test_find_catalogs(self, tmp_path):
+        """Test project and app catalogs are found."""
+        for catalog in ["locale/uz/LC_MESSAGES/django.po", "core/apps/blog/locale/ru/LC_MESSAGES/django.po"]:
+            (tmp_path / catalog).parent.mkdir(parents=True)
+            (tmp_path / catalog).write_text("")
+        assert [
+            path.relative_to(tmp_path).as_posix() for path in find_catalogs(tmp_path, "./locale/", "core/apps")
+        ] == [
+            "core/apps/blog/locale/ru/LC_MESSAGES/django.po",
+            "locale/uz/LC_MESSAGES/django.po",
+        ]
@@ -0,0 +1,72 @@
+"""Tests for offline mode."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from jst_django.backends import TahrirchiBackend
+from jst_django.exceptions import OfflineError
+from jst_django.utils.api import Github
+from jst_django.utils.network import require_network
+from jst_django.utils.registry import ModuleRegistry
+from jst_django.utils.template import TemplateCache
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Turn offline mode on."""
+    monkeypatch.setenv("JST_OFFLINE", "1")
+
+
+class TestOffline:
+    """Test network consumers in offline mode."""
+
+    def test_require_network(self, offline):
+        """Test missing cache entry is named."""
+        with pytest.raises(OfflineError, match="template V1"):
+            require_network("template V1")
+
+    def test_online(self):
+        """Test nothing is raised online."""
+        require_network("template V1")
+
+    @patch("requests.request")
+    def test_github_served_from_cache(self, request, monkeypatch):
+        """Test GET responses cached online answer offline."""
+        request.return_value = Mock(status_code=200, json=Mock(return_value={"name": "V1"}))
+        assert Github().latest_release() == "V1"
+        monkeypatch.setenv("JST_OFFLINE", "1")
+        request.reset_mock()
+        assert Github().latest_release() == "V1"
+        request.assert_not_called()
+        with pytest.raises(OfflineError, match="releases"):
+            Github().releases()
+        request.assert_not_called()
+
+    def test_template_miss(self, offline):
+        """Test template archive is not downloaded."""
+        with patch("jst_django.utils.template.requests.get") as get:
+            with pytest.raises(OfflineError, match="template V9"):
+                TemplateCache().get("V9")
+        get.assert_not_called()
+
+    def test_registry(self, offline):
+        """Test stale module index is used and a missing one fails."""
+        registry = ModuleRegistry(ttl=0)
+        with pytest.raises(OfflineError, match="module index"):
+            registry.index()
+        registry._write(
+            {"fetched_at": 0, "index": {"modules": {"bot": {"latest": "1.0", "versions": {"1.0": {"url": "u"}}}}}}
+        )
+        assert ModuleRegistry(ttl=0).resolve("bot").version == "1.0"
+        with pytest.raises(OfflineError, match="bot==2.0"):
+            ModuleRegistry(ttl=0).resolve("bot", "2.0")
+
+    def test_backend_not_retried(self, offline):
+        """Test network backend fails at once."""
+        backend = TahrirchiBackend()
+        with patch("jst_django.backends.base.time.sleep") as sleep, patch.object(backend, "_translate") as translate:
+            with pytest.raises(OfflineError):
+                backend.translate(["salom"], "uzn_Latn", "eng_Latn")
+        translate.assert_not_called()
+        sleep.assert_not_called()
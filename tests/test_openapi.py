@@ -0,0 +1,240 @@
+"""Tests for OpenAPI model fields."""
+
+import json
+
+import pytest
+import yaml
+
+from jst_django.commands.generate import generate_from_openapi
+from jst_django.exceptions import ValidationError
+from jst_django.utils.openapi import OpenAPIParser, RefResolver
+
+COMMON = {
+    "Status": {"type": "string", "enum": ["draft", "published"]},
+    "Author": {"type": "object", "properties": {"name": {"type": "string", "maxLength": 100}}},
+}
+
+SPEC = {
+    "openapi": "3.0.3",
+    "components": {
+        "schemas": {
+            "Category": {
+                "type": "object",
+                "required": ["title"],
+                "properties": {"id": {"type": "integer", "readOnly": True}, "title": {"type": "string"}},
+            },
+            "Tag": {"type": "object", "properties": {"name": {"type": "string"}}},
+            "Priority": {"type": "integer", "enum": [1, 2, 3]},
+            "BlogPost": {
+                "allOf": [{"$ref": "#/components/schemas/Category"}],
+                "required": ["category", "status", "views"],
+                "properties": {
+                    "status": {"$ref": "common.json#/Status"},
+                    "priority": {"$ref": "#/components/schemas/Priority"},
+                    "category": {"$ref": "#/components/schemas/Category"},
+                    "author": {"allOf": [{"$ref": "common.json#/Author"}], "nullable": True},
+                    "editor": {"$ref": "common.json#/Author"},
+                    "tags": {"type": "array", "items": {"$ref": "#/components/schemas/Tag"}},
+                    "views": {"type": "integer", "format": "int64", "default": 0},
+                    "rating": {"type": ["number", "null"]},
+                    "published_at": {"type": "string", "format": "date-time"},
+                    "cover": {"type": "string", "format": "binary"},
+                    "extra": {"type": "object", "additionalProperties": True},
+                    "created_at": {"type": "string", "format": "date-time", "readOnly": True},
+                },
+            },
+        }
+    },
+}
+
+
+@pytest.fixture
+def spec(tmp_path):
+    """Spec with a referenced document."""
+    (tmp_path / "common.json").write_text(json.dumps(COMMON))
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(SPEC))
+    return path
+
+
+class TestOpenAPIParser:
+    """Test OpenAPIParser class."""
+
+    def test_models(self, spec):
+        """Test object schemas become models, scalar schemas are skipped."""
+        models = list(OpenAPIParser(spec).models())
+        assert [(model.name, model.schema) for model in models] == [
+            ("category", "Category"),
+            ("tag", "Tag"),
+            ("blogpost", "BlogPost"),
+        ]
+        assert models[0].fields.model == ['title = models.CharField(verbose_name=_("title"), max_length=255)']
+
+    def test_fields(self, spec):
+        """Test types, formats, enums and relations."""
+        fields = list(OpenAPIParser(spec).models())[2].fields.items
+        assert list(fields) == [
+            "title",
+            "status",
+            "priority",
+            "category",
+            "author",
+            "editor",
+            "tags",
+            "views",
+            "rating",
+            "published_at",
+            "cover",
+            "extra",
+        ]
+        # Required by the ``allOf`` member
+        assert fields["title"] == 'models.CharField(verbose_name=_("title"), max_length=255)'
+        assert fields["status"] == (
+            'models.CharField(verbose_name=_("status"), max_length=9, '
+            'choices=[("draft", "draft"), ("published", "published")])'
+        )
+        assert "models.IntegerField(" in fields["priority"] and 'choices=[(1, "1")' in fields["priority"]
+        assert fields["category"] == (
+            'models.ForeignKey("CategoryModel", verbose_name=_("category"), on_delete=models.CASCADE)'
+        )
+        # Author of the other document is not generated, no relation to a missing model
+        assert fields["author"] == 'models.JSONField(verbose_name=_("author"), default=dict, null=True, blank=True)'
+        assert fields["editor"] == fields["author"].replace("author", "editor")
+        assert fields["tags"] == 'models.ManyToManyField("TagModel", verbose_name=_("tags"), blank=True)'
+        assert fields["views"] == 'models.BigIntegerField(verbose_name=_("views"), default=0)'
+        assert fields["rating"].startswith("models.FloatField(")
+        assert fields["published_at"].startswith("models.DateTimeField(")
+        assert 'upload_to="covers"' in fields["cover"]
+        assert fields["extra"].startswith('models.JSONField(verbose_name=_("extra"), default=dict')
+
+    def test_relations_to_generated_schemas(self, spec, tmp_path):
+        """Test schemas left out by ``only`` are stored as JSON, aliases keep their relations."""
+        fields = list(OpenAPIParser(spec).models(["Tag", "BlogPost"]))[1].fields.items
+        assert fields["category"] == 'models.JSONField(verbose_name=_("category"), default=dict)'
+        assert fields["tags"] == 'models.ManyToManyField("TagModel", verbose_name=_("tags"), blank=True)'
+        path = tmp_path / "alias.json"
+        document = {
+            "$defs": {
+                "Writer": {"$ref": "common.json#/Author"},
+                "Book": {"properties": {"writers": {"type": "array", "items": {"$ref": "#/$defs/Writer"}}}},
+            }
+        }
+        path.write_text(json.dumps(document))
+        fields = list(OpenAPIParser(path).models())[1].fields.items
+        assert fields["writers"] == 'models.ManyToManyField("WriterModel", verbose_name=_("writers"), blank=True)'
+        fields = list(OpenAPIParser(path).models(["Book"]))[0].fields.items
+        assert fields["writers"] == ('models.JSONField(verbose_name=_("writers"), default=list, null=True, blank=True)')
+
+    def test_attribute_names(self, tmp_path):
+        """Test property names that are not valid attributes keep their column."""
+        path = tmp_path / "spec.json"
+        properties = {name: {"type": "string"} for name in ("first-name", "class", "from", "lastName", "2fa")}
+        path.write_text(json.dumps({"$defs": {"User": {"required": ["class"], "properties": properties}}}))
+        fields = list(OpenAPIParser(path).models())[0].fields.items
+        assert list(fields) == ["first_name", "class_field", "from_field", "lastName", "field_2fa"]
+        assert fields["first_name"] == (
+            'models.CharField(verbose_name=_("first-name"), max_length=255, db_column="first-name", '
+            "null=True, blank=True)"
+        )
+        assert fields["class_field"] == ('models.CharField(verbose_name=_("class"), max_length=255, db_column="class")')
+        assert "db_column" not in fields["lastName"]
+        properties["first_name"] = {"type": "string"}
+        path.write_text(json.dumps({"$defs": {"User": {"properties": properties}}}))
+        with pytest.raises(ValidationError):
+            list(OpenAPIParser(path).models())
+
+    def test_circular_all_of(self, tmp_path):
+        """Test allOf members including each other are merged once."""
+        path = tmp_path / "spec.json"
+        document = {
+            "$defs": {
+                "A": {"allOf": [{"$ref": "#/$defs/B"}], "properties": {"a": {"type": "string"}}},
+                "B": {"allOf": [{"$ref": "#/$defs/A"}], "properties": {"b": {"type": "integer"}}},
+                "C": {"allOf": [{"$ref": "#/$defs/C"}]},
+            }
+        }
+        path.write_text(json.dumps(document))
+        models = list(OpenAPIParser(path).models())
+        assert [model.schema for model in models] == ["A", "B"]
+        assert list(models[0].fields.items) == ["b", "a"]
+
+    def test_models_streamed(self, tmp_path):
+        """Test a model is yielded before later schemas are read."""
+        path = tmp_path / "spec.json"
+        document = {"$defs": {"A": {"properties": {"a": {"type": "string"}}}, "B": {"$ref": "#/$defs/Missing"}}}
+        path.write_text(json.dumps(document))
+        models = OpenAPIParser(path).models()
+        assert next(models).schema == "A"
+        with pytest.raises(ValidationError):
+            next(models)
+
+    def test_documents_loaded_once(self, spec, tmp_path, monkeypatch):
+        """Test every referenced document is parsed once for many schemas."""
+        schemas = {f"Item{i}": {"properties": {"status": {"$ref": "common.json#/Status"}}} for i in range(300)}
+        path = tmp_path / "large.yaml"
+        path.write_text(yaml.safe_dump({"definitions": schemas}))
+        loads = []
+        original = RefResolver.document
+
+        def document(self, document_path):
+            if document_path not in self.documents:
+                loads.append(document_path.name)
+            return original(self, document_path)
+
+        monkeypatch.setattr(RefResolver, "document", document)
+        assert len(list(OpenAPIParser(path).models())) == 300
+        assert sorted(loads) == ["common.json", "large.yaml"]
+
+    def test_broken_ref(self, tmp_path):
+        """Test reference to a missing schema."""
+        path = tmp_path / "spec.json"
+        path.write_text(json.dumps({"$defs": {"A": {"properties": {"b": {"$ref": "#/$defs/B"}}}}}))
+        with pytest.raises(ValidationError):
+            list(OpenAPIParser(path).models())
+
+    def test_circular_ref(self, tmp_path):
+        """Test references pointing to each other."""
+        path = tmp_path / "spec.json"
+        document = {"$defs": {"A": {"properties": {"b": {"$ref": "#/$defs/B"}}}, "B": {"$ref": "#/$defs/C"}}}
+        document["$defs"]["C"] = {"$ref": "#/$defs/B"}
+        path.write_text(json.dumps(document))
+        with pytest.raises(ValidationError):
+            list(OpenAPIParser(path).models())
+
+    def test_no_schemas(self, tmp_path):
+        """Test document without named schemas."""
+        path = tmp_path / "spec.json"
+        path.write_text(json.dumps({"openapi": "3.0.3"}))
+        with pytest.raises(ValidationError):
+            list(OpenAPIParser(path).models())
+
+
+class TestGenerateFromOpenAPI:
+    """Test make:from-openapi command."""
+
+    def test_related_schemas(self, tmp_path, monkeypatch):
+        """Test two related schemas generated into one app reference each other."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "jst.json").write_text(json.dumps({"dirs": {"apps": "./core/apps/"}, "import_path": "core.apps."}))
+        app = tmp_path / "core" / "apps" / "blog"
+        app.mkdir(parents=True)
+        (app / "apps.py").write_text("")
+        (app / "urls.py").write_text('router = DefaultRouter()\n\nurlpatterns = [path("", include(router.urls))]\n')
+        spec = tmp_path / "blog-api.json"
+        schemas = {
+            "Category": {"type": "object", "properties": {"title": {"type": "string"}}},
+            "Post": {
+                "type": "object",
+                "required": ["category"],
+                "properties": {"category": {"$ref": "#/components/schemas/Category"}},
+            },
+        }
+        spec.write_text(json.dumps({"openapi": "3.0.3", "components": {"schemas": schemas}}))
+        generate_from_openapi(str(spec), None, None, ["blog"], 1)
+        models = (app / "models" / "blog_api.py").read_text()
+        assert "class CategoryModel(AbstractBaseModel):" in models and "class PostModel(AbstractBaseModel):" in models
+        assert (
+            'category = models.ForeignKey("CategoryModel", verbose_name=_("category"), on_delete=models.CASCADE)'
+            in models
+        )
+        assert "JSONField" not in models
@@ -0,0 +1,87 @@
+"""Tests for streaming PO catalog."""
+
+import polib
+import pytest
+
+from jst_django.utils.po import POCatalog
+
+CATALOG = """# Translation file.
+msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+"Language: uz\\n"
+
+#: core/apps/blog/models/post.py:10
+msgid "Title"
+msgstr ""
+
+#, python-format
+msgid "Hello %(name)s"
+msgstr "Salom %(name)s"
+
+msgctxt "menu"
+msgid ""
+"A long message that was wrapped "
+"over two lines"
+msgstr ""
+
+msgid "One post"
+msgid_plural "Many posts"
+msgstr[0] ""
+msgstr[1] ""
+
+#~ msgid "Old"
+#~ msgstr ""
+"""
+
+
+class TestPOCatalog:
+    """Test POCatalog class."""
+
+    @pytest.fixture
+    def catalog_file(self, tmp_path):
+        """Create catalog file."""
+        path = tmp_path / "django.po"
+        path.write_text(CATALOG, encoding="utf-8")
+        return path
+
+    def test_untouched_copied_byte_for_byte(self, catalog_file):
+        """Test catalog without changes is written back unchanged."""
+        with POCatalog(catalog_file) as catalog:
+            for _ in catalog:
+                catalog.commit()
+        assert catalog_file.read_text(encoding="utf-8") == CATALOG
+
+    def test_untranslated(self, catalog_file):
+        """Test only live singular empty entries are untranslated."""
+        with POCatalog(catalog_file) as catalog:
+            untranslated = [entry.msgid for entry in catalog if entry.untranslated]
+        assert untranslated == ["Title", "A long message that was wrapped over two lines"]
+        assert POCatalog.count(catalog_file) == 4
+
+    def test_translate_compatible_with_polib(self, catalog_file):
+        """Test translated entries are readable by polib."""
+        with POCatalog(catalog_file) as catalog:
+            for entry in catalog:
+                if entry.untranslated:
+                    entry.msgstr = f'"{entry.msgid}"\n' * 3
+                catalog.commit()
+        po = polib.pofile(str(catalog_file))
+        assert po.find("Title").msgstr == '"Title"\n' * 3
+        assert po.find("Hello %(name)s").msgstr == "Salom %(name)s"
+        assert po.metadata["Language"] == "uz"
+        assert len(po.obsolete_entries()) == 1
+
+    def test_interrupted_run_keeps_progress(self, catalog_file):
+        """Test entries after an interruption are copied through."""
+        with pytest.raises(KeyboardInterrupt):
+            with POCatalog(catalog_file) as catalog:
+                for entry in catalog:
+                    if entry.msgid == "Title":
+                        entry.msgstr = "Sarlavha"
+                    if entry.msgctxt == "menu":
+                        raise KeyboardInterrupt
+                    catalog.commit()
+        content = catalog_file.read_text(encoding="utf-8")
+        assert 'msgstr "Sarlavha"' in content
+        assert content.replace('msgstr "Sarlavha"', 'msgstr ""', 1) == CATALOG
@@ -0,0 +1,120 @@
+"""Tests for module registry."""
+
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jst_django.exceptions import APIError, ModuleNotFoundError, VersionError
+from jst_django.utils.registry import ModuleRegistry
+
+RELEASES = [
+    {"name": "2.0.0-rc", "tag_name": "2.0.0-rc", "prerelease": True},
+    {"name": "1.1.0", "tag_name": "1.1.0"},
+    {"name": "1.0.0", "tag_name": "1.0.0"},
+]
+
+
+def response(data=b"archive"):
+    """Streaming download response."""
+    mock = MagicMock()
+    mock.__enter__.return_value = mock
+    mock.iter_content.return_value = [data]
+    return mock
+
+
+class TestModuleRegistry:
+    """Test ModuleRegistry class."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Isolate user cache and registry URL."""
+        monkeypatch.setenv("JST_CACHE_DIR", str(tmp_path))
+        monkeypatch.delenv("JST_MODULE_REGISTRY", raising=False)
+
+    @pytest.fixture
+    def github(self):
+        """GitHub releases of every module repository."""
+        with patch("jst_django.utils.registry.Github.conditional", return_value=(RELEASES, '"etag"')) as conditional:
+            yield conditional
+
+    def test_index_built_from_releases(self, github):
+        """Test index lists every module with versions, latest skips prereleases."""
+        index = ModuleRegistry().index()
+        assert sorted(index["modules"]) == ["authbot", "authv2", "bot", "default", "websocket"]
+        bot = index["modules"]["bot"]
+        assert bot["latest"] == "1.1.0"
+        assert bot["versions"]["1.0.0"]["url"].endswith("/module-bot/archive/refs/tags/1.0.0.zip")
+        assert github.call_count == 5
+
+    def test_index_cached(self, github):
+        """Test fresh index is served from disk."""
+        ModuleRegistry().index()
+        github.reset_mock()
+        assert ModuleRegistry().modules() == ["authbot", "authv2", "bot", "default", "websocket"]
+        github.assert_not_called()
+
+    def test_revalidated_with_etag(self, github):
+        """Test stale index is revalidated and kept on 304."""
+        ModuleRegistry().index()
+        github.reset_mock()
+        github.return_value = (None, '"etag"')
+        index = ModuleRegistry(ttl=0).index()
+        assert index["modules"]["bot"]["latest"] == "1.1.0"
+        github.assert_called_with("releases", '"etag"')
+
+    def test_pinned_version_offline(self, github):
+        """Test pinned version in a stale index needs no request."""
+        ModuleRegistry().index()
+        github.reset_mock()
+        release = ModuleRegistry(ttl=0).resolve("bot", "1.0.0")
+        assert release.version == "1.0.0"
+        github.assert_not_called()
+
+    def test_resolve_errors(self, github):
+        """Test unknown module and version."""
+        registry = ModuleRegistry()
+        with pytest.raises(ModuleNotFoundError):
+            registry.resolve("missing")
+        with pytest.raises(VersionError):
+            registry.resolve("bot", "9.9.9")
+
+    def test_stale_index_used_on_error(self, github):
+        """Test cached index is used when revalidation fails."""
+        ModuleRegistry().index()
+        github.side_effect = APIError("offline")
+        assert ModuleRegistry(ttl=0).resolve("bot").version == "1.1.0"
+
+    def test_archive_cached_and_verified(self, github):
+        """Test archive is downloaded once, its checksum recorded and checked."""
+        registry = ModuleRegistry()
+        release = registry.resolve("bot")
+        with patch("jst_django.utils.registry.requests.get", return_value=response()) as get:
+            path = registry.archive(release)
+            assert registry.archive(release) == path
+            assert get.call_count == 1
+            recorded = registry.resolve("bot", "1.1.0")
+            assert recorded.sha256 == hashlib.sha256(b"archive").hexdigest()
+            assert recorded.size == len(b"archive")
+            path.write_bytes(b"corrupted")
+            registry.archive(recorded)
+            assert get.call_count == 2
+        assert path.read_bytes() == b"archive"
+
+    def test_archive_checksum_mismatch(self, github):
+        """Test download not matching the index checksum."""
+        release = ModuleRegistry().resolve("bot")._replace(sha256="0" * 64)
+        with patch("jst_django.utils.registry.requests.get", return_value=response()):
+            with pytest.raises(APIError):
+                ModuleRegistry().archive(release)
+
+    def test_registry_url(self, monkeypatch):
+        """Test index document from JST_MODULE_REGISTRY."""
+        monkeypatch.setenv("JST_MODULE_REGISTRY", "https://example.com/index.json")
+        document = {"modules": {"bot": {"latest": "1.0.0", "versions": {"1.0.0": {"url": "u", "sha256": "s"}}}}}
+        mock = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        mock.json.return_value = document
+        with patch("jst_django.utils.registry.requests.get", return_value=mock) as get:
+            assert ModuleRegistry().resolve("bot").sha256 == "s"
+            ModuleRegistry(ttl=0).index()
+        assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
@@ -0,0 +1,101 @@
+"""Tests for native template renderer."""
+
+import json
+import os
+
+import pytest
+from cookiecutter.main import cookiecutter
+
+from jst_django.exceptions import FileOperationError, TemplateError
+from jst_django.utils.file import File
+from jst_django.utils.render import NativeRenderer
+
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR{{ not rendered }}\x00\xff"
+
+
+@pytest.fixture
+def template(tmp_path):
+    """Tiny cookiecutter template covering text, binary, copy-only files and hooks."""
+    root = tmp_path / "tpl"
+    project = root / "{{cookiecutter.project_slug}}"
+    (project / "{{cookiecutter.app}}" / "static").mkdir(parents=True)
+    (project / "raw").mkdir()
+    (root / "hooks").mkdir()
+    (root / "cookiecutter.json").write_text(
+        json.dumps(
+            {
+                "project_name": "Demo",
+                "project_slug": "{{ cookiecutter.project_name|lower }}",
+                "app": "core",
+                "_copy_without_render": ["raw", "*.html"],
+            }
+        )
+    )
+    (project / "README.md").write_text("# {{ cookiecutter.project_name }}\n")
+    (project / "page.html").write_text("{{ keep }}\n")
+    (project / "crlf.txt").write_bytes(b"{{ cookiecutter.app }}\r\n")
+    (project / "raw" / "x.txt").write_text("{{ raw }}\n")
+    (project / "{{cookiecutter.app}}" / "static" / "logo.png").write_bytes(PNG)
+    (project / "{{cookiecutter.app}}" / "apps.py").write_text("name = '{{ cookiecutter.app }}'\n")
+    (project / "manage.py").write_text("#!/usr/bin/env python\n")
+    os.chmod(project / "manage.py", 0o755)
+    (root / "hooks" / "post_gen_project.py").write_text("open('hooked', 'w').write('{{ cookiecutter.app }}')\n")
+    return root
+
+
+def tree(path):
+    """Relative paths with contents and modes."""
+    result = {}
+    for root, _, files in os.walk(path):
+        for name in files:
+            file = os.path.join(root, name)
+            result[os.path.relpath(file, path)] = (open(file, "rb").read(), os.stat(file).st_mode)
+    return result
+
+
+class TestNativeRenderer:
+    """Test NativeRenderer class."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_same_as_cookiecutter(self, template, tmp_path, monkeypatch, jobs):
+        """Test native output equals cookiecutter output."""
+        monkeypatch.setattr("jst_django.utils.render.CHUNK_SIZE", 1)
+        context = {"project_name": "Shop", "app": "orders"}
+        expected = cookiecutter(str(template), no_input=True, extra_context=context, output_dir=str(tmp_path / "a"))
+        project = NativeRenderer(template, jobs=jobs).render(context, tmp_path / "b")
+        assert os.path.basename(project) == "shop"
+        assert tree(project) == tree(expected)
+        assert tree(project)["orders/static/logo.png"][0] == PNG
+        assert tree(project)["crlf.txt"][0] == b"orders\r\n"
+
+    def test_existing_project(self, template, tmp_path):
+        """Test existing project directory is not overwritten."""
+        (tmp_path / "demo").mkdir()
+        with pytest.raises(FileOperationError):
+            NativeRenderer(template).render({}, tmp_path)
+
+    def test_render_error_cleans_up(self, template, tmp_path):
+        """Test broken template leaves no partial project."""
+        (template / "{{cookiecutter.project_slug}}" / "bad.txt").write_text("{% if %}")
+        with pytest.raises(TemplateError):
+            NativeRenderer(template, jobs=1).render({}, tmp_path)
+        assert not (tmp_path / "demo").exists()
+
+
+class TestFileCopy:
+    """Test File.copy."""
+
+    def test_contents_and_mode(self, tmp_path):
+        """Test copy keeps contents and mode."""
+        source = tmp_path / "source"
+        source.write_bytes(os.urandom(1 << 17))
+        os.chmod(source, 0o751)
+        File.copy(source, tmp_path / "target")
+        assert (tmp_path / "target").read_bytes() == source.read_bytes()
+        assert os.stat(tmp_path / "target").st_mode == os.stat(source).st_mode
+
+    def test_empty(self, tmp_path):
+        """Test empty file is copied."""
+        (tmp_path / "source").touch()
+        File.copy(tmp_path / "source", tmp_path / "target")
+        assert (tmp_path / "target").read_bytes() == b""
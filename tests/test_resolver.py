@@ -0,0 +1,133 @@
+"""Tests for module dependency resolution."""
+
+import json
+import zipfile
+
+import pytest
+
+from jst_django.exceptions import ValidationError, VersionError
+from jst_django.utils.ast_utils import add_include_urlpatterns, add_modules
+from jst_django.utils.registry import ModuleRelease
+from jst_django.utils.resolver import ModuleResolver, read_manifest
+
+
+class FakeRegistry:
+    """Registry serving archives built on disk."""
+
+    def __init__(self, root, modules):
+        self.root = root
+        self.modules = modules
+        self.fetched = []
+
+    def versions(self, name):
+        return list(self.modules[name])
+
+    def resolve(self, name, version=None):
+        version = version or next(iter(self.modules[name]))
+        if version not in self.modules[name]:
+            raise VersionError(version)
+        return ModuleRelease(name, version, f"https://example.com/{name}-{version}.zip")
+
+    def archive(self, release):
+        self.fetched.append(release.name)
+        path = self.root / f"{release.name}-{release.version}.zip"
+        with zipfile.ZipFile(path, "w") as zip_file:
+            zip_file.writestr(f"module-{release.name}-{release.version}/apps.py", "")
+            manifest = self.modules[release.name][release.version]
+            if manifest is not None:
+                zip_file.writestr(f"module-{release.name}-{release.version}/jst-module.json", json.dumps(manifest))
+        return path
+
+
+class TestModuleResolver:
+    """Test ModuleResolver class."""
+
+    def test_topological_order(self, tmp_path):
+        """Test dependencies are installed first with the newest matching version."""
+        registry = FakeRegistry(
+            tmp_path,
+            {
+                "authbot": {"1.0.0": {"dependencies": {"bot": ">=1.0,<2.0", "default": "*"}, "requirements": ["a"]}},
+                "bot": {"2.0.0": None, "1.2.0": {"dependencies": {"default": ">=1"}}, "1.1.0": None},
+                "default": {"1.0.0": None},
+            },
+        )
+        plan = ModuleResolver(registry, jobs=2).resolve({"authbot": None})
+        assert [(item.release.name, item.release.version) for item in plan] == [
+            ("default", "1.0.0"),
+            ("bot", "1.2.0"),
+            ("authbot", "1.0.0"),
+        ]
+        assert plan[-1].manifest.requirements == ["a"]
+        assert sorted(registry.fetched) == ["authbot", "bot", "default"]
+
+    def test_installed_dependency(self, tmp_path):
+        """Test an installed dependency satisfying the constraint is not fetched again."""
+        registry = FakeRegistry(
+            tmp_path,
+            {"authbot": {"1.0.0": {"dependencies": {"bot": ">=1.0,<2.0"}}}, "bot": {"2.0.0": None, "1.2.0": None}},
+        )
+        plan = ModuleResolver(registry).resolve({"authbot": None}, {"bot": "1.1.0", "default": None})
+        assert [item.release.name for item in plan] == ["authbot"]
+        assert registry.fetched == ["authbot"]
+
+    def test_installed_dependency_version(self, tmp_path):
+        """Test an installed dependency outside the constraint is reported."""
+        registry = FakeRegistry(
+            tmp_path,
+            {"authbot": {"1.0.0": {"dependencies": {"bot": ">=1.0,<2.0"}}}, "bot": {"2.0.0": None, "1.2.0": None}},
+        )
+        with pytest.raises(VersionError) as e:
+            ModuleResolver(registry).resolve({"authbot": None}, {"bot": "2.0.0"})
+        assert "bot" in e.value.message and "authbot" in e.value.details
+        assert registry.fetched == ["authbot"]
+
+    def test_conflict(self, tmp_path):
+        """Test constraint excluding the selected version."""
+        registry = FakeRegistry(
+            tmp_path,
+            {
+                "authbot": {"1.0.0": {"dependencies": {"bot": "<2", "default": "*"}}},
+                "default": {"1.0.0": {"dependencies": {"bot": ">=2"}}},
+                "bot": {"2.0.0": None, "1.0.0": None},
+            },
+        )
+        with pytest.raises(VersionError) as error:
+            ModuleResolver(registry).resolve({"authbot": None})
+        assert "authbot" in error.value.details and "default" in error.value.details
+
+    def test_pinned_root(self, tmp_path):
+        """Test pinned root version."""
+        registry = FakeRegistry(tmp_path, {"bot": {"2.0.0": None, "1.0.0": None}})
+        assert ModuleResolver(registry).resolve({"bot": "1.0.0"})[0].release.version == "1.0.0"
+
+    def test_cycle(self, tmp_path):
+        """Test modules depending on each other."""
+        registry = FakeRegistry(
+            tmp_path,
+            {"a": {"1.0.0": {"dependencies": {"b": "*"}}}, "b": {"1.0.0": {"dependencies": {"a": "*"}}}},
+        )
+        with pytest.raises(ValidationError):
+            ModuleResolver(registry).resolve({"a": None})
+
+    def test_invalid_manifest(self, tmp_path):
+        """Test invalid constraint in manifest."""
+        registry = FakeRegistry(tmp_path, {"a": {"1.0.0": {"dependencies": {"b": "not a version"}}}})
+        with pytest.raises(ValidationError):
+            read_manifest(registry.archive(registry.resolve("a")))
+
+
+class TestBatchedEdits:
+    """Test MODULES and urlpatterns edits."""
+
+    def test_add_modules(self):
+        """Test modules are appended once."""
+        code = add_modules("MODULES = ['core.apps.bot']\n", ["core.apps.default", "core.apps.bot"])
+        assert code.strip() == "MODULES = ['core.apps.bot', 'core.apps.default']"
+
+    def test_add_include_urlpatterns(self):
+        """Test includes are appended once."""
+        source = "urlpatterns = [path('api/', include('core.apps.bot.urls'))]\n"
+        code = add_include_urlpatterns(source, [("api/", "core.apps.bot.urls"), ("api/", "core.apps.default.urls")])
+        assert code.count("include(") == 2
+        assert "core.apps.default.urls" in code
@@ -0,0 +1,207 @@
+"""Tests for stub registry."""
+
+import builtins
+import json
+import os
+from contextlib import ExitStack
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from jst_django.commands.generate import Generate
+from jst_django.constants import STUB_FILES
+from jst_django.exceptions import StubNotFoundError
+from jst_django.utils.code import format_code_string
+from jst_django.utils.introspect import ModelIntrospector
+from jst_django.utils.openapi import OpenAPIParser
+from jst_django.utils.stubs import StubRegistry, parse_stub
+from jst_django.utils.sync import FIELD_VARIABLES
+from jst_django.utils.tokenize import Tokenize
+
+GOLDEN = Path(__file__).parent / "golden"
+FIELDS = {
+    "none": "",
+    "one": "name:char",
+    "all": "title:char,body:text,count:int,image:image,active:bool,day:date,at:time,created:datetime",
+    "relations": "title:char:index,author:fk(UserModel):null,tags:m2m(TagModel),@index(author,title),@unique(title)",
+    "cursor": "title:char,published_at:datetime,@cursor(-published_at)",
+    "long": ",".join(f"field_with_a_rather_long_name_{index}:datetime" for index in range(3)),
+}
+
+
+class TestStubRegistry:
+    """Test StubRegistry class."""
+
+    def test_bundle_contains_builtin_stubs(self):
+        """Test every configured stub is bundled."""
+        bundle = StubRegistry.bundle()
+        for stub in STUB_FILES.values():
+            assert stub in bundle
+        assert "django/admin.stub" in bundle
+
+    def test_user_override(self, tmp_path):
+        """Test user stub path wins over bundled stub."""
+        stub = tmp_path / "model.stub"
+        stub.write_text("class {{ class_name }}: ...\n")
+        registry = StubRegistry({**STUB_FILES, "model": str(stub)})
+        assert registry.source("model") == "class {{ class_name }}: ...\n"
+
+    def test_user_stub_origin(self, tmp_path):
+        """Test user stubs are told apart and keep plain Jinja whitespace."""
+        stub = tmp_path / "model.stub"
+        stub.write_text("{% if name %}\n    name = {{ name }}\n{% endif %}\n")
+        registry = StubRegistry({**STUB_FILES, "model": str(stub)})
+        assert not registry.bundled("model") and registry.bundled("view")
+        assert registry.templates("model")[1].render(name="post") == "\n    name = post\n\n"
+
+    def test_missing_stub(self):
+        """Test unknown stub raises on use."""
+        registry = StubRegistry({"model": "missing.stub"})
+        with pytest.raises(StubNotFoundError):
+            registry.source("model")
+
+    def test_parse_stub(self):
+        """Test header and create-only lines."""
+        source = "!!from a import B\n##import c\nbody\n"
+        assert parse_stub(source) == ("from a import B\n", "import c\nbody\n")
+        assert parse_stub(source, append=True) == ("from a import B\n", "\nbody\n")
+
+    @pytest.mark.slow
+    def test_render_without_filesystem_calls(self):
+        """Benchmark: after startup rendering a stub touches the filesystem zero times."""
+        StubRegistry.load(STUB_FILES).templates("model")
+
+        calls = []
+
+        def track(original):
+            def wrapper(*args, **kwargs):
+                calls.append(original.__name__)
+                return original(*args, **kwargs)
+
+            return wrapper
+
+        with ExitStack() as stack:
+            stack.enter_context(patch.object(builtins, "open", track(builtins.open)))
+            stack.enter_context(patch.object(os, "stat", track(os.stat)))
+            stack.enter_context(patch.object(Path, "exists", track(Path.exists)))
+            stack.enter_context(patch.object(Path, "is_file", track(Path.is_file)))
+            for _ in range(1000):
+                top, body = StubRegistry.load(STUB_FILES).templates("model")
+                body.render(class_name="PostModel", name="post", model_fields=[])
+        assert calls == []
+
+
+class TestGoldenStubs:
+    """Test built-in stubs render black/isort formatted files."""
+
+    @pytest.fixture
+    def generate(self, tmp_path, monkeypatch):
+        """Generator of blog/post with default config."""
+        monkeypatch.chdir(tmp_path)
+        generate = Generate()
+        generate.app, generate.file_name, generate.name = "blog", "post", "post"
+        return generate
+
+    @pytest.mark.parametrize("fields", sorted(FIELDS))
+    @pytest.mark.parametrize("stub", sorted(STUB_FILES.keys() - {"init"}))
+    def test_formatter_stable(self, generate, stub, fields):
+        """Test rendered new files are unchanged by isort and black."""
+        tokens = Tokenize(FIELDS[fields])
+        generate.fields = tokens.make() if FIELDS[fields] else tokens
+        content = generate.render_file(stub, stub.capitalize())
+        assert format_code_string(content) == content
+
+    @pytest.mark.parametrize("source", ["openapi", "introspect"])
+    @pytest.mark.parametrize("stub", sorted(STUB_FILES.keys() - {"init"}))
+    def test_formatter_other_sources(self, generate, tmp_path, stub, source):
+        """Test fields not parsed by Tokenize never skip the formatter."""
+        if source == "openapi":
+            spec = tmp_path / "spec.json"
+            properties = {"title": {"type": "string", "default": "it's"}, "views": {"type": "integer"}}
+            spec.write_text(json.dumps({"$defs": {"Post": {"properties": properties}}}))
+            generate.fields = list(OpenAPIParser(spec).models())[0].fields
+        else:
+            (tmp_path / "core").mkdir()
+            (tmp_path / "core" / "models.py").write_text(
+                "from django.db import models\n\n\nclass PostModel(models.Model):\n"
+                "    title = models.CharField(max_length=20, default='x')\n    views = models.IntegerField()\n"
+            )
+            generate.fields = ModelIntrospector(tmp_path).tokens("core.models", "PostModel")
+        content = generate.render_file(stub, stub.capitalize())
+        formatted = format_code_string(content)
+        assert formatted is not None
+        if source == "introspect" and stub == "model":
+            # ``ast.unparse`` writes single quotes
+            assert formatted != content
+        if len(StubRegistry.load(STUB_FILES).variables(stub) & FIELD_VARIABLES) > 0:
+            assert not generate.formatted(stub, content)
+        else:
+            assert generate.formatted(stub, content) and formatted == content
+
+    @pytest.mark.parametrize("stub", ["model", "serializer"])
+    def test_golden(self, generate, stub):
+        """Test rendered files against the golden copies."""
+        generate.fields = Tokenize(FIELDS["all"]).make()
+        assert generate.render_file(stub, stub.capitalize()) == (GOLDEN / f"{stub}.py.txt").read_text()
+
+    def test_view_queryset(self, generate):
+        """Test read actions join relations and load only the serialized columns."""
+        generate.fields = Tokenize(FIELDS["relations"]).make()
+        content = generate.render_file("view", "View")
+        assert 'queryset = queryset.select_related("author")' in content
+        assert 'queryset = queryset.prefetch_related("tags")' in content
+        only = content.split('"list": [')[1].split("]")[0]
+        assert only.split() == ['"id",', '"title",', '"author",']
+        generate.fields = Tokenize(FIELDS["one"]).make()
+        assert "related" not in generate.render_file("view", "View")
+
+    def test_list_columns(self, generate):
+        """Test list leaves large columns to retrieve, in the view and in the serializer."""
+        generate.fields = Tokenize("title:char,body:text,extra:json").make()
+        view = generate.render_file("view", "View")
+        columns = view.split('"list": [')[1].split('"retrieve": [')
+        assert columns[0].split() == ['"id",', '"title",', "],"]
+        assert columns[1].split("]")[0].split() == ['"id",', '"title",', '"body",', '"extra",']
+        serializer = generate.render_file("serializer", "Serializer")
+        assert serializer.split("class ListPostSerializer")[1].split("class Retrieve")[0].count('"body"') == 0
+
+    def test_cursor_pagination(self, generate):
+        """Test @cursor emits the pagination class, its index and its test."""
+        generate.fields = Tokenize(FIELDS["cursor"]).make()
+        view = generate.render_file("view", "View")
+        assert 'ordering = ["-published_at", "-id"]' in view
+        assert "pagination_class = PostCursorPagination" in view
+        model = generate.render_file("model", "Model")
+        assert 'models.Index(fields=["-published_at", "-id"], name="post_published_at_id_idx")' in model
+        test = generate.render_file("test", "Test")
+        assert "from core.apps.blog.views import PostCursorPagination" in test
+        assert "def test_cursor_pagination(instance):" in test
+
+    def test_cursor_pagination_config(self, generate):
+        """Test pagination of jst.json, primary key ordering needs no index."""
+        generate.pagination = {**generate.pagination, "style": "cursor", "ordering": "-created_at"}
+        generate.fields = Tokenize(FIELDS["one"]).make()
+        view = generate.render_file("view", "View")
+        assert 'ordering = ["-created_at", "-id"]' in view
+        # The cursor is read from the ordering columns
+        assert '"created_at",' in view.split('"list": [')[1].split("]")[0]
+        generate.pagination["ordering"] = "-id"
+        assert 'ordering = ["-id"]' in generate.render_file("view", "View")
+        assert "indexes" not in generate.render_file("model", "Model")
+        generate.pagination["style"] = "page"
+        assert "CursorPagination" not in generate.render_file("view", "View")
+
+    def test_formatter_only_for_merged_files(self, generate, tmp_path):
+        """Test new files skip black and isort, appended files go through them."""
+        app = tmp_path / "core" / "apps" / "blog"
+        app.mkdir(parents=True)
+        (app / "apps.py").write_text("")
+        (app / "urls.py").write_text("from django.urls import path\n\nurlpatterns = []\n")
+        generate.paths = replace(generate.paths, apps="core/apps/")
+        generate.fields = Tokenize(FIELDS["one"]).make()
+        with patch("jst_django.commands.generate.Code.format_code") as format_code:
+            generate.generate_in_app("blog", ["post", "tag"], ["model", "filter"])
+        formatted = sorted(Path(call.args[0]).as_posix() for call in format_code.call_args_list)
+        assert formatted == ["core/apps/blog/filters/post.py", "core/apps/blog/models/post.py"]
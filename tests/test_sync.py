@@ -0,0 +1,164 @@
+"""Tests for jst sync."""
+
+import json
+import time
+
+import pytest
+
+from jst_django.commands.generate import Generate
+from jst_django.commands.sync import Sync
+from jst_django.utils.code import format_code_string
+from jst_django.utils.sync import fields_hash, replace_region, wrap_region
+from jst_django.utils.tokenize import Tokenize
+
+URLS = """from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+router = DefaultRouter()
+
+urlpatterns = [path("", include(router.urls))]
+"""
+
+# Stub written for plain Jinja, its output is not black formatted
+USER_FILTER = """!!from {{ model_import_path }} import {{ name_cap }}Model
+##from django_filters import rest_framework as filters
+
+class {{ class_name }}(filters.FilterSet):
+    class Meta:
+        model = {{ name_cap }}Model
+        fields = [{% for field in fields %}'{{ field }}', {% endfor %}]
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project with post and tag generated into one app."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "jst.json").write_text(json.dumps({"dirs": {"apps": "./core/apps/"}, "import_path": "core.apps."}))
+    app = tmp_path / "core" / "apps" / "blog"
+    app.mkdir(parents=True)
+    (app / "apps.py").write_text("")
+    (app / "urls.py").write_text(URLS)
+    generate = Generate()
+    generate.fields = Tokenize("title:char,body:text").make()
+    generate.file_name = "post"
+    generate.generate_in_app("blog", ["post", "tag"], ["model", "serializer", "filter", "admin"])
+    return tmp_path
+
+
+def add_field(project, name="views = models.IntegerField()"):
+    """Add a field to PostModel by hand."""
+    path = project / "core" / "apps" / "blog" / "models" / "post.py"
+    source = path.read_text()
+    marker = "class PostModel(AbstractBaseModel):\n"
+    path.write_text(source.replace(marker, f"{marker}    {name}\n"))
+
+
+class TestSync:
+    """Test Sync class."""
+
+    def test_graph(self, project):
+        """Test field dependent artifacts are recorded, others are not."""
+        graph = json.loads((project / ".jst" / "sync.json").read_text())["models"]
+        assert sorted(graph) == ["blog.PostModel", "blog.TagModel"]
+        assert sorted(graph["blog.PostModel"]["artifacts"]) == ["filter", "serializer"]
+        assert Sync().run() == {}
+
+    def test_only_changed_regions(self, project):
+        """Test only artifacts of the changed model are rewritten, edits outside regions are kept."""
+        filters = project / "core" / "apps" / "blog" / "filters" / "post.py"
+        filters.write_text(filters.read_text() + "\n\nclass CustomFilter:\n    pass\n")
+        tag = project / "core" / "apps" / "blog" / "serializers" / "post" / "tag.py"
+        tag_before = tag.read_text()
+        add_field(project)
+        assert Sync().run(check=True) == {
+            ("blog.PostModel", "filter"): "stale",
+            ("blog.PostModel", "serializer"): "stale",
+        }
+        statuses = Sync().run()
+        assert set(statuses.values()) == {"updated"}
+        content = filters.read_text()
+        assert content.count('"views"') == 1 and "class CustomFilter" in content
+        # Tag region in the same file is untouched
+        assert content.split("# jst:begin filter tag")[1].count('"views"') == 0
+        assert '"views"' in (project / "core" / "apps" / "blog" / "serializers" / "post" / "post.py").read_text()
+        assert tag.read_text() == tag_before
+        assert Sync().run() == {}
+
+    def test_missing_region(self, project):
+        """Test artifacts whose markers were removed are reported."""
+        path = project / "core" / "apps" / "blog" / "serializers" / "post" / "post.py"
+        path.write_text(path.read_text().replace("# jst:begin serializer post\n", ""))
+        add_field(project)
+        statuses = Sync().run()
+        assert statuses[("blog.PostModel", "serializer")] == "no-region"
+        assert statuses[("blog.PostModel", "filter")] == "updated"
+
+    def test_cursor_kept(self, project):
+        """Test pagination declared with @cursor survives regenerating the view."""
+        generate = Generate()
+        generate.fields = Tokenize("title:char,body:text,@cursor(-title)").make()
+        generate.file_name = "post"
+        generate.generate_in_app("blog", ["post"], ["view"])
+        add_field(project)
+        assert Sync().run()[("blog.PostModel", "view")] == "updated"
+        view = (project / "core" / "apps" / "blog" / "views" / "post.py").read_text()
+        assert '"views",' in view and 'ordering = ["-title", "-id"]' in view
+
+    def test_user_stub_formatted(self, tmp_path, monkeypatch):
+        """Test output of user stubs is formatted by make and by sync."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "filter.stub").write_text(USER_FILTER)
+        config = {"dirs": {"apps": "./core/apps/"}, "import_path": "core.apps.", "stubs": {"filter": "filter.stub"}}
+        (tmp_path / "jst.json").write_text(json.dumps(config))
+        app = tmp_path / "core" / "apps" / "blog"
+        app.mkdir(parents=True)
+        (app / "apps.py").write_text("")
+        (app / "urls.py").write_text(URLS)
+        generate = Generate()
+        generate.fields = Tokenize("title:char").make()
+        generate.file_name = "post"
+        generate.generate_in_app("blog", ["post"], ["model", "filter"])
+        filters = app / "filters" / "post.py"
+        assert 'fields = [\n            "title",\n        ]' in filters.read_text()
+        add_field(tmp_path)
+        assert Sync().run() == {("blog.PostModel", "filter"): "updated"}
+        content = filters.read_text()
+        assert "'" not in content and format_code_string(content) == content
+        assert '"views",' in content
+
+    @pytest.mark.slow
+    def test_large_project(self, project):
+        """Benchmark: one changed model among many syncs well under a second."""
+        graph_path = project / ".jst" / "sync.json"
+        graph = json.loads(graph_path.read_text())
+        node = graph["models"]["blog.TagModel"]
+        for index in range(500):
+            graph["models"][f"blog.TagModel{index}"] = node
+        graph_path.write_text(json.dumps(graph))
+        Sync().run()
+        add_field(project)
+        started = time.perf_counter()
+        statuses = Sync().run()
+        elapsed = time.perf_counter() - started
+        assert len(statuses) == 2
+        assert elapsed < 1.0, elapsed
+
+
+class TestRegions:
+    """Test region helpers."""
+
+    def test_wrap_and_replace(self):
+        """Test imports stay outside of the region."""
+        body = wrap_region("filter", "post", "\nfrom a import b\n\nclass A:\n    x = 1\n")
+        assert body == "\nfrom a import b\n\n# jst:begin filter post\nclass A:\n    x = 1\n\n\n# jst:end filter post\n"
+        source = "import os\n" + body + "\nclass Custom: ...\n"
+        replaced = replace_region(source, "filter", "post", "class A:\n    x = 2\n")
+        assert "x = 2" in replaced and "x = 1" not in replaced and replaced.endswith("class Custom: ...\n")
+        assert replace_region(source, "filter", "tag", "") is None
+
+    def test_fields_hash(self):
+        """Test quoting and formatting do not change the hash."""
+        assert fields_hash({"a": 'models.CharField(max_length=1, verbose_name=_("a"))'}) == fields_hash(
+            {"a": "models.CharField(\n    max_length=1, verbose_name=_('a')\n)"}
+        )
@@ -0,0 +1,37 @@
+"""Tests for run statistics."""
+
+import json
+
+from jst_django.utils.telemetry import RunStats
+
+
+class TestRunStats:
+    """Test RunStats class."""
+
+    def test_counters(self):
+        """Test counters and derived values."""
+        stats = RunStats(total=10, command="translate")
+        stats.add(done=2, cache_hits=1, cache_misses=3)
+        assert stats.done == 2
+        assert stats.cache_ratio == 0.25
+
+    def test_request_tracking(self):
+        """Test in flight counter and latency percentiles."""
+        stats = RunStats()
+        assert stats.percentile(50) is None
+        with stats.request():
+            assert stats.in_flight == 1
+        assert stats.in_flight == 0
+        assert stats.requests == 1
+        assert stats.percentile(95) >= 0
+
+    def test_write_report(self, tmp_path):
+        """Test JSON run report."""
+        stats = RunStats(total=3, command="translate")
+        stats.add(done=3, translated=3)
+        stats.finish()
+        path = stats.write_report(tmp_path / "reports" / "run.json")
+        report = json.loads(path.read_text())
+        assert report["run_id"] == stats.run_id
+        assert report["command"] == "translate"
+        assert report["translated"] == 3
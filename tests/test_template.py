@@ -0,0 +1,44 @@
+"""Tests for template cache."""
+
+import io
+import tarfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jst_django.utils.template import TemplateCache
+
+
+def archive(files):
+    """Build a GitHub style archive with a single top directory."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(f"django-V1/{name}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class TestTemplateCache:
+    """Test TemplateCache class."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Isolate user cache."""
+        monkeypatch.setenv("JST_CACHE_DIR", str(tmp_path))
+
+    def test_fetched_once(self):
+        """Test archive is downloaded once and extracted without top directory."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [archive({"cookiecutter.json": "{}"})]
+        cache = TemplateCache("https://github.com/JscorpTech/django")
+        with patch("jst_django.utils.template.requests.get", return_value=response) as get:
+            path = cache.get("V1")
+            assert cache.get("V1") == path
+        assert get.call_count == 1
+        assert get.call_args[0][0] == "https://github.com/JscorpTech/django/archive/V1.tar.gz"
+        assert (path / "cookiecutter.json").read_text() == "{}"
+        assert TemplateCache().get("V1") == path
@@ -0,0 +1,100 @@
+"""Tests for the --fields grammar."""
+
+import pytest
+
+from jst_django.exceptions import ValidationError
+from jst_django.utils.tokenize import IndexSpec, Tokenize
+
+
+class TestTokenize:
+    """Test Tokenize class."""
+
+    def test_scalar_fields(self):
+        """Test types, arguments and options."""
+        tokens = Tokenize("title:char(100):unique, price:decimal(12,4):default=0,active:bool:default=true").make()
+        assert tokens.items == {
+            "title": 'models.CharField(verbose_name=_("title"), max_length=100, unique=True)',
+            "price": 'models.DecimalField(verbose_name=_("price"), max_digits=12, decimal_places=4, default=0)',
+            "active": 'models.BooleanField(verbose_name=_("active"), default=True)',
+        }
+
+    def test_backwards_compatible(self):
+        """Test the old ``name:type`` declarations render as before."""
+        tokens = Tokenize("name:str,image:image").make()
+        assert tokens.model == [
+            'name = models.CharField(verbose_name=_("name"), max_length=255)',
+            'image = models.ImageField(verbose_name=_("image"), upload_to="images")',
+        ]
+
+    def test_relations(self):
+        """Test relation targets and on_delete."""
+        tokens = Tokenize("author:fk(UserModel):null:index,tags:m2m(blog.TagModel):null,profile:o2o(Profile)").make()
+        assert tokens.items["author"] == (
+            'models.ForeignKey("UserModel", verbose_name=_("author"), on_delete=models.SET_NULL, '
+            "null=True, blank=True, db_index=True)"
+        )
+        assert tokens.items["tags"] == 'models.ManyToManyField("blog.TagModel", verbose_name=_("tags"), blank=True)'
+        assert "on_delete=models.CASCADE" in tokens.items["profile"]
+        assert [spec.name for spec in tokens.specs.values() if spec.relation] == ["author", "tags", "profile"]
+        assert tokens.specs["tags"].target == "blog.TagModel"
+
+    def test_relations_of_read_fields(self):
+        """Test relations are found in expressions read from source or OpenAPI."""
+        tokens = Tokenize("")
+        tokens.properties.update(
+            {
+                "category": "models.ForeignKey('CategoryModel', on_delete=models.CASCADE)",
+                "labels": "ManyToManyField(LabelModel)",
+                "title": "models.CharField(max_length=255)",
+            }
+        )
+        assert tokens.relations == {"category": "fk", "labels": "m2m"}
+
+    def test_meta(self):
+        """Test composite indexes and unique constraints."""
+        tokens = Tokenize("title:char,slug:slug,@index(title,slug),@unique(slug,title)").make()
+        assert tokens.indexes("post") == ['models.Index(fields=["title", "slug"], name="post_title_slug_idx")']
+        assert tokens.constraints("post") == [
+            'models.UniqueConstraint(fields=["slug", "title"], name="post_slug_title_uniq")'
+        ]
+
+    def test_cursor(self):
+        """Test cursor pagination ordering."""
+        assert Tokenize("title:char,published:datetime,@cursor(-published)").make().cursor == "-published"
+        assert Tokenize("title:char,@cursor(id)").make().cursor == "id"
+        assert Tokenize("title:char,@cursor(-pk)").make().cursor == "-pk"
+        assert Tokenize("title:char").make().cursor is None
+
+    def test_index_name_length(self):
+        """Test long index names are shortened to Django's limit."""
+        name = IndexSpec(("created_at", "updated_at", "published_at")).name("blog_article")
+        assert len(name) == 30 and name.endswith("_idx")
+        assert name == IndexSpec(("created_at", "updated_at", "published_at")).name("blog_article")
+
+    def test_empty(self):
+        """Test no fields."""
+        assert Tokenize("").make().items == {}
+
+    @pytest.mark.parametrize(
+        "code, reason, column",
+        [
+            ("title:chr", "noma'lum tur 'chr'", 6),
+            ("title:char,body", "'body' uchun tur kerak", 15),
+            ("title:char:uniqe", "noma'lum parametr 'uniqe'", 11),
+            ("author:fk", "fk uchun model kerak", 7),
+            ("price:decimal(10)", "'decimal' argumentlari noto'g'ri", 6),
+            ("class:char", "'class' maydon nomi bo'la olmaydi", 0),
+            ("title:char,title:text", "'title' maydoni takrorlangan", 11),
+            ("title:char,@index(title,slug)", "'slug' maydoni topilmadi", 24),
+            ("title:char(10", "')' yopilmagan", 13),
+            ("title:char,@cursor(-slug)", "'slug' maydoni topilmadi", 20),
+            ("title:char,@cursor(title,id)", "@cursor bitta maydon oladi", 11),
+            ("tags:m2m(Tag),@cursor(tags)", "'tags' m2m maydon", 22),
+        ],
+    )
+    def test_errors(self, code, reason, column):
+        """Test invalid declarations point at the wrong part instead of falling back to CharField."""
+        with pytest.raises(ValidationError) as error:
+            Tokenize(code).make()
+        assert reason in error.value.message
+        assert error.value.details == f"\n{code}\n{' ' * column}^"
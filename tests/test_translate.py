@@ -0,0 +1,47 @@
+"""Tests for the translate command."""
+
+import sys
+
+import pytest
+
+from jst_django.backends import MemoryBackend
+from jst_django.commands.translate import Translate
+from jst_django.utils.po import POCatalog
+from jst_django.utils.progress import ProgressRenderer
+from jst_django.utils.telemetry import RunStats
+
+HEADER = 'msgid ""\nmsgstr ""\n"Language: uz\\n"\n\n'
+
+
+class TestTranslate:
+    """Test Translate class."""
+
+    @pytest.fixture
+    def translate(self, tmp_path, monkeypatch):
+        """Translate command in an empty project."""
+        monkeypatch.chdir(tmp_path)
+        return Translate()
+
+    def test_window_bounded_by_obsolete_entries(self, translate, tmp_path, monkeypatch):
+        """Test obsolete entries count toward the window, pending entries stay bounded."""
+        # ``jst_django.commands.translate`` is shadowed by the command function
+        monkeypatch.setattr(sys.modules[Translate.__module__], "WINDOW_ENTRIES", 10)
+        obsolete = "".join(f'#~ msgid "Old {index}"\n#~ msgstr ""\n\n' for index in range(500))
+        path = tmp_path / "django.po"
+        path.write_text(HEADER + 'msgid "Sarlavha"\nmsgstr ""\n\n' + obsolete + 'msgid "Matn"\nmsgstr ""\n')
+        held = []
+        commit = POCatalog.commit
+
+        def track(catalog):
+            held.append(len(catalog._pending))
+            commit(catalog)
+
+        monkeypatch.setattr(POCatalog, "commit", track)
+        backend = MemoryBackend({"glossary": None})
+        backend.translate = lambda texts, source, target: [text.upper() for text in texts]
+        stats = RunStats(2)
+        translate.translate_catalog(str(path), "uzn_Latn", "eng_Latn", backend, stats, ProgressRenderer(stats))
+        assert max(held) <= 20
+        content = path.read_text()
+        assert 'msgstr "SARLAVHA"' in content and 'msgstr "MATN"' in content
+        assert content.count("#~ msgid") == 500
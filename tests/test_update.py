@@ -0,0 +1,124 @@
+"""Tests for update command."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from jst_django.commands.update import ProjectUpdater
+from jst_django.exceptions import ConfigurationError
+from jst_django.utils.merge import merge3
+from jst_django.utils.render import NativeRenderer
+
+SETTINGS = "".join(f"SETTING_{index} = {index}\n" for index in range(20))
+
+
+def write_template(root, files):
+    """Template with a project directory named after the slug."""
+    project = root / "{{cookiecutter.project_slug}}"
+    for name, content in files.items():
+        (project / name).parent.mkdir(parents=True, exist_ok=True)
+        (project / name).write_text(content)
+    (root / "cookiecutter.json").write_text(json.dumps({"project_slug": "demo", "app": "core"}))
+    return root
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project rendered from template V1, with V2 next to it."""
+    old = write_template(
+        tmp_path / "V1",
+        {
+            "settings.py": SETTINGS,
+            "README.md": "# {{ cookiecutter.project_slug }}\n",
+            "old.txt": "old\n",
+            "{{cookiecutter.app}}/apps.py": "name = '{{ cookiecutter.app }}'\n",
+            "same.txt": "same\n",
+        },
+    )
+    write_template(
+        tmp_path / "V2",
+        {
+            "settings.py": SETTINGS.replace("SETTING_19 = 19", "SETTING_19 = 190"),
+            "README.md": "# {{ cookiecutter.project_slug }} project\n",
+            "new.txt": "{{ cookiecutter.app }}\n",
+            "{{cookiecutter.app}}/apps.py": "name = 'apps.{{ cookiecutter.app }}'\n",
+            "same.txt": "same\n",
+        },
+    )
+    context = {"project_slug": "shop", "app": "orders"}
+    path = Path(NativeRenderer(old, jobs=1).render(context, tmp_path / "out"))
+    cruft = {
+        "template": "https://github.com/JscorpTech/django",
+        "commit": "a" * 40,
+        "context": {"cookiecutter": context},
+    }
+    (path / ".cruft.json").write_text(json.dumps(cruft))
+    return path
+
+
+def run(project):
+    """Update project to V2 with templates served from disk."""
+    updater = ProjectUpdater("V2", root=project, jobs=1)
+    refs = {"a" * 40: project.parent.parent / "V1", "V2": project.parent.parent / "V2"}
+    with (
+        patch.object(updater.github, "releases", return_value=True),
+        patch.object(updater.github, "get_commit_id", return_value="b" * 40),
+        patch("jst_django.commands.update.TemplateCache.get", side_effect=refs.get),
+    ):
+        updater.run()
+
+
+class TestProjectUpdater:
+    """Test ProjectUpdater class."""
+
+    def test_merge(self, project):
+        """Test template changes are merged and other files are left alone."""
+        (project / "settings.py").write_text(SETTINGS.replace("SETTING_0 = 0", "SETTING_0 = 'local'"))
+        (project / "same.txt").write_text("edited\n")
+        run(project)
+        settings = (project / "settings.py").read_text()
+        assert "SETTING_0 = 'local'" in settings and "SETTING_19 = 190" in settings
+        assert (project / "README.md").read_text() == "# shop project\n"
+        assert (project / "orders" / "apps.py").read_text() == "name = 'apps.orders'\n"
+        assert (project / "new.txt").read_text() == "orders\n"
+        assert not (project / "old.txt").exists()
+        assert (project / "same.txt").read_text() == "edited\n"
+        assert json.loads((project / ".cruft.json").read_text())["commit"] == "b" * 40
+
+    def test_conflict(self, project):
+        """Test overlapping changes get conflict markers and edited removed files are kept."""
+        (project / "README.md").write_text("# my shop\n")
+        (project / "old.txt").write_text("mine\n")
+        run(project)
+        readme = (project / "README.md").read_text()
+        assert "<<<<<<< loyiha" in readme and "# my shop" in readme and "# shop project" in readme
+        assert (project / "old.txt").read_text() == "mine\n"
+
+    def test_deleted_file_skipped(self, project):
+        """Test files deleted from the project are not brought back."""
+        (project / "README.md").unlink()
+        run(project)
+        assert not (project / "README.md").exists()
+
+    def test_missing_cruft(self, tmp_path):
+        """Test project without .cruft.json."""
+        with pytest.raises(ConfigurationError):
+            ProjectUpdater(root=tmp_path).load_cruft()
+
+
+class TestMerge3:
+    """Test merge3 function."""
+
+    def test_one_side(self):
+        """Test change of one side is taken without git."""
+        assert merge3(b"a\n", b"a\n", b"b\n", ("o", "b", "t")) == (b"b\n", False)
+        assert merge3(b"b\n", b"a\n", b"a\n", ("o", "b", "t")) == (b"b\n", False)
+
+    def test_without_git(self):
+        """Test whole file conflict when git is missing."""
+        with patch("jst_django.utils.merge.shutil.which", return_value=None):
+            merged, conflicted = merge3(b"x", b"a\n", b"y\n", ("o", "b", "t"))
+        assert conflicted
+        assert merged == b"<<<<<<< o\nx\n=======\ny\n>>>>>>> t\n"